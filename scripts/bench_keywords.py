@@ -0,0 +1,145 @@
+"""
+Benchmark: per-pattern `re.search` filters vs. the single-pass KeywordMatcher.
+Two corpora, no network required:
+
+- recorded:  the headlines/summaries in debug_output.txt (a UTF-16 dump of a real
+             NewsSet; only a handful), repeated to a realistic backlog.
+- generated: ARTICLES distinct headline + summary pairs built from newswire-style
+             templates (seeded), with keyword and banned-phrase rates close to a
+             day of the Alpaca news feed.
+
+- Legacy:  lowercase the text, then one `re.search` per ALLOWED / BANNED pattern
+           (the original NewsEngine._is_material / _is_banned).
+- Matcher: KeywordMatcher per list (substring needle check, then a compiled
+           word-boundary regex only for keywords whose needle is present).
+
+    python scripts/bench_keywords.py [path/to/debug_output.txt]
+"""
+import ast
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+from alpaca_trader.core.keywords import KeywordMatcher
+from alpaca_trader.core.news import NewsEngine
+
+ARTICLES = 20_000
+ROUNDS = 5
+
+# 'headline': 'part one ' "part two", -- pprint splits long strings over several lines
+FIELD = re.compile(r"""'(headline|summary)':\s*((?:(?:'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")\s*)+)""")
+
+def load_texts(path: Path) -> list:
+    """headline + summary per recorded article."""
+    raw = path.read_bytes().decode("utf-16")
+    texts, headline = [], None
+    for field, literal in FIELD.findall(raw):
+        value = ast.literal_eval(f"({literal})")
+        if field == "headline":
+            headline = value
+        elif headline is not None:
+            texts.append(f"{headline} {value}")
+            headline = None
+    return texts
+
+TICKERS = ["AAPL", "TSLA", "NVDA", "AMD", "PLTR", "SOFI", "RIVN", "MRNA", "BA", "INTC", "F", "NIO",
+           "LCID", "CRWD", "SNOW", "SHOP", "COIN", "HOOD", "UPST", "DKNG", "ABNB", "ROKU", "SQ", "PYPL"]
+SUBJECTS = ["{t} Shares", "{t}", "Shares of {t}", "{t} Stock", "{t} Inc.", "{t} Corp."]
+EVENTS = [
+    "Q{q} Earnings Beat Estimates, Revenue Up {n}%",
+    "Misses Q{q} EPS Expectations By ${c}",
+    "Raises Full-Year Guidance After Strong Quarter",
+    "Announces ${n}M Acquisition Of Software Startup",
+    "Agrees To Merger With Regional Rival In All-Stock Deal",
+    "Receives FDA Approval For Lead Candidate",
+    "Reports Positive Phase {q} Trial Results",
+    "Awarded ${n}M Defense Contract",
+    "Signs Multi-Year Partnership Agreement With Cloud Provider",
+    "Director Buys {n},000 Shares, Form 4 Shows",
+    "Trading Higher On Heavy Volume",
+    "Falls {n}% In Premarket Session",
+    "Hits New 52-Week High",
+    "CEO To Speak At Industry Conference Next Week",
+    "Announces Quarterly Dividend Of ${c} Per Share",
+    "Files To Offer {n}M Shares Of Common Stock",
+    "Names New Chief Financial Officer",
+    "Sees Unusually Large Options Activity",
+    "Launches New Product Line In Europe",
+    "Completes Previously Announced Debt Refinancing",
+]
+BANNED_EVENTS = [
+    "Top 10 Stocks To Watch This Week",
+    "Why {t} Is Moving Lower Today",
+    "Analyst Upgrade: Price Target Raised To ${n}",
+    "Downgraded To Neutral On Valuation",
+    "Opinion: The Bull Case Is Getting Harder To Make",
+    "Technical Analysis: Support Levels In Focus",
+]
+FILLER = ("the company said in a statement that it expects results to remain in line with prior "
+          "commentary while management continues to focus on execution across its core markets and "
+          "shares moved in early trading as investors weighed the news against the broader market "
+          "backdrop including interest rates inflation data and sector rotation").split()
+
+def generate_texts(n: int, seed: int = 7) -> list:
+    """`n` distinct headline + summary pairs; ~1 in 8 hits a banned phrase."""
+    rng = random.Random(seed)
+    texts = []
+    for i in range(n):
+        ticker = rng.choice(TICKERS)
+        events = BANNED_EVENTS if rng.random() < 0.125 else EVENTS
+        event = rng.choice(events).format(t=ticker, q=rng.randint(1, 4), n=rng.randint(2, 900),
+                                          c=f"{rng.random():.2f}")
+        headline = f"{rng.choice(SUBJECTS).format(t=ticker)} {event}"
+        start = rng.randrange(len(FILLER) - 30)
+        summary = " ".join(FILLER[start:start + rng.randint(15, 30)])
+        texts.append(f"{headline} {summary} (#{i})")
+    return texts
+
+def legacy(text: str) -> tuple:
+    text = text.lower()
+    banned = any(re.search(p, text) for p in NewsEngine.BANNED_KEYWORDS)
+    material = any(re.search(p, text) for p in NewsEngine.ALLOWED_KEYWORDS)
+    return banned, material
+
+def bench(label: str, texts: list, matcher) -> None:
+    results = {}
+    for name, fn in (("legacy", legacy), ("matcher", matcher)):
+        best = float("inf")
+        for _ in range(ROUNDS):
+            t0 = time.perf_counter()
+            for text in texts:
+                fn(text)
+            best = min(best, time.perf_counter() - t0)
+        results[name] = best
+        print(f"  {name:8} {best * 1000:8.1f} ms  {len(texts) / best:12,.0f} articles/s")
+    print(f"  speedup  {results['legacy'] / results['matcher']:.1f}x ({label})")
+
+def main():
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).resolve().parents[1] / "debug_output.txt"
+    recorded = load_texts(path)
+    if not recorded:
+        sys.exit(f"No headlines found in {path}")
+
+    allowed = KeywordMatcher(NewsEngine.ALLOWED_KEYWORDS)
+    banned = KeywordMatcher(NewsEngine.BANNED_KEYWORDS)
+    def matcher(text: str) -> tuple:
+        return banned.search(text), allowed.search(text)
+
+    for text in recorded:
+        print(f"  {text[:70]!r:74} banned={banned.matches(text)} material={allowed.matches(text)}")
+
+    generated = generate_texts(ARTICLES)
+    verdicts = [matcher(text) for text in generated]
+    differ = sum(v != legacy(text) for v, text in zip(verdicts, generated))
+    print(f"generated: {sum(b for b, _ in verdicts) / len(generated):.0%} banned, "
+          f"{sum(m for _, m in verdicts) / len(generated):.0%} material, {differ} verdicts differ from legacy")
+
+    print(f"recorded ({len(recorded)} headlines x {ARTICLES // len(recorded)})")
+    bench("recorded", (recorded * (ARTICLES // len(recorded) + 1))[:ARTICLES], matcher)
+    print(f"generated ({ARTICLES:,} distinct headlines)")
+    bench("generated", generated, matcher)
+
+if __name__ == "__main__":
+    main()
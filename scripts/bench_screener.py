@@ -0,0 +1,102 @@
+"""
+Benchmark: per-symbol screening loop vs. the columnar SnapshotFrame stage.
+Runs on a synthetic 12k-symbol universe, no network required.
+
+Both paths start from the same raw snapshot JSON the API returns:
+- Legacy:   alpaca-py parses every symbol into `Snapshot` models, then the
+            original loop filters them and builds `Asset`s.
+- Columnar: `SnapshotFrame.from_raw` unpacks only the filtered fields into
+            NumPy columns, masks them, and builds `Asset`s for survivors.
+
+    python scripts/bench_screener.py
+"""
+import random
+import time
+from decimal import Decimal
+
+import numpy as np
+from alpaca.data.historical.utils import parse_obj_as_symbol_dict
+from alpaca.data.models import Snapshot
+
+from alpaca_trader.core.snapshot_frame import SnapshotFrame
+from alpaca_trader.models.asset import Asset
+
+UNIVERSE_SIZE = 12_000
+ROUNDS = 10
+TS = "2025-12-12T20:59:59.9Z"
+
+def _bar(price: float, volume: int) -> dict:
+    return {"t": TS, "o": price, "h": price * 1.02, "l": price * 0.98, "c": price,
+            "v": volume, "n": volume // 100, "vw": price}
+
+def build_universe(n: int = UNIVERSE_SIZE, seed: int = 7) -> dict:
+    """Raw snapshot payloads with a realistic spread of prices and volumes."""
+    rng = random.Random(seed)
+    snapshots = {}
+    for i in range(n):
+        price = round(rng.lognormvariate(3.0, 1.2), 2)
+        volume = int(rng.lognormvariate(11.5, 1.8))
+        raw = {
+            "latestQuote": {"t": TS, "ax": "V", "ap": price + 0.01, "as": 1, "bx": "V",
+                            "bp": price - 0.01, "bs": 1, "c": ["R"], "z": "C"},
+            "minuteBar": _bar(price, volume // 390),
+            "dailyBar": _bar(price, volume),
+            "prevDailyBar": _bar(price, volume),
+        }
+        # ~3% of the universe has no trade today
+        if rng.random() > 0.03:
+            raw["latestTrade"] = {"t": TS, "x": "V", "p": price, "s": 100, "c": ["@"], "i": i, "z": "C"}
+        snapshots[f"SYM{i:05d}"] = raw
+    return snapshots
+
+def legacy_screen(raw: dict) -> list:
+    """alpaca-py model parsing + the original per-symbol loop from MarketScreener.run_screen."""
+    snapshots = parse_obj_as_symbol_dict(Snapshot, raw)
+    candidates = []
+    for symbol, snapshot in snapshots.items():
+        if not snapshot.latest_trade:
+            continue
+        price = snapshot.latest_trade.price
+        if not snapshot.daily_bar:
+            continue
+        volume = snapshot.daily_bar.volume
+        if 2.0 <= price <= 20.0 and volume > 100_000:
+            candidates.append(Asset(
+                symbol=symbol,
+                exchange="Unknown",
+                price=Decimal(str(price)),
+                volume=int(volume)
+            ))
+    return candidates
+
+def columnar_screen(raw: dict) -> list:
+    frame = SnapshotFrame.from_raw(raw)
+    price = frame["price"]
+    mask = (price >= 2.0) & (price <= 20.0) & (frame["volume"] > 100_000)
+    return frame.to_assets(mask)
+
+def bench(fn, raw) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        fn(raw)
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings)) * 1000
+
+def main():
+    raw = build_universe()
+    legacy = legacy_screen(raw)
+    columnar = columnar_screen(raw)
+    assert [a.symbol for a in legacy] == [a.symbol for a in columnar], "Result mismatch"
+    assert [a.price for a in legacy] == [a.price for a in columnar], "Price mismatch"
+
+    legacy_ms = bench(legacy_screen, raw)
+    columnar_ms = bench(columnar_screen, raw)
+
+    print(f"Universe: {len(raw)} symbols, survivors: {len(columnar)}")
+    print(f"Legacy (parse + loop): {legacy_ms:8.2f} ms (median of {ROUNDS})")
+    print(f"Columnar (raw + mask): {columnar_ms:8.2f} ms (median of {ROUNDS})")
+    print(f"Speedup:               {legacy_ms / columnar_ms:8.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Parity report + latency benchmark: LexiconSentiment vs. TextBlob (reference).
+
+Corpus: the headlines recorded in debug_output.txt, a set of hand-written
+financial headlines, and randomly generated sentences that mix lexicon words
+with negations, adverbs, contractions and punctuation. No network required.
+
+    python scripts/bench_sentiment.py
+"""
+import random
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from bench_keywords import load_texts
+
+from alpaca_trader.core.sentiment import LexiconSentiment, TextBlobSentiment, load_lexicon
+
+THRESHOLD = 0.2 # NewsEngine's minimum polarity
+FUZZ = 3_000
+
+HEADLINES = [
+    "Amazing Earnings Beat expectations Profits up 100%",
+    "Disastrous Crash, Bankruptcy filed Everything is lost",
+    "FDA grants accelerated approval; shares soar!",
+    "Company reports strong quarter but guidance is not great",
+    "Merger talks collapse after disappointing due diligence",
+    "Record revenue as demand remains incredibly strong",
+    "Biotech's Phase 3 trial fails to meet primary endpoint",
+    "Analysts say the deal is really not good for shareholders",
+    "Insider buys $2M of stock in a surprisingly bold move",
+    "Awarded $500M defense contract, the largest in company history",
+    "Weak outlook overshadows an otherwise solid report",
+    "Shares slide as CEO resigns amid accounting probe",
+    "Partnership with Nvidia is a huge win (!)",
+    "It isn't a bad result, but it's hardly a great one.",
+    "Never been better: margins expand to all-time high",
+]
+
+FILLERS = ["the", "a", "company", "shares", "quarter", "stock", "results", "is", "was", "and",
+           "but", "it", "this", "deal", "after", "as", "of", "to", "in", "analysts"]
+NEGATORS = ["not", "no", "never", "isn't", "wasn't", "doesn't"]
+PUNCT = ["", "", "", "!", ".", ",", "?", ";", "...", " !", ")", "("]
+
+def fuzz_corpus(n: int, seed: int = 11) -> list:
+    rng = random.Random(seed)
+    words = list(load_lexicon())
+    adverbs = [w for w, entry in load_lexicon().items() if entry[3]]
+    corpus = []
+    for _ in range(n):
+        parts = []
+        for _ in range(rng.randint(4, 18)):
+            pick = rng.random()
+            if pick < 0.35:
+                word = rng.choice(words)
+            elif pick < 0.45:
+                word = rng.choice(adverbs)
+            elif pick < 0.55:
+                word = rng.choice(NEGATORS)
+            else:
+                word = rng.choice(FILLERS)
+            if rng.random() < 0.2:
+                word = word.capitalize()
+            parts.append(word + rng.choice(PUNCT))
+        corpus.append(" ".join(parts))
+    return corpus
+
+def import_seconds(statement: str) -> float:
+    code = f"import time; t = time.perf_counter(); {statement}; print(time.perf_counter() - t)"
+    return float(subprocess.check_output([sys.executable, "-c", code], text=True))
+
+def latency(backend, texts) -> list:
+    samples = []
+    for text in texts:
+        t0 = time.perf_counter()
+        backend._score(text) # uncached
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+def main():
+    recorded = load_texts(Path(__file__).resolve().parents[1] / "debug_output.txt")
+    corpus = recorded + HEADLINES + fuzz_corpus(FUZZ)
+
+    t0 = time.perf_counter()
+    lexicon = LexiconSentiment()
+    load_ms = (time.perf_counter() - t0) * 1000
+    reference = TextBlobSentiment()
+
+    # --- Parity ---
+    ours = [lexicon.score(t) for t in corpus]
+    theirs = [reference.score(t) for t in corpus]
+    diffs = [abs(a - b) for a, b in zip(ours, theirs)]
+    exact = sum(d < 1e-9 for d in diffs)
+    same_decision = sum((a >= THRESHOLD) == (b >= THRESHOLD) for a, b in zip(ours, theirs))
+
+    print(f"Parity over {len(corpus)} texts ({len(recorded)} recorded, {len(HEADLINES)} headlines, {FUZZ} fuzzed)")
+    print(f"  identical scores    {exact:6d} ({exact / len(corpus):.2%})")
+    print(f"  same >= {THRESHOLD} decision {same_decision:6d} ({same_decision / len(corpus):.2%})")
+    print(f"  max |diff|          {max(diffs):.4f}   mean |diff| {statistics.mean(diffs):.6f}")
+    worst = sorted(zip(diffs, corpus, ours, theirs), reverse=True)[:3]
+    for d, text, a, b in worst:
+        if d > 1e-9:
+            print(f"    {a:+.3f} vs {b:+.3f}  {text[:80]!r}")
+
+    # --- Latency ---
+    print("\nLatency")
+    print(f"  import textblob         {import_seconds('import textblob') * 1000:8.1f} ms")
+    print(f"  import core.sentiment   {import_seconds('import alpaca_trader.core.sentiment') * 1000:8.1f} ms")
+    print(f"  lexicon load            {load_ms:8.1f} ms")
+    sample = HEADLINES * 20
+    for name, backend in (("textblob", reference), ("lexicon", lexicon)):
+        us = sorted(s * 1e6 for s in latency(backend, sample))
+        print(f"  {name:9} per article   p50 {us[len(us) // 2]:8.1f} us   p99 {us[int(len(us) * 0.99)]:8.1f} us")
+
+    t0 = time.perf_counter()
+    lexicon.score_batch(corpus)
+    cached_us = (time.perf_counter() - t0) / len(corpus) * 1e6
+    print(f"  lexicon memoized        {cached_us:8.2f} us / article (score_batch, {len(corpus)} texts)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Offline refresh of the local fundamentals index (data/fundamentals.npy).
+
+Run outside market hours; the bot remaps the file automatically on the next screen.
+
+    python scripts/build_fundamentals.py                 # yfinance, symbols from the universe cache
+    python scripts/build_fundamentals.py --csv fund.csv  # symbol,shares_outstanding,float_shares,sector
+"""
+import argparse
+import csv
+import json
+
+from alpaca_trader.core.fundamentals import FundamentalsIndex
+from alpaca_trader.core.universe import UniverseCache, SCREENABLE
+
+def records_from_csv(path: str):
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            yield {
+                "symbol": row["symbol"].strip().upper(),
+                "shares_outstanding": row.get("shares_outstanding") or None,
+                "float_shares": row.get("float_shares") or None,
+                "sector": row.get("sector") or "",
+            }
+
+def records_from_yfinance(symbols):
+    import yfinance as yf
+
+    for i, symbol in enumerate(symbols):
+        try:
+            info = yf.Ticker(symbol).info
+        except Exception as e:
+            print(f"[{i + 1}/{len(symbols)}] {symbol}: failed ({e})")
+            continue
+        yield {
+            "symbol": symbol,
+            "shares_outstanding": info.get("sharesOutstanding"),
+            "float_shares": info.get("floatShares"),
+            "sector": info.get("sector") or "",
+        }
+
+def universe_symbols() -> list:
+    path = UniverseCache(market_service=None).path
+    with open(path, "r", encoding="utf-8") as f:
+        flags = json.load(f)["assets"]
+    return sorted(s for s, v in flags.items() if v & SCREENABLE == SCREENABLE)
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the local fundamentals index")
+    parser.add_argument("--csv", help="Build from a CSV file instead of yfinance")
+    parser.add_argument("--out", help="Output path (default: <data_dir>/fundamentals.npy)")
+    args = parser.parse_args()
+
+    records = records_from_csv(args.csv) if args.csv else records_from_yfinance(universe_symbols())
+    path = FundamentalsIndex.write(list(records), args.out)
+    index = FundamentalsIndex.open(path)
+    print(f"Wrote {len(index)} symbols to {path}")
+
+if __name__ == "__main__":
+    main()
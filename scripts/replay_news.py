@@ -0,0 +1,76 @@
+"""
+Latency check for the streaming news path, against the local replay server
+(alpaca_trader.sim.news), no network required.
+
+Replays recorded articles (JSONL, one raw Alpaca news object per line; defaults to
+the headlines in debug_output.txt) through NewsStream at a fixed interval, drops the
+connection halfway through, and reports publication -> handler delay, plus what the
+reconnect gap fill recovered. The 2-minute REST poll averages ~60 s for comparison.
+
+    python scripts/replay_news.py [path/to/news.jsonl] [interval_seconds]
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.async_market import AsyncMarketService
+from alpaca_trader.core.news_stream import NewsStream
+from alpaca_trader.core.stream import parse_time
+from alpaca_trader.core.transport import AlpacaTransport
+from alpaca_trader.sim.news import NewsReplayServer, load_recording
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from bench_keywords import load_texts # noqa: E402
+
+def load_articles(path: Path) -> list:
+    if path.suffix == ".jsonl":
+        return load_recording(str(path))
+    return [{"id": i, "headline": text, "summary": "", "symbols": ["TEST"], "source": "replay"}
+            for i, text in enumerate(load_texts(path))]
+
+async def run(articles: list, interval: float):
+    settings.api_backoff_base = 0.05
+    server = NewsReplayServer()
+    await server.start()
+    delays = []
+
+    async def handler(item):
+        delays.append(time.time() - parse_time(item["created_at"]).timestamp())
+
+    transport = AlpacaTransport(rate_per_min=60_000, burst=100)
+    async with AsyncMarketService(transport, data_url=server.base_url) as market:
+        stream = NewsStream(handler, market=market, url=server.ws_url, lookback_minutes=0)
+        task = asyncio.create_task(stream.run())
+        await server.wait_for_clients()
+
+        half = len(articles) // 2
+        await server.replay(articles[:half], interval)
+        await server.disconnect()
+        await server.replay(articles[half:], interval)
+        while len(delays) < len(articles):
+            await asyncio.sleep(0.05)
+
+        await stream.stop()
+        await task
+    await server.close()
+    return stream, sorted(delays)
+
+def main():
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).resolve().parents[1] / "debug_output.txt"
+    interval = float(sys.argv[2]) if len(sys.argv) > 2 else 0.01
+    articles = load_articles(path)
+    if not articles:
+        sys.exit(f"No articles found in {path}")
+
+    stream, delays = asyncio.run(run(articles, interval))
+    live = stream.latency()
+    print(f"Articles: {len(delays)} (pushed {live['articles']}, gap filled {stream.stats['gap_filled']}, "
+          f"connects {stream.stats['connects']})")
+    print(f"Pushed:   avg {live['avg_ms']:.1f} ms, max {live['max_ms']:.1f} ms")
+    print(f"Overall:  p50 {1000 * delays[len(delays) // 2]:.1f} ms, max {1000 * delays[-1]:.1f} ms "
+          f"(2-minute poll: ~60000 ms average)")
+
+if __name__ == "__main__":
+    main()
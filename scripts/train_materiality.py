@@ -0,0 +1,81 @@
+"""
+Offline training of the news materiality classifier (data/materiality.npz).
+
+Input is a labelled article file, one article per row:
+- JSONL: {"headline": ..., "summary": ..., "label": 1}  (or a single "text" field)
+- CSV:   headline,summary,label                          (or text,label)
+label is 1 for material news (earnings, M&A, FDA, contracts, ...) and 0 otherwise.
+
+A random holdout is scored against the model and the keyword lists. The model is
+then refit on all rows and saved. Enable it with NEWS_MATERIALITY_FILTER=model.
+
+    python scripts/train_materiality.py --data labelled_news.jsonl
+"""
+import argparse
+import csv
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from alpaca_trader.core.materiality import MaterialityModel
+from alpaca_trader.core.news import NewsEngine
+
+def load_rows(path: str):
+    path = Path(path)
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f if line.strip()] if path.suffix == ".jsonl" else list(csv.DictReader(f))
+    texts, labels = [], []
+    for row in rows:
+        text = row.get("text") or f"{row.get('headline', '')} {row.get('summary') or ''}"
+        texts.append(text.strip())
+        labels.append(int(row["label"]))
+    return texts, np.array(labels)
+
+def report(name: str, predicted: np.ndarray, labels: np.ndarray):
+    tp = int(np.sum(predicted & (labels == 1)))
+    fp = int(np.sum(predicted & (labels == 0)))
+    fn = int(np.sum(~predicted & (labels == 1)))
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    accuracy = float(np.mean(predicted == (labels == 1)))
+    print(f"  {name:9} accuracy {accuracy:.3f}  precision {precision:.3f}  recall {recall:.3f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the hashed n-gram materiality classifier")
+    parser.add_argument("--data", required=True, help="Labelled articles (.jsonl or .csv)")
+    parser.add_argument("--out", help="Output path (default: <data_dir>/materiality.npz)")
+    parser.add_argument("--bits", type=int, default=18, help="Hash space = 2**bits weights")
+    parser.add_argument("--ngrams", type=int, default=2)
+    parser.add_argument("--epochs", type=int, default=200)
+    parser.add_argument("--holdout", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    texts, labels = load_rows(args.data)
+    print(f"{len(texts)} articles, {labels.mean():.1%} material")
+
+    rng = np.random.default_rng(args.seed)
+    order = rng.permutation(len(texts))
+    cut = int(len(texts) * (1 - args.holdout))
+    train, test = order[:cut], order[cut:]
+
+    if len(test):
+        model = MaterialityModel.train([texts[i] for i in train], labels[train], args.bits, args.ngrams, args.epochs)
+        held_out = [texts[i] for i in test]
+        engine = NewsEngine()
+        print(f"Holdout ({len(test)} articles)")
+        report("model", model.predict(held_out), labels[test])
+        report("keywords", np.array([engine.material.search(t) for t in held_out]), labels[test])
+
+    model = MaterialityModel.train(texts, labels, args.bits, args.ngrams, args.epochs)
+    path = model.save(Path(args.out) if args.out else None)
+    print(f"Wrote {path} ({path.stat().st_size / 1024:.0f} KiB)")
+
+    t0 = time.perf_counter()
+    model.predict(texts)
+    print(f"Batch scoring: {(time.perf_counter() - t0) / len(texts) * 1e6:.1f} us / article")
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+from typing import Any, Dict, List, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -18,4 +19,123 @@ class Settings(BaseSettings):
     alpaca_secret_key: str = Field(default="", alias="ALPACA_SECRET_KEY")
     alpaca_base_url: str = "https://paper-api.alpaca.markets"
 
+    # Shared Transport (one budget for every Alpaca client)
+    api_rate_limit_per_min: int = 200 # Alpaca account limit
+    api_burst: int = 20 # Tokens available for a burst
+    api_max_retries: int = 4 # Retries on 429 / 5xx / connection errors
+    api_backoff_base: float = 0.5 # Seconds, doubled per retry, +/-50% jitter
+    http_pool_size: int = 32 # Keep-alive connections per host
+    async_max_in_flight: int = 200 # Concurrent connections for the async data layer
+    async_request_timeout: float = 30.0 # Seconds
+
+    # WebSocket Streams (news, trade updates, prices; see core/stream.py)
+    stream_reconnect_max: float = 30.0 # Seconds, cap on the reconnect backoff
+    stream_heartbeat: float = 20.0 # Seconds between pings (detects dead sockets)
+
+    # Local Storage (caches, indexes)
+    data_dir: str = "data"
+
+    # Screener Settings
+    screen_chunk_size: int = 500 # Symbols per snapshot request (URL length limit)
+    screen_max_workers: int = 8 # Concurrent snapshot requests (stay inside 200 req/min)
+    screen_chunk_retries: int = 2
+    screen_retry_backoff: float = 0.5 # Seconds, doubled on each retry
+    universe_cache_ttl_hours: float = 12.0 # Asset list barely changes intraday
+
+    # Minute-Bar Cache (shared by all technical indicators)
+    bar_cache_capacity: int = 1000 # Minute bars kept per symbol
+    bar_cache_lookback_days: int = 2 # Backfill window for a symbol seen for the first time
+    bar_cache_refresh_seconds: float = 30.0 # Min interval between incremental fetches
+
+    # On-Disk Bar Store (memory-mapped minute history, see core/bar_store.py)
+    bar_store_enabled: bool = True # Persist minute bars under data_dir/bars
+    bar_store_backfill_days: int = 5 # History fetched for symbols not yet on disk
+    bar_store_backfill_chunk: int = 100 # Symbols per backfill request
+    bar_store_backfill_minutes: int = 30 # Backfill job interval
+    bar_store_open_maps: int = 64 # Memory-mapped symbol files kept open (one descriptor each)
+
+    # Market Cap Band (needs the local fundamentals index, see core/fundamentals.py)
+    market_cap_min: float = 300_000_000
+    market_cap_max: float = 2_000_000_000
+    market_cap_keep_unknown: bool = False # Keep symbols missing from the index
+
+    # Screen Profiles (see core/rules.py for the rule grammar)
+    # Override via env as JSON, e.g. SCREEN_PROFILES='{"default": {...}, "liquid": {...}}'
+    screen_profile: str = "default" # Profile that feeds the watchlist
+    screen_profiles: Dict[str, Dict[str, Any]] = {
+        "default": {
+            "all": [
+                {"field": "price", "between": [2.0, 20.0]},
+                {"field": "volume", "gt": 100_000},
+            ]
+        }
+    }
+
+    # News Filters (one keyword / regex per line; unset = NewsEngine's built-in lists)
+    news_allowed_keywords_file: Optional[str] = None
+    news_banned_keywords_file: Optional[str] = None
+    news_materiality_filter: str = "keywords" # "keywords" or "model" (trained classifier, keywords as fallback)
+    news_materiality_model_path: Optional[str] = None # Defaults to data_dir/materiality.npz
+    news_materiality_threshold: float = 0.5 # Min model probability for "material"
+
+    # News Polling (see core/news_poller.py; fallback when the stream is off or fails)
+    news_poll_page_size: int = 50 # Articles per request (API max)
+    news_poll_max_pages: int = 40 # Per poll; a longer backlog resumes on the next poll
+    news_include_content: bool = False # Full article bodies (NewsEngine reads headline + summary only)
+
+    # News Stream (see core/news_stream.py)
+    news_stream_enabled: bool = True # Push articles over the news WebSocket; False = poll REST every 2 minutes
+    news_stream_url: str = "wss://stream.data.alpaca.markets/v1beta1/news"
+    news_stream_lookback_minutes: int = 30 # REST fill on the first connect
+    news_stream_gap_limit: int = 500 # Max articles fetched per reconnect gap fill
+
+    # Trade Updates Stream (see core/trade_stream.py)
+    trade_stream_enabled: bool = True # Track fills from the trading stream; False = 60 s position polling only
+    trade_stream_url: Optional[str] = None # Default: alpaca_base_url's /stream endpoint
+
+    # Price Stream (tick-driven exits, see core/price_stream.py)
+    price_stream_enabled: bool = True # Hard / trailing stops on every trade and quote; False = checked each minute
+    price_stream_url: str = "wss://stream.data.alpaca.markets/v2/iex" # v2/sip with a SIP data subscription
+    exit_retry_seconds: float = 5.0 # Min gap between tick-triggered sell attempts per symbol
+
+    # Order Router (see core/order_router.py)
+    order_router_workers: int = 4 # Orders submitted concurrently
+    order_inflight_timeout: float = 90.0 # Seconds before an order with no fill / cancel event is checked at the broker (> the 60 s reconcile)
+
+    # Exit Rules (see core/exit_rules.py; screen rule grammar, first match wins)
+    # Fields: entry_price, price, max_price, held_minutes, tier1_sold, protected, rsi,
+    # volume_divergence, profit_pct, drawdown_pct. A partial sell marks Tier 1 as taken.
+    # "tick": also checked on every price tick. Override via env as JSON (EXIT_RULES='[...]').
+    exit_rules: List[Dict[str, Any]] = [
+        {"name": "hard_stop", "sell": 1.0, "tick": True,
+         "when": {"all": [{"field": "protected", "eq": 0}, {"field": "profit_pct", "lt": -0.05}]}},
+        {"name": "stale_timer", "sell": 1.0,
+         "when": {"all": [{"field": "held_minutes", "gt": 45}, {"field": "profit_pct", "lt": 0.015}]}},
+        {"name": "tier1", "sell": 0.5,
+         "when": {"all": [{"field": "tier1_sold", "eq": 0}, {"field": "profit_pct", "gte": 0.065}]}},
+        {"name": "runner_trailing_stop", "sell": 1.0, "tick": True,
+         "when": {"all": [{"field": "protected", "eq": 0}, {"field": "tier1_sold", "eq": 1},
+                          {"field": "drawdown_pct", "gte": 0.03}]}},
+        {"name": "rsi_overheat", "sell": 1.0, "when": {"field": "rsi", "gt": 85}},
+        {"name": "volume_exhaustion", "sell": 1.0, "when": {"field": "volume_divergence", "eq": 1}},
+    ]
+
+    # Protective Orders (see PositionManager._protect; levels from the hard_stop / runner_trailing_stop rules)
+    protective_orders_enabled: bool = False # Broker-side stop on entry fills, native trailing stop after Tier 1
+    protective_cancel_timeout: float = 2.0 # Seconds to wait for a cancel to release the shares before selling
+
+    # News Archive (see core/news_archive.py)
+    news_archive_enabled: bool = True # Processed articles, scores and watermark survive restarts
+    news_archive_path: Optional[str] = None # Defaults to data_dir/news.sqlite3
+
+    # News Dedup (see core/dedup.py)
+    news_dedup_ttl_hours: float = 48.0 # How long an article counts as seen
+    news_dedup_max_entries: int = 20_000 # Memory cap, oldest dropped first
+    news_dedup_min_similarity: float = 0.7 # Estimated headline word overlap for a rewrite
+
+    # Sentiment (see core/sentiment.py)
+    sentiment_backend: str = "lexicon" # "lexicon" (fast) or "textblob" (reference)
+    sentiment_lexicon_path: Optional[str] = None # Defaults to textblob's en-sentiment.xml
+    sentiment_cache_size: int = 4096 # Memoized scores for identical text
+
 settings = Settings()
@@ -0,0 +1,161 @@
+import asyncio
+import concurrent.futures
+import threading
+from datetime import datetime
+from typing import Any, Awaitable, Dict, List, Optional
+import aiohttp
+import structlog
+from alpaca.trading.models import Order
+from alpaca.trading.requests import OrderRequest
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.transport import AlpacaTransport, get_transport
+
+logger = structlog.get_logger()
+
+DATA_URL = "https://data.alpaca.markets"
+
+class AsyncMarketService:
+    """
+    Asyncio-native access to Alpaca market data, news and orders.
+
+    One aiohttp session (keep-alive pool of `async_max_in_flight` connections) lets a
+    single event loop keep hundreds of requests in flight, while every request still
+    goes through the shared transport budget / priorities / retries. Returns raw JSON
+    (as `MarketService.get_snapshots_raw` does); orders come back as alpaca `Order` models.
+    """
+
+    def __init__(self, transport: Optional[AlpacaTransport] = None,
+                 data_url: str = DATA_URL, trading_url: Optional[str] = None):
+        self.transport = transport or get_transport()
+        self.data_url = data_url.rstrip("/")
+        self.trading_url = (trading_url or settings.alpaca_base_url).rstrip("/")
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncMarketService":
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={
+                    "APCA-API-KEY-ID": settings.alpaca_api_key,
+                    "APCA-API-SECRET-KEY": settings.alpaca_secret_key,
+                },
+                connector=aiohttp.TCPConnector(limit=settings.async_max_in_flight),
+                timeout=aiohttp.ClientTimeout(total=settings.async_request_timeout),
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def _request(self, method: str, url: str, params: Optional[dict] = None, json: Optional[dict] = None) -> Any:
+        """One logical request through the shared budget (retries included)."""
+        async def send():
+            try:
+                async with self.session.request(method, url, params=params, json=json) as response:
+                    response.raise_for_status()
+                    if response.content_length == 0:
+                        return {}
+                    return await response.json()
+            except aiohttp.ClientConnectionError as e:
+                # Let the transport treat dropped connections as transient
+                raise ConnectionError(str(e)) from e
+
+        return await self.transport.execute_async(send, self.transport.idempotent(method, json))
+
+    async def _paginate(self, url: str, params: dict, key: str, limit: Optional[int] = None) -> Any:
+        """Follow next_page_token, merging `key` (a list, or {symbol: list}) across pages."""
+        params = {k: v for k, v in params.items() if v is not None}
+        merged: Any = None
+        while True:
+            page = await self._request("GET", url, params=params)
+            items = page.get(key) or []
+            if isinstance(items, dict):
+                merged = merged if merged is not None else {}
+                for symbol, rows in items.items():
+                    merged.setdefault(symbol, []).extend(rows)
+                total = sum(len(rows) for rows in merged.values())
+            else:
+                merged = (merged or []) + list(items)
+                total = len(merged)
+
+            token = page.get("next_page_token")
+            if not token or (limit and total >= limit):
+                return merged
+            params["page_token"] = token
+
+    # ---------------------------
+    # Market Data
+    # ---------------------------
+
+    async def get_snapshots(self, symbols: List[str]) -> Dict:
+        """Raw snapshots keyed by symbol (one request)."""
+        if not symbols:
+            return {}
+        return await self._request("GET", f"{self.data_url}/v2/stocks/snapshots", params={"symbols": ",".join(symbols)})
+
+    async def get_bars(self, symbols: List[str], timeframe: str = "1Min",
+                       start: Optional[datetime] = None, limit: Optional[int] = None) -> Dict[str, List[dict]]:
+        """Raw bars {symbol: [{"t", "o", "h", "l", "c", "v", ...}]} (all pages)."""
+        if not symbols:
+            return {}
+        params = {
+            "symbols": ",".join(symbols),
+            "timeframe": timeframe,
+            "start": start.isoformat() if start else None,
+            "limit": min(limit, 10_000) if limit else 10_000, # Page size
+        }
+        return await self._paginate(f"{self.data_url}/v2/stocks/bars", params, "bars", limit)
+
+    # ---------------------------
+    # News
+    # ---------------------------
+
+    async def get_news(self, start: Optional[datetime] = None, symbols: Optional[List[str]] = None,
+                       limit: int = 50, include_content: bool = False,
+                       sort: Optional[str] = None) -> List[dict]:
+        """Raw news articles (all pages up to `limit`; newest first unless `sort="asc"`)."""
+        params = {
+            "start": start.isoformat() if start else None,
+            "symbols": ",".join(symbols) if symbols else None,
+            "limit": min(limit, 50),
+            "include_content": str(include_content).lower(),
+            "sort": sort,
+        }
+        return await self._paginate(f"{self.data_url}/v1beta1/news", params, "news", limit)
+
+    # ---------------------------
+    # Orders
+    # ---------------------------
+
+    async def submit_order(self, order_data: OrderRequest) -> Order:
+        """Submit an order built with the regular alpaca-py request models."""
+        raw = await self._request("POST", f"{self.trading_url}/v2/orders", json=order_data.to_request_fields())
+        return Order(**raw)
+
+class AsyncRunner:
+    """
+    A private event loop on a daemon thread, so synchronous callers (APScheduler jobs)
+    can run async fan-out: `runner.run(coro)` blocks the caller, not the loop.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="async-market", daemon=True)
+        self._thread.start()
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def submit(self, coro: Awaitable) -> concurrent.futures.Future:
+        """Start a long-running coroutine (e.g. a stream) without waiting for it."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
@@ -0,0 +1,264 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+import structlog
+from alpaca.data.historical import StockHistoricalDataClient
+from alpaca.data.requests import StockBarsRequest
+from alpaca.data.timeframe import TimeFrame
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.bar_store import BarStore
+from alpaca_trader.core.transport import Priority, request_priority
+
+logger = structlog.get_logger()
+
+BAR_FIELDS = ("open", "high", "low", "close", "volume")
+
+class BarBuffer:
+    """
+    Fixed-capacity ring buffer of minute bars for one symbol.
+    Timestamps are epoch seconds (float64); OHLCV lives in one (5, capacity) array.
+    Appends only accept bars newer than the last one held; the oldest bars fall off.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.ts = np.zeros(capacity)
+        self.data = np.zeros((len(BAR_FIELDS), capacity))
+        self.start = 0
+        self.size = 0
+        self.refreshed_at = 0.0 # monotonic time of the last network refresh
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def last_ts(self) -> Optional[float]:
+        if not self.size:
+            return None
+        return float(self.ts[(self.start + self.size - 1) % self.capacity])
+
+    def append(self, ts: np.ndarray, values: np.ndarray) -> int:
+        """Append bars (ts: (n,), values: (5, n)) in time order. Returns bars added."""
+        last = self.last_ts
+        if last is not None:
+            newer = ts > last
+            ts, values = ts[newer], values[:, newer]
+        n = len(ts)
+        if n == 0:
+            return 0
+        if n > self.capacity:
+            ts, values = ts[-self.capacity:], values[:, -self.capacity:]
+            n = self.capacity
+
+        end = (self.start + self.size) % self.capacity
+        idx = (end + np.arange(n)) % self.capacity
+        self.ts[idx] = ts
+        self.data[:, idx] = values
+
+        overflow = max(0, self.size + n - self.capacity)
+        self.size = min(self.capacity, self.size + n)
+        self.start = (self.start + overflow) % self.capacity
+        return n
+
+    def since(self, ts: float) -> Dict[str, np.ndarray]:
+        """Bars strictly newer than `ts`; cost is proportional to the bars returned."""
+        n = 0
+        while n < self.size and self.ts[(self.start + self.size - 1 - n) % self.capacity] > ts:
+            n += 1
+        return self.window(n)
+
+    def window(self, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Last `n` bars (all if None) in chronological order, as {field: array}."""
+        n = self.size if n is None else min(n, self.size)
+        idx = (self.start + np.arange(self.size - n, self.size)) % self.capacity
+        out = {"timestamp": self.ts[idx]}
+        for i, field in enumerate(BAR_FIELDS):
+            out[field] = self.data[i, idx]
+        return out
+
+class BarCache:
+    """
+    Rolling in-memory minute-bar cache shared by every technical indicator.
+
+    - Cold symbols are seeded from the on-disk `BarStore` first, then backfilled once
+      (`bar_cache_lookback_days`) only if the store has nothing for them.
+    - Every fetched bar is written through to the store, so a warm restart only asks
+      the network for bars newer than what is already on disk.
+    - Warm symbols fetch only bars newer than their last cached timestamp, batched
+      into one multi-symbol request per distinct last-bar time (one in steady state),
+      at most every `bar_cache_refresh_seconds`.
+    - `evict()` drops symbols that left the watchlist / portfolio.
+    """
+
+    def __init__(self, data_client: StockHistoricalDataClient, capacity: Optional[int] = None,
+                 store: Optional[BarStore] = None):
+        self.data_client = data_client
+        self.capacity = capacity or settings.bar_cache_capacity
+        if store is None and settings.bar_store_enabled:
+            store = BarStore()
+        self.store = store
+        self.buffers: Dict[str, BarBuffer] = {}
+        self.stats = {"requests": 0, "bars": 0, "loaded": 0}
+        self._lock = threading.RLock()
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.buffers
+
+    def get(self, symbol: str, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Latest `n` minute bars for `symbol`, refreshing first if due."""
+        self.refresh([symbol])
+        return self.peek(symbol, n)
+
+    def peek(self, symbol: str, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Latest `n` cached bars for `symbol` (no refresh)."""
+        with self._lock:
+            buffer = self.buffers.get(symbol)
+            if buffer is None:
+                return BarBuffer(1).window()
+            return buffer.window(n)
+
+    def since(self, symbol: str, ts: float) -> Dict[str, np.ndarray]:
+        """Cached bars for `symbol` newer than `ts` (no refresh)."""
+        with self._lock:
+            buffer = self.buffers.get(symbol)
+            if buffer is None:
+                return BarBuffer(1).window()
+            return buffer.since(ts)
+
+    def refresh(self, symbols: Iterable[str], force: bool = False) -> int:
+        """
+        Bring `symbols` up to date: one backfill for cold symbols, then one incremental
+        fetch per group of warm symbols sharing a last-bar timestamp, so a symbol that
+        stopped trading doesn't drag everyone else's window back. No fetch reaches
+        further than `bar_cache_lookback_days`. Returns the number of new bars stored.
+        """
+        now = time.monotonic()
+        cold: List[str] = []
+        warm: List[str] = []
+        with self._lock:
+            for symbol in dict.fromkeys(symbols):
+                buffer = self.buffers.get(symbol)
+                if buffer is None:
+                    buffer = self._load(symbol)
+                due = buffer is None or force or now - buffer.refreshed_at >= settings.bar_cache_refresh_seconds
+                if not due:
+                    continue
+                if buffer is None or not len(buffer):
+                    cold.append(symbol)
+                else:
+                    warm.append(symbol)
+
+        added = 0
+        floor = datetime.now(timezone.utc) - timedelta(days=settings.bar_cache_lookback_days)
+        if cold:
+            added += self._fetch(cold, floor, now)
+        groups: Dict[float, List[str]] = {}
+        with self._lock:
+            for symbol in warm:
+                groups.setdefault(self.buffers[symbol].last_ts, []).append(symbol)
+        for last_ts, group in sorted(groups.items(), reverse=True):
+            # Strictly newer than what we hold (minute bars are stamped at their open)
+            start = datetime.fromtimestamp(last_ts, tz=timezone.utc) + timedelta(minutes=1)
+            added += self._fetch(group, max(start, floor), now)
+        return added
+
+    def _load(self, symbol: str) -> Optional[BarBuffer]:
+        """Seed a buffer from the local store (caller holds the lock)."""
+        if self.store is None:
+            return None
+        records = self.store.tail(symbol, self.capacity)
+        if not len(records):
+            return None
+        buffer = self.buffers[symbol] = BarBuffer(self.capacity)
+        values = np.array([records[field] for field in BAR_FIELDS])
+        buffer.append(np.array(records["timestamp"]), values)
+        self.stats["loaded"] += len(records)
+        return buffer
+
+    def backfill(self, symbols: Iterable[str], days: Optional[int] = None) -> int:
+        """
+        Fill the on-disk store for `symbols` without touching the in-memory buffers.
+        Each symbol resumes after its last stored bar (or `days` back if it has none);
+        symbols are fetched in chunks at screener priority. Returns bars written.
+        """
+        if self.store is None:
+            return 0
+        days = days or settings.bar_store_backfill_days
+        floor = (datetime.now(timezone.utc) - timedelta(days=days)).timestamp()
+        symbols = list(dict.fromkeys(symbols))
+        size = settings.bar_store_backfill_chunk
+
+        written = 0
+        for i in range(0, len(symbols), size):
+            chunk = symbols[i:i + size]
+            oldest = min(self.store.last_ts(s) or floor for s in chunk)
+            start = datetime.fromtimestamp(max(oldest, floor), tz=timezone.utc) + timedelta(minutes=1)
+            with request_priority(Priority.SCREEN):
+                data = self._request(chunk, start)
+            if data is None:
+                continue
+            for symbol in chunk:
+                parsed = self._parse(data.get(symbol))
+                if parsed is not None:
+                    written += self.store.append(symbol, *parsed)
+        logger.info("Bar store backfill complete", symbols=len(symbols), bars=written)
+        return written
+
+    def _request(self, symbols: List[str], start: datetime) -> Optional[dict]:
+        try:
+            req = StockBarsRequest(
+                symbol_or_symbols=symbols,
+                timeframe=TimeFrame.Minute,
+                start=start
+            )
+            bars = self.data_client.get_stock_bars(req)
+        except Exception as e:
+            logger.warning("Bar refresh failed", symbols=len(symbols), error=str(e))
+            return None
+        with self._lock:
+            self.stats["requests"] += 1
+        return getattr(bars, "data", None) or {}
+
+    @staticmethod
+    def _parse(rows) -> Optional[tuple]:
+        if not rows:
+            return None
+        ts = np.array([bar.timestamp.timestamp() for bar in rows])
+        values = np.array([[getattr(bar, field) for bar in rows] for field in BAR_FIELDS], dtype=np.float64)
+        return ts, values
+
+    def _fetch(self, symbols: List[str], start: datetime, now: float) -> int:
+        data = self._request(symbols, start)
+        if data is None:
+            return 0
+
+        added = 0
+        with self._lock:
+            for symbol in symbols:
+                buffer = self.buffers.get(symbol)
+                if buffer is None:
+                    buffer = self.buffers[symbol] = BarBuffer(self.capacity)
+                buffer.refreshed_at = now
+                parsed = self._parse(data.get(symbol))
+                if parsed is None:
+                    continue
+                added += buffer.append(*parsed)
+                if self.store is not None:
+                    self.store.append(symbol, *parsed)
+            self.stats["bars"] += added
+        return added
+
+    def evict(self, keep: Iterable[str]) -> List[str]:
+        """Drop every symbol not in `keep`. Returns the evicted symbols."""
+        keep = set(keep)
+        with self._lock:
+            gone = [s for s in self.buffers if s not in keep]
+            for symbol in gone:
+                del self.buffers[symbol]
+                if self.store is not None:
+                    self.store.release(symbol)
+        if gone:
+            logger.debug("Bar cache evicted", count=len(gone))
+        return gone
@@ -0,0 +1,136 @@
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import quote, unquote
+import numpy as np
+import structlog
+from alpaca_trader.config.settings import settings
+
+logger = structlog.get_logger()
+
+class BarStore:
+    """
+    Local columnar history of minute bars: one append-only binary file per symbol.
+
+    Each file is a flat array of fixed-size records (timestamp + OHLCV, float64) read
+    through `np.memmap`, so any symbol / time range comes back as zero-copy NumPy views
+    (a slice of the mapping, located by binary search on the timestamp column).
+    Appends only accept bars newer than the last stored one; a torn trailing record
+    from a crash is truncated on the next append. Every mapping holds a file descriptor,
+    so only the `bar_store_open_maps` most recently used stay open.
+    """
+
+    DTYPE = np.dtype([
+        ("timestamp", "f8"),
+        ("open", "f8"),
+        ("high", "f8"),
+        ("low", "f8"),
+        ("close", "f8"),
+        ("volume", "f8"),
+    ])
+    FIELDS = DTYPE.names
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root else Path(settings.data_dir) / "bars"
+        self._maps: "OrderedDict[str, np.ndarray]" = OrderedDict() # LRU, oldest first
+        self._lock = threading.RLock()
+
+    def path(self, symbol: str) -> Path:
+        # Percent-encoded so every symbol maps to its own file and back ("BRK/B" -> "BRK%2FB")
+        return self.root / f"{quote(symbol, safe='')}.bin"
+
+    def symbols(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        return sorted(unquote(p.stem) for p in self.root.glob("*.bin"))
+
+    def _map(self, symbol: str) -> np.ndarray:
+        """Current mapping of the symbol's file (re-mapped when it has grown)."""
+        path = self.path(symbol)
+        try:
+            count = path.stat().st_size // self.DTYPE.itemsize
+        except FileNotFoundError:
+            return np.empty(0, dtype=self.DTYPE)
+
+        mapped = self._maps.get(symbol)
+        if mapped is not None and len(mapped) == count:
+            self._maps.move_to_end(symbol)
+            return mapped
+        if count == 0:
+            return np.empty(0, dtype=self.DTYPE)
+        mapped = self._maps[symbol] = np.memmap(path, dtype=self.DTYPE, mode="r", shape=(count,))
+        self._maps.move_to_end(symbol)
+        # Views already handed out keep their own mapping alive
+        while len(self._maps) > settings.bar_store_open_maps:
+            self._maps.popitem(last=False)
+        return mapped
+
+    def count(self, symbol: str) -> int:
+        with self._lock:
+            return len(self._map(symbol))
+
+    def last_ts(self, symbol: str) -> Optional[float]:
+        with self._lock:
+            mapped = self._map(symbol)
+            return float(mapped["timestamp"][-1]) if len(mapped) else None
+
+    def append(self, symbol: str, ts: np.ndarray, values: np.ndarray) -> int:
+        """Append bars (ts: (n,), values: (5, n) OHLCV) newer than the last stored bar."""
+        with self._lock:
+            last = self.last_ts(symbol)
+            if last is not None:
+                newer = ts > last
+                ts, values = ts[newer], values[:, newer]
+            if len(ts) == 0:
+                return 0
+
+            records = np.empty(len(ts), dtype=self.DTYPE)
+            records["timestamp"] = ts
+            for i, field in enumerate(self.FIELDS[1:]):
+                records[field] = values[i]
+
+            path = self.path(symbol)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "ab") as f:
+                size = f.tell()
+                torn = size % self.DTYPE.itemsize
+                if torn:
+                    f.truncate(size - torn)
+                f.write(records.tobytes())
+            self._maps.pop(symbol, None)
+            return len(records)
+
+    def read(self, symbol: str, start: Optional[float] = None, end: Optional[float] = None) -> np.ndarray:
+        """Records with start <= timestamp <= end (epoch seconds), as a zero-copy slice."""
+        with self._lock:
+            mapped = self._map(symbol)
+        ts = mapped["timestamp"]
+        lo = 0 if start is None else int(np.searchsorted(ts, start, side="left"))
+        hi = len(mapped) if end is None else int(np.searchsorted(ts, end, side="right"))
+        return mapped[lo:hi]
+
+    def tail(self, symbol: str, n: int) -> np.ndarray:
+        """Last `n` records (zero-copy slice)."""
+        with self._lock:
+            mapped = self._map(symbol)
+        return mapped[max(0, len(mapped) - n):]
+
+    def window(self, symbol: str, start: Optional[float] = None, end: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """{field: array} views of OHLCV for a time range; no data is copied."""
+        records = self.read(symbol, start, end)
+        return {field: records[field] for field in self.FIELDS}
+
+    def release(self, symbol: str):
+        """Drop the cached mapping (and its file descriptor); the file stays on disk."""
+        with self._lock:
+            self._maps.pop(symbol, None)
+
+    def remove(self, symbol: str):
+        with self._lock:
+            self._maps.pop(symbol, None)
+            try:
+                os.remove(self.path(symbol))
+            except FileNotFoundError:
+                pass
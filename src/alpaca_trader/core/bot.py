@@ -1,18 +1,24 @@
 import time
 import asyncio
-from datetime import datetime, timedelta
-from typing import List, Set
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Set
 import structlog
 from apscheduler.schedulers.background import BackgroundScheduler
 from alpaca.data.historical import NewsClient
-from alpaca.data.requests import NewsRequest
 
 from alpaca_trader.config.settings import settings
 from alpaca_trader.core.market import MarketService
 from alpaca_trader.core.screener import MarketScreener
-from alpaca_trader.core.news import NewsEngine, NewsArticle
+from alpaca_trader.core.news import NewsEngine
+from alpaca_trader.core.news_archive import NewsArchive
+from alpaca_trader.core.news_poller import NewsPoller
+from alpaca_trader.core.news_router import NewsRouter
+from alpaca_trader.core.news_stream import NewsStream
 from alpaca_trader.core.position_manager import PositionManager
+from alpaca_trader.core.price_stream import PriceStream
 from alpaca_trader.core.technicals import Technicals
+from alpaca_trader.core.trade_stream import TradeUpdatesStream
+from alpaca_trader.core.transport import get_transport
 
 logger = structlog.get_logger()
 
@@ -23,7 +29,8 @@ class AlpacaBot:
     def __init__(self):
         self.market = MarketService()
         self.screener = MarketScreener(self.market)
-        self.news_engine = NewsEngine()
+        self.news_archive = NewsArchive() if settings.news_archive_enabled else None
+        self.news_engine = NewsEngine(archive=self.news_archive)
         self.tech = Technicals(self.market.data_client)
         self.pm = PositionManager(self.market.trading_client, self.tech)
         
@@ -31,10 +38,20 @@ class AlpacaBot:
             api_key=settings.alpaca_api_key,
             secret_key=settings.alpaca_secret_key
         )
+        get_transport().attach(self.news_client)
         
         self.scheduler = BackgroundScheduler()
         self.watchlist: Set[str] = set()
-        self.last_news_poll = datetime.now() - timedelta(minutes=30) 
+        # Resume ingestion where the previous run stopped
+        watermark = self.news_archive.watermark() if self.news_archive is not None else None
+        if watermark is not None:
+            # Anything older fails NewsArticle.is_fresh anyway
+            watermark = max(watermark, datetime.now(timezone.utc) - timedelta(hours=24))
+        self.news_poller = NewsPoller(self.news_client, watermark=watermark)
+        self.news_router = NewsRouter()
+        self.news_stream: Optional[NewsStream] = None
+        self.trade_stream: Optional[TradeUpdatesStream] = None
+        self.price_stream: Optional[PriceStream] = None
 
     def start(self):
         """Start the bot loops."""
@@ -45,8 +62,21 @@ class AlpacaBot:
         
         # 2. Schedule Tasks
         self.scheduler.add_job(self.update_watchlist, 'interval', minutes=60)
+        # Fills arrive on the trade-updates stream; the poll reconciles and applies exit rules
         self.scheduler.add_job(self.pm.update_trades, 'interval', seconds=60)
-        self.scheduler.add_job(self.scan_news, 'interval', minutes=2)
+        if settings.trade_stream_enabled:
+            self.start_trade_stream()
+        if settings.price_stream_enabled:
+            self.start_price_stream()
+        if settings.news_stream_enabled:
+            self.start_news_stream()
+        else:
+            self.scheduler.add_job(self.scan_news, 'interval', minutes=2)
+        self.scheduler.add_job(self.log_transport_metrics, 'interval', minutes=5)
+        self.scheduler.add_job(self.save_news_watermark, 'interval', minutes=1)
+        if settings.bar_store_enabled:
+            self.scheduler.add_job(self.backfill_bars, 'interval', minutes=settings.bar_store_backfill_minutes,
+                                   next_run_time=datetime.now())
         
         self.scheduler.start()
         
@@ -56,14 +86,103 @@ class AlpacaBot:
                 time.sleep(1)
         except KeyboardInterrupt:
             self.scheduler.shutdown()
+            if self.news_stream is not None:
+                self.market.run_async(self.news_stream.stop())
+            if self.trade_stream is not None:
+                self.market.run_async(self.trade_stream.stop())
+            if self.price_stream is not None:
+                self.market.run_async(self.price_stream.stop())
+            self.pm.orders.close()
+            self.save_news_watermark()
             logger.info("Bot Stopped")
 
+    def log_transport_metrics(self):
+        """Report request budget usage: queue wait per priority and throttling."""
+        metrics = get_transport().metrics
+        logger.info("Transport Metrics", **metrics.snapshot())
+        metrics.reset()
+        if self.news_stream is not None:
+            logger.info("News Stream Metrics", connects=self.news_stream.stats["connects"],
+                        gap_filled=self.news_stream.stats["gap_filled"], **self.news_stream.latency())
+        if self.trade_stream is not None:
+            logger.info("Trade Stream Metrics", **self.trade_stream.stats)
+        if self.price_stream is not None:
+            logger.info("Price Stream Metrics", symbols=len(self.price_stream.symbols), **self.price_stream.stats)
+
+    def start_news_stream(self):
+        """Push news from the WebSocket (REST fills gaps after reconnects)."""
+        # Same resume point as polling: the restored (24 h clamped) archive watermark, else the lookback
+        self.news_stream = NewsStream(self.handle_news_item, market=self.market.aio,
+                                      watermark=self.news_poller.watermark)
+        future = self.market.runner.submit(self.news_stream.run())
+        future.add_done_callback(self._news_stream_ended)
+
+    def start_trade_stream(self):
+        """Track entries and exits from fill events (reconciling after every reconnect)."""
+        self.trade_stream = TradeUpdatesStream(self.pm.handle_trade_update, on_connect=self.pm.reconcile)
+        future = self.market.runner.submit(self.trade_stream.run())
+        future.add_done_callback(self._trade_stream_ended)
+
+    def _trade_stream_ended(self, future):
+        """Only fatal (auth) errors end the stream; the 60 s reconcile keeps positions tracked."""
+        if future.cancelled() or future.exception() is None:
+            return
+        logger.error("Trade updates stream failed, tracking positions by polling", error=str(future.exception()))
+        self.trade_stream = None
+
+    def start_price_stream(self):
+        """Evaluate hard / trailing stops on every trade and quote of the held symbols."""
+        self.price_stream = PriceStream(self.pm.on_price, symbols=self.pm.held())
+        self.pm.on_held_change = self.price_stream.update
+        future = self.market.runner.submit(self.price_stream.run())
+        future.add_done_callback(self._price_stream_ended)
+
+    def _price_stream_ended(self, future):
+        """Only fatal (auth) errors end the stream; stops are then checked every minute."""
+        if future.cancelled() or future.exception() is None:
+            return
+        logger.error("Price stream failed, checking stops every minute", error=str(future.exception()))
+        self.pm.on_held_change = None
+        self.price_stream = None
+
+    def save_news_watermark(self):
+        """Persist the newest article time ingested (the seen-set guards any overlap)."""
+        if self.news_archive is None:
+            return
+        watermark = self.news_poller.watermark
+        if self.news_stream is not None:
+            watermark = max(watermark, self.news_stream.watermark)
+        try:
+            self.news_archive.set_watermark(watermark)
+        except Exception as e:
+            logger.error("News watermark save failed", error=str(e))
+
+    def _news_stream_ended(self, future):
+        """The stream only ends on stop() or a fatal (auth) error; fall back to polling."""
+        if future.cancelled() or future.exception() is None:
+            return
+        logger.error("News stream failed, falling back to polling", error=str(future.exception()))
+        # Resume from the newest article the stream delivered
+        self.news_poller.watermark = max(self.news_poller.watermark, self.news_stream.watermark)
+        self.news_stream = None
+        self.scheduler.add_job(self.scan_news, 'interval', minutes=2)
+
+    def backfill_bars(self):
+        """Keep the on-disk minute-bar store current for watched and held symbols."""
+        try:
+            self.tech.bars.backfill(self.watchlist | set(self.pm.trades))
+        except Exception as e:
+            logger.error("Bar backfill failed", error=str(e))
+
     def update_watchlist(self):
         """Run screener and update valid candidates."""
         logger.info("Updating Watchlist...")
         try:
             assets = self.screener.run_screen()
             self.watchlist = {a.symbol for a in assets}
+            self.news_router.update(self.watchlist)
+            # Drop cached bars for symbols we neither watch nor hold
+            self.tech.evict(self.watchlist | set(self.pm.trades))
             logger.info("Watchlist Updated", count=len(self.watchlist), top_5=list(self.watchlist)[:5])
         except Exception as e:
             logger.error("Screener failed", error=str(e))
@@ -76,39 +195,8 @@ class AlpacaBot:
         logger.debug("Scanning for news...")
         
         try:
-            req = NewsRequest(
-                limit=50,
-                start=self.last_news_poll,
-                include_content=True
-            )
-            
-            # Fetch news
-            response = self.news_client.get_news(req)
-            self.last_news_poll = datetime.now() # Reset high watermark
-            
-            news_items = []
-
-            # Determine response structure
-            if hasattr(response, 'news'):
-                # Handle NewsSet with .news attribute
-                # Check if .news is a dict or list
-                if isinstance(response.news, dict):
-                    # Sometimes it's a dict with ids?
-                    news_items = list(response.news.values())
-                else:
-                    news_items = response.news
-            elif isinstance(response, list):
-                 news_items = response
-            elif hasattr(response, '__iter__'):
-                # Convertible to list?
-                news_items = list(response)
-            elif hasattr(response, 'data'):
-                # Nested data
-                inner = response.data
-                if hasattr(inner, 'news'):
-                    news_items = inner.news
-                elif isinstance(inner, dict):
-                    news_items = inner.get('news', [])
+            # Every page since the newest article already seen
+            news_items = self.news_poller.poll()
 
             if not news_items:
                 logger.debug("No news items found")
@@ -117,43 +205,31 @@ class AlpacaBot:
             logger.info(f"Found {len(news_items)} news items")
 
             for item in news_items:
-                # Helper to access fields whether item is dict or object
-                def get_field(obj, field, default=None):
-                    if isinstance(obj, dict):
-                        return obj.get(field, default)
-                    return getattr(obj, field, default)
-
-                # Convert to our clean model
-                article = NewsArticle(
-                    id=str(get_field(item, 'id')),
-                    headline=get_field(item, 'headline', 'No Headline'),
-                    symbol=get_field(item, 'symbols', ['UNKNOWN'])[0] if get_field(item, 'symbols') else "UNKNOWN",
-                    source=get_field(item, 'source', 'Unknown'),
-                    created_at=get_field(item, 'created_at', datetime.now()),
-                    summary=get_field(item, 'summary', ''),
-                    url=get_field(item, 'url')
-                )
-                
-                # Check Watchlist
-                logger.info("News Discovered", headline=article.headline, symbol=article.symbol, created_at=str(article.created_at))
-                
-                raw_symbols = get_field(item, 'symbols', [])
-                relevant_symbols = [s for s in raw_symbols if s in self.watchlist]
-                if not relevant_symbols:
-                    continue
-
-                # Process
-                valid_article = self.news_engine.process_article(article)
-                
-                if valid_article:
-                    logger.info("🔥 Valid Signal Detected!", symbol=valid_article.symbol, headline=valid_article.headline)
-                    self.execute_signal(valid_article.symbol)
+                self.handle_news_item(item)
+            self.save_news_watermark()
 
         except Exception as e:
             logger.exception("News Poll Failed", error=str(e))
 
+    def handle_news_item(self, item):
+        """Route one article (raw JSON dict or REST model) and trade valid signals."""
+        # One candidate per watched symbol; irrelevant articles stop here, unlogged
+        for article in self.news_router.route(item):
+            logger.info("News Discovered", headline=article.headline, symbol=article.symbol, created_at=str(article.created_at))
+
+            valid_article = self.news_engine.process_article(article)
+            
+            if valid_article:
+                logger.info("🔥 Valid Signal Detected!", symbol=valid_article.symbol, headline=valid_article.headline)
+                self.execute_signal(valid_article.symbol)
+
     def execute_signal(self, symbol: str):
         """Execute buy on valid signal."""
+        # Held, or another article's order is already on its way
+        if not self.pm.can_enter(symbol):
+            logger.info("Signal Skipped: position held or entry pending", symbol=symbol)
+            return
+
         # 1. Final Tech Check (Trend Up?)
         # Simple VWAP or MA check?
         # MVP: Just check if RSI is not Overbought (>70) already before buying
@@ -0,0 +1,140 @@
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from alpaca_trader.config.settings import settings
+
+_WORDS = re.compile(r"\w+")
+
+NUM_PERM = 16 # MinHash signature length (uint32 each)
+ROWS = 2 # Signature rows per LSH band -> NUM_PERM // ROWS bands
+
+# Multiply-shift hash family: h_i(x) = (a_i * x + b_i) mod 2^64, top 32 bits
+_rng = np.random.default_rng(0x5EED)
+_A = _rng.integers(1, 2**63, NUM_PERM, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+_B = _rng.integers(0, 2**63, NUM_PERM, dtype=np.uint64)
+
+def _word_hash(word: str) -> int:
+    # Stable across processes (unlike hash()), so signatures can be persisted
+    return int.from_bytes(hashlib.blake2b(word.encode(), digest_size=8).digest(), "little")
+
+def minhash(text: str) -> np.ndarray:
+    """MinHash signature (NUM_PERM uint32) of the set of lowercased words in `text`."""
+    words = dict.fromkeys(_WORDS.findall(text.lower()))
+    if not words:
+        return np.zeros(NUM_PERM, dtype=np.uint32)
+    hashes = np.fromiter((_word_hash(w) for w in words), dtype=np.uint64, count=len(words))
+    with np.errstate(over="ignore"):
+        permuted = (hashes[:, None] * _A + _B) >> np.uint64(32)
+    return permuted.min(axis=0).astype(np.uint32)
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of the word sets behind two signatures."""
+    return float(np.count_nonzero(a == b)) / NUM_PERM
+
+class DedupStore:
+    """
+    Bounded memory of recently seen articles, for dropping repeats.
+
+    - Exact repeats are keyed on article ID.
+    - Near-duplicates (rewrites of the same story) are caught with MinHash signatures
+      over headline words: an estimated Jaccard similarity >= `min_similarity` within
+      the same `scope` (the article's symbol) counts as the same story; templated
+      headlines about different tickers stay distinct. Signatures are split into LSH
+      bands, so a lookup only compares against the few entries sharing a band
+      (constant time, not a scan).
+    - Entries expire after `ttl_hours`; beyond `max_entries` the oldest are dropped.
+    """
+
+    def __init__(self, ttl_hours: Optional[float] = None, max_entries: Optional[int] = None,
+                 min_similarity: Optional[float] = None):
+        self.ttl = 3600 * (ttl_hours if ttl_hours is not None else settings.news_dedup_ttl_hours)
+        self.max_entries = max_entries or settings.news_dedup_max_entries
+        self.min_similarity = min_similarity if min_similarity is not None else settings.news_dedup_min_similarity
+
+        # article id -> (signature, LSH keys, expires at); insertion order == expiry order
+        self._entries: "OrderedDict[str, Tuple[np.ndarray, List[bytes], float]]" = OrderedDict()
+        self._index: Dict[bytes, List[str]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, article_id: str) -> bool:
+        return article_id in self._entries
+
+    @staticmethod
+    def _keys(signature: np.ndarray, scope: str) -> List[bytes]:
+        prefix = scope.encode() + b"\0"
+        return [prefix + bytes([i]) + signature[i * ROWS:(i + 1) * ROWS].tobytes() for i in range(NUM_PERM // ROWS)]
+
+    def _remove(self, article_id: str):
+        _, keys, _ = self._entries.pop(article_id)
+        for key in keys:
+            bucket = self._index.get(key)
+            if bucket is not None:
+                bucket.remove(article_id)
+                if not bucket:
+                    del self._index[key]
+
+    def _expire(self, now: float):
+        while self._entries:
+            article_id, (_, _, expires_at) = next(iter(self._entries.items()))
+            if expires_at > now and len(self._entries) <= self.max_entries:
+                break
+            self._remove(article_id)
+
+    def find(self, article_id: str, text: str, scope: str = "", now: Optional[float] = None) -> Optional[str]:
+        """Reason `article_id` / `text` is a repeat ("id" or "near_duplicate"), else None."""
+        signature = minhash(text)
+        return self._find(article_id, signature, self._keys(signature, scope), now or time.time())
+
+    def _find(self, article_id: str, signature: np.ndarray, keys: List[bytes], now: float) -> Optional[str]:
+        with self._lock:
+            self._expire(now)
+            if article_id in self._entries:
+                return "id"
+            for key in keys:
+                for other in self._index.get(key, ()):
+                    if similarity(signature, self._entries[other][0]) >= self.min_similarity:
+                        return "near_duplicate"
+        return None
+
+    def signature(self, article_id: str) -> Optional[np.ndarray]:
+        """Stored MinHash signature of a remembered article (for persisting the seen-set)."""
+        entry = self._entries.get(article_id)
+        return entry[0] if entry is not None else None
+
+    def restore(self, article_id: str, signature: np.ndarray, scope: str = "", now: Optional[float] = None):
+        """`add` with a previously computed signature (no re-hashing on warm restarts)."""
+        self._add(article_id, signature, self._keys(signature, scope), now or time.time())
+
+    def add(self, article_id: str, text: str, scope: str = "", now: Optional[float] = None):
+        signature = minhash(text)
+        self._add(article_id, signature, self._keys(signature, scope), now or time.time())
+
+    def _add(self, article_id: str, signature: np.ndarray, keys: List[bytes], now: float):
+        with self._lock:
+            if article_id in self._entries:
+                self._remove(article_id)
+            self._entries[article_id] = (signature, keys, now + self.ttl)
+            for key in keys:
+                self._index.setdefault(key, []).append(article_id)
+            self._expire(now)
+
+    def check(self, article_id: str, text: str, scope: str = "", now: Optional[float] = None) -> Optional[str]:
+        """
+        `find`, then remember the article if it is new, atomically (the stream and a
+        poll can deliver the same article at once). Returns the repeat reason or None.
+        """
+        now = now or time.time()
+        signature = minhash(text)
+        keys = self._keys(signature, scope)
+        with self._lock:
+            reason = self._find(article_id, signature, keys, now)
+            if reason is None:
+                self._add(article_id, signature, keys, now)
+        return reason
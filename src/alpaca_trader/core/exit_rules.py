@@ -0,0 +1,108 @@
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence
+import numpy as np
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.rules import COMPARATORS, Predicate, compile_rule
+
+# A batch of positions: column name -> float64 array, one row per position
+PositionFrame = Dict[str, np.ndarray]
+
+# Columns PositionManager fills in (flags are 0 / 1; indicator gaps are NaN)
+POSITION_FIELDS = (
+    "entry_price", "price", "max_price", "held_minutes",
+    "tier1_sold", "protected", "rsi", "volume_divergence",
+)
+
+def _ratio(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return a / b
+
+DERIVED_EXIT_FIELDS = {
+    "profit_pct": lambda f: _ratio(f["price"] - f["entry_price"], f["entry_price"]),
+    "drawdown_pct": lambda f: _ratio(f["max_price"] - f["price"], f["max_price"]),
+}
+
+RULE_KEYS = {"name", "sell", "tick", "when"}
+
+class ExitRule(NamedTuple):
+    name: str
+    sell: float # Fraction of the position
+    tick: bool # Also evaluated on every price tick
+    predicate: Predicate
+    spec: Mapping[str, Any]
+
+class ExitDecision(NamedTuple):
+    symbol: str
+    rule: str
+    sell: float
+
+class ExitRules:
+    """
+    Declarative exit rules, evaluated together over every open position.
+
+    Each rule is {"name", "sell" (fraction), "tick" (optional), "when" (screen rule
+    grammar, see core/rules.py)} over POSITION_FIELDS and DERIVED_EXIT_FIELDS. Rules are
+    in priority order and a position exits on the first one that fires. A pass is one
+    vectorized mask per rule, so a thousand positions cost about as much as one.
+    """
+
+    def __init__(self, rules: Optional[Sequence[Mapping[str, Any]]] = None):
+        specs = settings.exit_rules if rules is None else rules
+        # Compile once; bad rules fail at startup rather than mid-pass
+        self.rules: List[ExitRule] = [self._compile(spec) for spec in specs]
+        names = [rule.name for rule in self.rules]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate exit rule names: {names}")
+
+    @staticmethod
+    def _compile(spec: Mapping[str, Any]) -> ExitRule:
+        if not isinstance(spec, Mapping) or "name" not in spec or "when" not in spec:
+            raise ValueError(f"Exit rule needs 'name' and 'when': {spec}")
+        unknown = set(spec) - RULE_KEYS
+        if unknown:
+            # e.g. a misspelled "sell" would otherwise exit the whole position
+            raise ValueError(f"Exit rule '{spec['name']}': unknown keys {sorted(unknown)}")
+        sell = float(spec.get("sell", 1.0))
+        if not 0.0 < sell <= 1.0:
+            raise ValueError(f"Exit rule '{spec['name']}': sell must be in (0, 1], got {sell}")
+        predicate = compile_rule(spec["when"], POSITION_FIELDS, DERIVED_EXIT_FIELDS)
+        return ExitRule(spec["name"], sell, bool(spec.get("tick", False)), predicate, spec["when"])
+
+    def evaluate(self, frame: PositionFrame, tick: bool = False) -> np.ndarray:
+        """Index of the rule that fires for each row, -1 to hold. `tick`: tick rules only."""
+        fired = np.full(len(frame["price"]), -1, dtype=np.int64)
+        for i, rule in enumerate(self.rules):
+            if tick and not rule.tick:
+                continue
+            fired[(fired < 0) & rule.predicate(frame)] = i
+        return fired
+
+    def decide(self, symbols: Sequence[str], frame: PositionFrame, tick: bool = False) -> List[ExitDecision]:
+        """Exit decisions (symbol, rule name, fraction to sell) for the rows that fire."""
+        fired = self.evaluate(frame, tick)
+        return [
+            ExitDecision(symbols[row], self.rules[fired[row]].name, self.rules[fired[row]].sell)
+            for row in np.flatnonzero(fired >= 0)
+        ]
+
+    def threshold(self, name: str, field: str) -> Optional[float]:
+        """
+        The constant rule `name` compares `field` against (first match), e.g. the hard stop's
+        profit_pct: broker-side orders mirror the configured rule instead of a copy of it.
+        """
+        for rule in self.rules:
+            if rule.name == name:
+                return _find_threshold(rule.spec, field)
+        return None
+
+def _find_threshold(spec: Mapping[str, Any], field: str) -> Optional[float]:
+    if spec.get("field") == field:
+        for op in COMPARATORS:
+            if op in spec:
+                return float(spec[op])
+        return None
+    # compile_rule allows one combinator per node; "not" inverts, so it has no usable level
+    for child in spec.get("all") or spec.get("any") or []:
+        value = _find_threshold(child, field)
+        if value is not None:
+            return value
+    return None
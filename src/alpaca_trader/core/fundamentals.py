@@ -0,0 +1,111 @@
+import os
+from pathlib import Path
+from typing import Iterable, Mapping, Optional
+import numpy as np
+import structlog
+from alpaca_trader.config.settings import settings
+
+logger = structlog.get_logger()
+
+class FundamentalsIndex:
+    """
+    Memory-mapped fundamentals keyed by symbol (shares outstanding, float, sector).
+
+    Stored as one sorted NumPy structured array (`.npy`) that is rebuilt offline
+    (see scripts/build_fundamentals.py) and opened with mmap_mode="r", so startup is
+    instant and lookups for a whole snapshot frame are one vectorized searchsorted.
+    No per-symbol network calls during the screen.
+    """
+
+    FILENAME = "fundamentals.npy"
+    DTYPE = np.dtype([
+        ("symbol", "U12"),
+        ("shares_outstanding", "f8"),
+        ("float_shares", "f8"),
+        ("sector", "U32"),
+    ])
+    # Numeric columns exposed to the screen (rule fields)
+    COLUMNS = ("shares_outstanding", "float_shares")
+
+    def __init__(self, table: np.ndarray, path: Optional[Path] = None):
+        self.table = table
+        self.path = path
+        self.mtime = os.path.getmtime(path) if path else 0.0
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    @classmethod
+    def default_path(cls) -> Path:
+        return Path(settings.data_dir) / cls.FILENAME
+
+    @classmethod
+    def open(cls, path: Optional[Path] = None) -> Optional["FundamentalsIndex"]:
+        """Memory-map the index file. Returns None if it has not been built yet."""
+        path = Path(path) if path else cls.default_path()
+        if not path.exists():
+            return None
+        try:
+            table = np.load(path, mmap_mode="r")
+            if table.dtype != cls.DTYPE:
+                raise ValueError(f"Unexpected dtype {table.dtype}")
+            return cls(table, path)
+        except Exception as e:
+            logger.error("Fundamentals index unreadable", path=str(path), error=str(e))
+            return None
+
+    @classmethod
+    def write(cls, records: Iterable[Mapping], path: Optional[Path] = None) -> Path:
+        """
+        Build the index file from {"symbol", "shares_outstanding", "float_shares", "sector"}
+        records. Rows are sorted by symbol; written atomically so a running bot never maps
+        a half-written file.
+        """
+        path = Path(path) if path else cls.default_path()
+        rows = sorted(
+            (
+                r["symbol"],
+                float(r.get("shares_outstanding") or np.nan),
+                float(r.get("float_shares") or np.nan),
+                r.get("sector") or "",
+            )
+            for r in records
+        )
+        table = np.array(rows, dtype=cls.DTYPE)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.stem + ".tmp.npy")
+        np.save(tmp, table)
+        os.replace(tmp, path)
+        return path
+
+    def is_outdated(self) -> bool:
+        """True if the file on disk was rebuilt since we mapped it."""
+        try:
+            return self.path is not None and os.path.getmtime(self.path) != self.mtime
+        except OSError:
+            return False
+
+    def rows_for(self, symbols: np.ndarray) -> np.ndarray:
+        """Row index per symbol, -1 where the symbol is not in the index."""
+        keys = self.table["symbol"]
+        if len(keys) == 0:
+            return np.full(len(symbols), -1)
+        wanted = np.asarray(symbols, dtype=keys.dtype)
+        rows = np.searchsorted(keys, wanted)
+        rows = np.minimum(rows, len(keys) - 1)
+        found = keys[rows] == wanted
+        return np.where(found, rows, -1)
+
+    def column(self, name: str, symbols: np.ndarray) -> np.ndarray:
+        """Gather a numeric column for `symbols` (NaN where unknown)."""
+        rows = self.rows_for(symbols)
+        values = np.asarray(self.table[name])[np.maximum(rows, 0)].astype(np.float64)
+        values[rows < 0] = np.nan
+        return values
+
+    def sector(self, symbol: str) -> Optional[str]:
+        row = self.rows_for(np.array([symbol]))[0]
+        if row < 0:
+            return None
+        return str(self.table["sector"][row]) or None
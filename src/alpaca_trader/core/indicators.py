@@ -0,0 +1,144 @@
+import math
+from collections import deque
+from typing import Dict, Optional
+import numpy as np
+
+NAN = float("nan")
+
+class WilderRSI:
+    """
+    Streaming RSI with Wilder smoothing (RMA, alpha = 1/length), O(1) per bar.
+    Matches `pandas_ta.rsi` replayed over the same history: averages are seeded
+    by the first price change and a value exists from the second close on.
+    `ready` flags when `length + 1` closes have been seen (pandas_ta's minimum input).
+    """
+
+    def __init__(self, length: int = 14):
+        self.length = length
+        self.alpha = 1.0 / length
+        self.prev_close: Optional[float] = None
+        self.avg_gain: Optional[float] = None
+        self.avg_loss: Optional[float] = None
+        self.count = 0
+        self.value = NAN
+
+    @property
+    def ready(self) -> bool:
+        return self.count > self.length
+
+    def update(self, close: float) -> float:
+        self.count += 1
+        if self.prev_close is not None:
+            change = close - self.prev_close
+            gain, loss = max(change, 0.0), max(-change, 0.0)
+            if self.avg_gain is None:
+                self.avg_gain, self.avg_loss = gain, loss
+            else:
+                self.avg_gain += self.alpha * (gain - self.avg_gain)
+                self.avg_loss += self.alpha * (loss - self.avg_loss)
+        self.prev_close = close
+
+        if self.avg_gain is not None:
+            total = self.avg_gain + self.avg_loss
+            self.value = 100.0 * self.avg_gain / total if total else NAN
+        return self.value
+
+class EMA:
+    """
+    Streaming EMA (alpha = 2 / (length + 1)), O(1) per value.
+    Seeded with the SMA of the first `length` values, like `pandas_ta.ema` (presma).
+    """
+
+    def __init__(self, length: int):
+        self.length = length
+        self.alpha = 2.0 / (length + 1)
+        self._seed_sum = 0.0
+        self.count = 0
+        self.value = NAN
+
+    @property
+    def ready(self) -> bool:
+        return self.count >= self.length
+
+    def update(self, x: float) -> float:
+        self.count += 1
+        if self.count < self.length:
+            self._seed_sum += x
+        elif self.count == self.length:
+            self.value = (self._seed_sum + x) / self.length
+        else:
+            self.value += self.alpha * (x - self.value)
+        return self.value
+
+class VWAP:
+    """
+    Streaming session VWAP over typical price (H+L+C)/3, O(1) per bar.
+    Resets on each new UTC day, like `pandas_ta.vwap(anchor="D")`.
+    """
+
+    def __init__(self):
+        self.day: Optional[int] = None
+        self.pv = 0.0
+        self.volume = 0.0
+        self.value = NAN
+
+    def update(self, ts: float, high: float, low: float, close: float, volume: float) -> float:
+        day = int(ts // 86_400)
+        if day != self.day:
+            self.day, self.pv, self.volume = day, 0.0, 0.0
+        self.pv += (high + low + close) / 3.0 * volume
+        self.volume += volume
+        self.value = self.pv / self.volume if self.volume else NAN
+        return self.value
+
+class RollingMean:
+    """Streaming simple moving average over the last `length` values (running sum), O(1)."""
+
+    def __init__(self, length: int):
+        self.length = length
+        self.window: deque = deque(maxlen=length)
+        self.total = 0.0
+        self.value = NAN
+
+    @property
+    def ready(self) -> bool:
+        return len(self.window) == self.length
+
+    def update(self, x: float) -> float:
+        if len(self.window) == self.length:
+            self.total -= self.window[0]
+        self.window.append(x)
+        self.total += x
+        if self.ready:
+            self.value = self.total / self.length
+        return self.value
+
+class IndicatorState:
+    """
+    All streaming indicators for one symbol, fed bar by bar.
+    `last_ts` is the newest bar consumed, so callers only replay bars after it.
+    """
+
+    def __init__(self, rsi_length: int = 14, ema_length: int = 9, volume_length: int = 20):
+        self.rsi = WilderRSI(rsi_length)
+        self.ema = EMA(ema_length)
+        self.vwap = VWAP()
+        self.volume_avg = RollingMean(volume_length)
+        self.last_ts: float = -math.inf
+
+    def update(self, ts: float, high: float, low: float, close: float, volume: float):
+        if ts <= self.last_ts:
+            return
+        self.rsi.update(close)
+        self.ema.update(close)
+        self.vwap.update(ts, high, low, close, volume)
+        self.volume_avg.update(volume)
+        self.last_ts = ts
+
+    def update_many(self, bars: Dict[str, np.ndarray]):
+        """Consume a {timestamp, high, low, close, volume} window in time order."""
+        for ts, high, low, close, volume in zip(
+            bars["timestamp"].tolist(), bars["high"].tolist(), bars["low"].tolist(),
+            bars["close"].tolist(), bars["volume"].tolist()
+        ):
+            self.update(ts, high, low, close, volume)
@@ -0,0 +1,78 @@
+import re
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+_METACHARS = re.compile(r"[\\.^$*+?{}\[\]|()]")
+
+def literal_prefix(pattern: str) -> Optional[str]:
+    """Longest literal text every match of `pattern` must start with (None if unknown)."""
+    if "|" in pattern:
+        return None
+    meta = _METACHARS.search(pattern)
+    if meta is None:
+        return pattern
+    prefix = pattern[:meta.start()]
+    if meta.group() in "?*{":
+        prefix = prefix[:-1] # the quantifier makes the last character optional
+    return prefix or None
+
+# Zero-width: a match that starts with a word character must start a word
+# ("eps" not inside "steps"); one starting with a symbol ("$1b deal") may start anywhere
+_WORD_START = r"(?:(?<!\w)|(?!\w))"
+
+# A "$" with text after it can never match as the end anchor: it's a dollar amount ("$1b deal")
+_DOLLAR = re.compile(r"(?<!\\)\$(?=[^|)])")
+
+def _compile(keyword: str) -> re.Pattern:
+    pattern = _DOLLAR.sub(r"\\$", keyword)
+    return re.compile(rf"{_WORD_START}(?:{pattern})", re.IGNORECASE)
+
+def _needle(keyword: str) -> Optional[str]:
+    prefix = literal_prefix(keyword)
+    return prefix.lower() if prefix else None
+
+class KeywordMatcher:
+    """
+    Word-boundary aware keyword matcher, compiled once per keyword list.
+
+    Each keyword (a literal phrase or a small regex, e.g. r"why (.*) is moving") gets:
+    - a literal needle (the keyword itself, or a regex's literal prefix, lowercased) checked
+      with C-level substring search on the lowercased text, and
+    - a compiled case-insensitive regex, run only when the needle is present. Matches must
+      start on a word boundary when they start with a word character ("eps" does not fire
+      inside "steps") but may run into a suffix ("report" still matches "reports").
+    The keywords themselves are not lowercased (that would turn r"\\S" into r"\\s"), so
+    `matches()` reports them as written.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = list(dict.fromkeys(k.strip() for k in keywords if k and k.strip()))
+        self._checks: List[Tuple[Optional[str], str, re.Pattern]] = [
+            (_needle(keyword), keyword, _compile(keyword))
+            for keyword in self.keywords
+        ]
+
+    @classmethod
+    def from_file(cls, path: str) -> "KeywordMatcher":
+        """One keyword per line; blank lines and lines starting with '#' are ignored."""
+        lines = Path(path).read_text(encoding="utf-8").splitlines()
+        return cls(line for line in lines if not line.lstrip().startswith("#"))
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def search(self, text: str) -> bool:
+        """True if any keyword occurs in `text`."""
+        text = text.lower()
+        for needle, _, regex in self._checks:
+            if (needle is None or needle in text) and regex.search(text):
+                return True
+        return False
+
+    def matches(self, text: str) -> List[str]:
+        """Keywords found in `text`, in list order."""
+        text = text.lower()
+        return [
+            keyword for needle, keyword, regex in self._checks
+            if (needle is None or needle in text) and regex.search(text)
+        ]
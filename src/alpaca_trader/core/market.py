@@ -5,6 +5,8 @@ from alpaca.trading.enums import AssetClass, AssetStatus
 from alpaca.data.historical import StockHistoricalDataClient
 from alpaca.data.requests import StockLatestQuoteRequest, StockSnapshotRequest
 from alpaca_trader.config.settings import settings
+from alpaca_trader.core.async_market import AsyncMarketService, AsyncRunner
+from alpaca_trader.core.transport import get_transport
 import structlog
 
 logger = structlog.get_logger()
@@ -22,7 +24,40 @@ class MarketService:
             api_key=settings.alpaca_api_key,
             secret_key=settings.alpaca_secret_key
         )
+        # Same endpoints, but returns plain JSON (no per-symbol pydantic parsing)
+        self.raw_data_client = StockHistoricalDataClient(
+            api_key=settings.alpaca_api_key,
+            secret_key=settings.alpaca_secret_key,
+            raw_data=True
+        )
+
+        # One pooled session + request budget shared by every client
+        self.transport = get_transport()
+        for client in (self.trading_client, self.data_client, self.raw_data_client):
+            self.transport.attach(client)
     
+        # Async twin for fan-out work (created on first use)
+        self._aio: Optional[AsyncMarketService] = None
+        self._runner: Optional[AsyncRunner] = None
+
+    @property
+    def aio(self) -> AsyncMarketService:
+        """Asyncio-native market/news/order access over the same transport budget."""
+        if self._aio is None:
+            self._aio = AsyncMarketService(self.transport)
+        return self._aio
+
+    @property
+    def runner(self) -> AsyncRunner:
+        """Shared background event loop (started on first use)."""
+        if self._runner is None:
+            self._runner = AsyncRunner()
+        return self._runner
+
+    def run_async(self, coro):
+        """Run a coroutine on the shared background loop and wait for its result."""
+        return self.runner.run(coro)
+
     def get_clock(self):
         return self.trading_client.get_clock()
 
@@ -41,3 +76,11 @@ class MarketService:
             
         request_params = StockSnapshotRequest(symbol_or_symbols=symbols)
         return self.data_client.get_stock_snapshot(request_params)
+
+    def get_snapshots_raw(self, symbols: List[str]) -> Dict:
+        """Same as `get_snapshots`, but returns the raw JSON payload keyed by symbol."""
+        if not symbols:
+            return {}
+
+        request_params = StockSnapshotRequest(symbol_or_symbols=symbols)
+        return self.raw_data_client.get_stock_snapshot(request_params)
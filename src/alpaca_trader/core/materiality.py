@@ -0,0 +1,141 @@
+import os
+import re
+import zlib
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+import structlog
+from alpaca_trader.config.settings import settings
+
+logger = structlog.get_logger()
+
+_WORDS = re.compile(r"\w+")
+
+def _grams(text: str, ngrams: int) -> List[str]:
+    words = _WORDS.findall(text.lower())
+    grams = list(words)
+    for n in range(2, ngrams + 1):
+        grams.extend(" ".join(words[i:i + n]) for i in range(len(words) - n + 1))
+    return grams
+
+def _hash(grams: List[str], n_bits: int) -> Tuple[np.ndarray, np.ndarray]:
+    # crc32 keeps buckets stable across processes (unlike hash()); top bit is the sign
+    hashes = np.fromiter((zlib.crc32(g.encode()) for g in grams), dtype=np.uint32, count=len(grams))
+    index = (hashes & np.uint32((1 << n_bits) - 1)).astype(np.int64)
+    sign = np.where(hashes & np.uint32(1 << 31), -1.0, 1.0)
+    return index, sign
+
+def featurize(text: str, n_bits: int, ngrams: int = 2) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Hashed word n-gram features of `text` (the hashing trick: no vocabulary to store).
+    Returns (bucket indices, signs).
+    """
+    return _hash(_grams(text, ngrams), n_bits)
+
+def featurize_batch(texts: Sequence[str], n_bits: int, ngrams: int = 2) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sparse design matrix in COO form: (row, column, value) arrays, hashed in one pass."""
+    per_text = [_grams(text, ngrams) for text in texts]
+    rows = np.repeat(np.arange(len(per_text)), [len(g) for g in per_text])
+    cols, vals = _hash([g for grams in per_text for g in grams], n_bits)
+    return rows, cols, vals
+
+class MaterialityModel:
+    """
+    Linear (logistic) classifier over hashed n-gram features: "is this article material?".
+
+    Trained offline (scripts/train_materiality.py) and stored as a small `.npz`
+    (weight vector + bias + hashing parameters). Scoring a batch is one featurize pass
+    plus a gather / bincount over the weight vector.
+    """
+
+    FILENAME = "materiality.npz"
+
+    def __init__(self, weights: np.ndarray, bias: float = 0.0, n_bits: int = 18, ngrams: int = 2,
+                 path: Optional[Path] = None):
+        self.weights = weights
+        self.bias = float(bias)
+        self.n_bits = n_bits
+        self.ngrams = ngrams
+        self.path = path
+
+    @classmethod
+    def default_path(cls) -> Path:
+        if settings.news_materiality_model_path:
+            return Path(settings.news_materiality_model_path)
+        return Path(settings.data_dir) / cls.FILENAME
+
+    @classmethod
+    def open(cls, path: Optional[Path] = None) -> Optional["MaterialityModel"]:
+        """Load the weight file. Returns None if it has not been trained yet."""
+        path = Path(path) if path else cls.default_path()
+        if not path.exists():
+            return None
+        try:
+            with np.load(path) as data:
+                return cls(data["weights"], float(data["bias"]), int(data["n_bits"]), int(data["ngrams"]), path)
+        except Exception as e:
+            logger.error("Materiality model unreadable", path=str(path), error=str(e))
+            return None
+
+    def save(self, path: Optional[Path] = None) -> Path:
+        """Write atomically so a running bot never loads a half-written file."""
+        path = Path(path) if path else self.default_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.stem + ".tmp.npz")
+        np.savez(tmp, weights=self.weights.astype(np.float32), bias=self.bias,
+                 n_bits=self.n_bits, ngrams=self.ngrams)
+        os.replace(tmp, path)
+        self.path = path
+        return path
+
+    def decision(self, texts: Sequence[str]) -> np.ndarray:
+        """Raw linear scores (log-odds) for a batch of texts."""
+        rows, cols, vals = featurize_batch(texts, self.n_bits, self.ngrams)
+        return np.bincount(rows, weights=vals * self.weights[cols], minlength=len(texts)) + self.bias
+
+    def predict_proba(self, texts: Sequence[str]) -> np.ndarray:
+        return 1.0 / (1.0 + np.exp(-self.decision(texts)))
+
+    def predict(self, texts: Sequence[str], threshold: Optional[float] = None) -> np.ndarray:
+        threshold = settings.news_materiality_threshold if threshold is None else threshold
+        return self.predict_proba(texts) >= threshold
+
+    @classmethod
+    def train(cls, texts: Sequence[str], labels: Iterable[int], n_bits: int = 18, ngrams: int = 2,
+              epochs: int = 200, learning_rate: float = 0.1, l2: float = 1e-4) -> "MaterialityModel":
+        """
+        Fit logistic regression with full-batch Adam on the hashed features.
+        Labels are 1 (material) / 0 (not material).
+        """
+        y = np.asarray(list(labels), dtype=np.float64)
+        rows, cols, vals = featurize_batch(texts, n_bits, ngrams)
+        dim, n = 1 << n_bits, len(texts)
+        w, b = np.zeros(dim), 0.0
+        m_w, v_w, m_b, v_b = np.zeros(dim), np.zeros(dim), 0.0, 0.0
+        beta1, beta2, eps = 0.9, 0.999, 1e-8
+
+        for t in range(1, epochs + 1):
+            z = np.bincount(rows, weights=vals * w[cols], minlength=n) + b
+            residual = 1.0 / (1.0 + np.exp(-z)) - y
+            grad_w = np.bincount(cols, weights=vals * residual[rows], minlength=dim) / n + l2 * w
+            grad_b = residual.mean()
+
+            m_w = beta1 * m_w + (1 - beta1) * grad_w
+            v_w = beta2 * v_w + (1 - beta2) * grad_w ** 2
+            m_b = beta1 * m_b + (1 - beta1) * grad_b
+            v_b = beta2 * v_b + (1 - beta2) * grad_b ** 2
+            correction = np.sqrt(1 - beta2 ** t) / (1 - beta1 ** t)
+            w -= learning_rate * correction * m_w / (np.sqrt(v_w) + eps)
+            b -= learning_rate * correction * m_b / (np.sqrt(v_b) + eps)
+
+        return cls(w.astype(np.float32), b, n_bits, ngrams)
+
+def load_classifier() -> Optional[MaterialityModel]:
+    """The trained model when the "model" filter is selected; None means keyword lists."""
+    if settings.news_materiality_filter != "model":
+        return None
+    model = MaterialityModel.open()
+    if model is None:
+        logger.warning("Materiality model not found, falling back to keyword lists",
+                       path=str(MaterialityModel.default_path()))
+    return model
@@ -1,7 +1,13 @@
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-import re
-from textblob import TextBlob
+from typing import Iterable, List, Optional
+import numpy as np
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.dedup import DedupStore
+from alpaca_trader.core.keywords import KeywordMatcher
+from alpaca_trader.core.materiality import load_classifier
+from alpaca_trader.core.news_archive import NewsArchive
+from alpaca_trader.core.sentiment import get_backend
 from alpaca_trader.models.asset import Asset
 import structlog
 from pydantic import BaseModel
@@ -51,8 +57,36 @@ class NewsEngine:
         r"why (.*) is moving", r"upgrade", r"downgrade", r"rating"
     ]
 
-    def __init__(self):
-        self._cache_seen_headlines: Dict[str, datetime] = {}
+    def __init__(self, archive: Optional[NewsArchive] = None):
+        # Seen articles (by ID and near-duplicate headline), expiring after news_dedup_ttl_hours
+        self.dedup = DedupStore()
+        # Polarity scorer (settings.sentiment_backend), memoized per distinct text
+        self.sentiment = get_backend()
+        # Each list compiled once into a single-pass matcher
+        self.material = self._matcher(settings.news_allowed_keywords_file, self.ALLOWED_KEYWORDS)
+        self.banned = self._matcher(settings.news_banned_keywords_file, self.BANNED_KEYWORDS)
+        # Trained materiality model (news_materiality_filter="model"); None -> keyword lists
+        self.classifier = load_classifier()
+        # Processed articles + verdicts (warm restarts, replay); None = in-memory only
+        self.archive = archive
+        if archive is not None:
+            self.warm_start()
+
+    @staticmethod
+    def _matcher(path: Optional[str], default: List[str]) -> KeywordMatcher:
+        if path:
+            try:
+                return KeywordMatcher.from_file(path)
+            except OSError as e:
+                logger.error("Keyword file unreadable, using built-in list", path=path, error=str(e))
+        return KeywordMatcher(default)
+
+    def load_keywords(self, allowed: Optional[Iterable[str]] = None, banned: Optional[Iterable[str]] = None):
+        """Swap in new keyword lists at runtime (None keeps the current list)."""
+        if allowed is not None:
+            self.material = KeywordMatcher(allowed)
+        if banned is not None:
+            self.banned = KeywordMatcher(banned)
 
     def process_article(self, article: NewsArticle) -> Optional[NewsArticle]:
         """
@@ -61,6 +95,7 @@ class NewsEngine:
         2. Deduplicate.
         3. Filter (Allow/Ban lists).
         4. Analyze Sentiment.
+        Outcomes past dedup are recorded in the archive, if one is attached.
         """
         
         # 1. Freshness
@@ -68,50 +103,74 @@ class NewsEngine:
             logger.debug("News dropped: Too old", id=article.id)
             return None
 
-        # 2. Deduplication (Exact headline match within 48h window)
-        # Note: Ideally usage of fuzz or checking ID.
-        if article.headline in self._cache_seen_headlines:
-            logger.debug("News dropped: Duplicate", headline=article.headline)
+        # 2. Deduplication (Article ID or rewritten headline within the TTL window), per symbol
+        # so a multi-ticker article yields one signal per ticker
+        reason = self.dedup.check(f"{article.symbol}:{article.id}", article.headline, scope=article.symbol)
+        if reason:
+            logger.debug("News dropped: Duplicate", reason=reason, headline=article.headline)
             return None
-        self._cache_seen_headlines[article.headline] = datetime.now()
 
         # 3. Content Filters
         text_body = f"{article.headline} {article.summary or ''}".lower()
         
         if self._is_banned(text_body):
-            logger.debug("News dropped: Banned Content", headline=article.headline)
+            logger.debug("News dropped: Banned Content", headline=article.headline,
+                         matched=self.banned.matches(text_body))
+            self._archive(article, "banned")
             return None
             
         if not self._is_material(text_body):
             logger.debug("News dropped: Not Material", headline=article.headline)
+            self._archive(article, "not_material")
             return None
 
         # 4. Sentiment Analysis
-        # Using simple TextBlob for MVP. 
         # Polarity: -1.0 (Negative) to 1.0 (Positive)
-        blob = TextBlob(text_body)
-        sentiment = blob.sentiment.polarity
+        sentiment = self.sentiment.score(text_body)
         
         article.sentiment_score = sentiment
         
         if sentiment < 0.2: # Simple threshold, can tune later
             logger.debug("News dropped: Low Sentiment", score=sentiment)
+            self._archive(article, "low_sentiment", sentiment)
             return None
 
+        self._archive(article, "signal", sentiment)
         return article
 
+    def _archive(self, article: NewsArticle, verdict: str, sentiment: Optional[float] = None):
+        if self.archive is None:
+            return
+        try:
+            signature = self.dedup.signature(f"{article.symbol}:{article.id}")
+            self.archive.record(article, verdict, sentiment, signature)
+        except Exception as e:
+            logger.error("News archive write failed", id=article.id, error=str(e))
+
+    def warm_start(self) -> int:
+        """Reload the seen-set for the dedup window from the archive. Returns articles loaded."""
+        rows = self.archive.recent(since=time.time() - self.dedup.ttl)
+        for symbol, article_id, headline, processed_at, signature in rows:
+            if signature is not None:
+                self.dedup.restore(f"{symbol}:{article_id}", signature, scope=symbol, now=processed_at)
+            else:
+                self.dedup.add(f"{symbol}:{article_id}", headline, scope=symbol, now=processed_at)
+        if rows:
+            logger.info("News seen-set restored", articles=len(rows), path=str(self.archive.path))
+        return len(rows)
+
     def _is_material(self, text: str) -> bool:
-        """Check if text contains any allowed keywords."""
-        text = text.lower()
-        for pattern in self.ALLOWED_KEYWORDS:
-            if re.search(pattern, text):
-                return True
-        return False
+        """Materiality via the trained classifier if loaded, else the allowed keywords."""
+        if self.classifier is not None:
+            return bool(self.classifier.predict([text])[0])
+        return self.material.search(text)
+
+    def material_mask(self, texts: List[str]) -> np.ndarray:
+        """Materiality for a batch of texts (one classifier pass, or the keyword lists)."""
+        if self.classifier is not None:
+            return self.classifier.predict(texts)
+        return np.array([self.material.search(text) for text in texts], dtype=bool)
 
     def _is_banned(self, text: str) -> bool:
         """Check if text contains any banned keywords."""
-        text = text.lower()
-        for pattern in self.BANNED_KEYWORDS:
-            if re.search(pattern, text):
-                return True
-        return False
+        return self.banned.search(text)
@@ -0,0 +1,153 @@
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+import numpy as np
+from alpaca_trader.config.settings import settings
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    symbol       TEXT NOT NULL,
+    id           TEXT NOT NULL,
+    created_at   REAL NOT NULL,  -- epoch seconds (UTC)
+    processed_at REAL NOT NULL,
+    headline     TEXT NOT NULL,
+    summary      TEXT,
+    source       TEXT,
+    url          TEXT,
+    sentiment    REAL,           -- NULL when dropped before scoring
+    verdict      TEXT NOT NULL,  -- "signal" or the drop reason
+    signature    BLOB,           -- headline MinHash (core/dedup.py), restored without re-hashing
+    PRIMARY KEY (symbol, id)
+);
+CREATE INDEX IF NOT EXISTS articles_processed ON articles (processed_at);
+CREATE INDEX IF NOT EXISTS articles_created ON articles (created_at);
+CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+class NewsArchive:
+    """
+    Embedded SQLite archive of processed news: one row per (symbol, article) with its
+    sentiment score and verdict, plus the ingestion watermark.
+
+    - Warm restarts: `recent()` reloads the seen-set for the dedup window in one indexed
+      query and `watermark()` tells the poller / stream where to resume, so nothing is
+      re-scored or traded twice.
+    - Replay / backtests: `articles()` returns rows in publication order, in the raw
+      Alpaca article shape (what `NewsReplayServer.publish` and `AlpacaBot.handle_news_item`
+      take).
+
+    The file is created on the first write (WAL journal; safe to read while the bot runs).
+    """
+
+    FILENAME = "news.sqlite3"
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else self.default_path()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default_path(cls) -> Path:
+        if settings.news_archive_path:
+            return Path(settings.news_archive_path)
+        return Path(settings.data_dir) / cls.FILENAME
+
+    def _connect(self, create: bool) -> Optional[sqlite3.Connection]:
+        if self._conn is None:
+            if not create and not self.path.exists():
+                return None
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Handlers run on scheduler / executor threads; access is serialized by _lock
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def record(self, article, verdict: str, sentiment: Optional[float] = None,
+               signature: Optional[np.ndarray] = None, processed_at: Optional[float] = None):
+        """Store the outcome for one NewsArticle candidate (replacing an earlier one)."""
+        blob = signature.astype(np.uint32).tobytes() if signature is not None else None
+        with self._lock:
+            conn = self._connect(create=True)
+            conn.execute(
+                "INSERT OR REPLACE INTO articles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (article.symbol, article.id, article.created_at.timestamp(), processed_at or time.time(),
+                 article.headline, article.summary, article.source, article.url, sentiment, verdict, blob)
+            )
+            conn.commit()
+
+    def recent(self, since: float) -> List[tuple]:
+        """
+        (symbol, id, headline, processed_at, signature) processed at or after `since`,
+        oldest first. `signature` is a uint32 array, or None if it was not stored.
+        """
+        with self._lock:
+            conn = self._connect(create=False)
+            if conn is None:
+                return []
+            rows = conn.execute(
+                "SELECT symbol, id, headline, processed_at, signature FROM articles "
+                "WHERE processed_at >= ? ORDER BY processed_at", (since,)
+            ).fetchall()
+        return [
+            (symbol, article_id, headline, processed_at, np.frombuffer(blob, dtype=np.uint32) if blob else None)
+            for symbol, article_id, headline, processed_at, blob in rows
+        ]
+
+    def watermark(self) -> Optional[datetime]:
+        with self._lock:
+            conn = self._connect(create=False)
+            if conn is None:
+                return None
+            row = conn.execute("SELECT value FROM state WHERE key = 'watermark'").fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def set_watermark(self, watermark: datetime):
+        """Persist the ingestion watermark (never moves backwards)."""
+        current = self.watermark()
+        if current is not None and current >= watermark:
+            return
+        with self._lock:
+            conn = self._connect(create=True)
+            conn.execute("INSERT OR REPLACE INTO state VALUES ('watermark', ?)",
+                         (watermark.astimezone(timezone.utc).isoformat(),))
+            conn.commit()
+
+    def articles(self, symbol: Optional[str] = None, start: Optional[datetime] = None,
+                 end: Optional[datetime] = None, verdict: Optional[str] = None) -> List[dict]:
+        """Archived articles published in [start, end), oldest first, as raw article dicts."""
+        clauses, params = [], []
+        for clause, value in (("symbol = ?", symbol), ("created_at >= ?", start and start.timestamp()),
+                              ("created_at < ?", end and end.timestamp()), ("verdict = ?", verdict)):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            conn = self._connect(create=False)
+            if conn is None:
+                return []
+            rows = conn.execute(
+                "SELECT symbol, id, created_at, headline, summary, source, url, sentiment, verdict "
+                f"FROM articles{where} ORDER BY created_at, id", params
+            ).fetchall()
+
+        return [
+            {
+                "id": article_id, "symbols": [sym], "headline": headline, "summary": summary,
+                "source": source, "url": url, "sentiment": sentiment, "verdict": row_verdict,
+                "created_at": datetime.fromtimestamp(created_at, timezone.utc).isoformat().replace("+00:00", "Z"),
+            }
+            for sym, article_id, created_at, headline, summary, source, url, sentiment, row_verdict in rows
+        ]
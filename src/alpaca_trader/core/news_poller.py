@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Set
+import structlog
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.stream import parse_time
+
+logger = structlog.get_logger()
+
+class NewsPoller:
+    """
+    Incremental REST news polling with a cursor taken from the data, not the clock.
+
+    Each `poll()` asks for everything published since the watermark, oldest first,
+    and follows `next_page_token` until the pages run out (or `news_poll_max_pages`,
+    in which case the next poll resumes from where this one stopped). The watermark
+    only advances to the newest `created_at` actually received, so articles published
+    while a request is in flight are picked up next time. `start` is inclusive: the
+    IDs seen at the watermark timestamp are remembered and skipped on the next poll.
+
+    Works on raw JSON (`client.get`), so a busy page costs no per-article model parsing.
+    """
+
+    def __init__(self, client, watermark: Optional[datetime] = None, include_content: Optional[bool] = None):
+        self.client = client
+        lookback = timedelta(minutes=settings.news_stream_lookback_minutes)
+        self.watermark = watermark or datetime.now(timezone.utc) - lookback
+        self.include_content = settings.news_include_content if include_content is None else include_content
+        self._at_watermark: Set[str] = set()
+        self.stats = {"polls": 0, "requests": 0, "articles": 0}
+
+    def _params(self, start: datetime, page_token: Optional[str]) -> dict:
+        params = {
+            "start": start.astimezone(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "sort": "asc",
+            "limit": settings.news_poll_page_size,
+        }
+        # Article bodies are large and only needed by consumers that read them
+        if self.include_content:
+            params["include_content"] = "true"
+        if page_token:
+            params["page_token"] = page_token
+        return params
+
+    def poll(self) -> List[dict]:
+        """New articles since the last poll, oldest first."""
+        self.stats["polls"] += 1
+        articles: List[dict] = []
+        page_token: Optional[str] = None
+        start = self.watermark # Fixed for the whole page chain
+
+        for _ in range(settings.news_poll_max_pages):
+            page = self.client.get("/news", self._params(start, page_token)) or {}
+            self.stats["requests"] += 1
+            for item in page.get("news") or []:
+                article_id = str(item.get("id"))
+                if article_id in self._at_watermark:
+                    continue
+                articles.append(item)
+                created_at = parse_time(item.get("created_at"))
+                if created_at is None:
+                    continue
+                if created_at > self.watermark:
+                    self.watermark = created_at
+                    self._at_watermark = {article_id}
+                elif created_at == self.watermark:
+                    self._at_watermark.add(article_id)
+
+            page_token = page.get("next_page_token")
+            if not page_token:
+                break
+        else:
+            logger.warning("News poll page limit reached, resuming next poll",
+                           pages=settings.news_poll_max_pages, watermark=self.watermark.isoformat())
+
+        self.stats["articles"] += len(articles)
+        return articles
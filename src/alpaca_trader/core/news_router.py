@@ -0,0 +1,70 @@
+from datetime import datetime, timezone
+from typing import Any, Iterable, List, NamedTuple, Optional, Tuple
+import structlog
+from alpaca_trader.core.news import NewsArticle
+from alpaca_trader.core.stream import parse_time
+
+logger = structlog.get_logger()
+
+class NewsRecord(NamedTuple):
+    """One incoming article, normalized once (raw JSON dict or alpaca `News` model)."""
+    id: str
+    headline: str
+    summary: str
+    source: str
+    url: Optional[str]
+    created_at: datetime
+    symbols: Tuple[str, ...]
+
+def _symbols(item: Any) -> Tuple[str, ...]:
+    symbols = item.get("symbols") if isinstance(item, dict) else getattr(item, "symbols", None)
+    return tuple(symbols or ())
+
+def normalize(item: Any) -> NewsRecord:
+    get = item.get if isinstance(item, dict) else lambda field, default=None: getattr(item, field, default)
+    return NewsRecord(
+        id=str(get("id")),
+        headline=get("headline") or "No Headline",
+        summary=get("summary") or "",
+        source=get("source") or "Unknown",
+        url=get("url"),
+        created_at=parse_time(get("created_at")) or datetime.now(timezone.utc),
+        symbols=_symbols(item),
+    )
+
+class NewsRouter:
+    """
+    First stage of news ingestion: which watched symbols does an article concern?
+
+    Only the article's symbol list is read until it hits the watchlist index, so
+    irrelevant articles (the vast majority of the feed) cost one set lookup per ticker:
+    no normalization, no model, no logging. A relevant article is normalized once and
+    fanned out into one `NewsArticle` candidate per watched symbol it mentions.
+    """
+
+    def __init__(self, watchlist: Iterable[str] = ()):
+        self.index = frozenset(watchlist)
+        self.stats = {"routed": 0, "ignored": 0, "candidates": 0}
+
+    def update(self, watchlist: Iterable[str]):
+        self.index = frozenset(watchlist)
+
+    def route(self, item: Any) -> List[NewsArticle]:
+        """Signal candidates for `item`, one per watched symbol (in the article's order)."""
+        index = self.index
+        matched = [s for s in dict.fromkeys(_symbols(item)) if s in index]
+        if not matched:
+            self.stats["ignored"] += 1
+            return []
+
+        record = normalize(item)
+        self.stats["routed"] += 1
+        self.stats["candidates"] += len(matched)
+        # Fields are already typed, so skip pydantic validation per candidate
+        return [
+            NewsArticle.model_construct(
+                id=record.id, headline=record.headline, symbol=symbol, source=record.source,
+                url=record.url, created_at=record.created_at, summary=record.summary
+            )
+            for symbol in matched
+        ]
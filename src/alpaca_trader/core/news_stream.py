@@ -0,0 +1,133 @@
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Iterable, Optional
+import aiohttp
+import structlog
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.async_market import AsyncMarketService
+from alpaca_trader.core.stream import WebSocketStream, dispatch, parse_time
+
+logger = structlog.get_logger()
+
+RECENT_IDS = 2000 # Delivered article IDs remembered to drop stream / REST overlap
+
+class NewsStream(WebSocketStream):
+    """
+    Real-time news from Alpaca's news WebSocket, handed to `on_article` as raw article
+    dicts (the same shape the REST endpoint returns).
+
+    - JSON protocol: "connected" greeting, auth, subscribe, then {"T": "n", ...} messages.
+    - After every (re)connect, once subscribed, articles published since the newest one
+      received are fetched over REST, so a disconnect never loses news. The first connect
+      starts at `watermark` (a previous run's, restored) or `lookback_minutes` before start.
+      Recently delivered IDs are remembered, so overlap between the fill and the stream is
+      delivered once.
+    - Reconnects / handler dispatch as in `WebSocketStream`.
+    """
+
+    name = "News stream"
+
+    def __init__(self, on_article: Callable[[dict], Any], market: Optional[AsyncMarketService] = None,
+                 symbols: Iterable[str] = ("*",), url: Optional[str] = None,
+                 lookback_minutes: Optional[int] = None, watermark: Optional[datetime] = None):
+        super().__init__(url or settings.news_stream_url)
+        self.on_article = on_article
+        self.market = market
+        self.symbols = list(symbols)
+        lookback = lookback_minutes if lookback_minutes is not None else settings.news_stream_lookback_minutes
+        # Newest created_at delivered; gap fills start here (a restored `watermark` resumes a previous run)
+        self.watermark = watermark or datetime.now(timezone.utc) - timedelta(minutes=lookback)
+
+        self.stats.update({"articles": 0, "gap_filled": 0, "latency_sum": 0.0, "latency_max": 0.0})
+        self._recent: "OrderedDict[str, None]" = OrderedDict()
+
+    def latency(self) -> dict:
+        """Publication -> receipt delay of articles pushed by the stream (not gap fills)."""
+        live = self.stats["articles"] - self.stats["gap_filled"]
+        return {
+            "articles": live,
+            "avg_ms": round(1000 * self.stats["latency_sum"] / live, 1) if live else 0.0,
+            "max_ms": round(1000 * self.stats["latency_max"], 1),
+        }
+
+    async def _handshake(self, ws: aiohttp.ClientWebSocketResponse):
+        """Greeting -> auth -> subscribe. Raises ValueError on auth / subscription errors."""
+        await self._data_auth(ws)
+
+        await ws.send_json({"action": "subscribe", "news": self.symbols})
+        reply = (await self._receive(ws))[0]
+        if reply.get("T") == "error":
+            raise ValueError(f"News stream subscribe failed: {reply.get('msg', reply)}")
+
+    async def _on_connected(self):
+        await self._fill_gap()
+
+    async def _handle(self, message: list):
+        for item in message:
+            kind = item.get("T")
+            if kind == "n":
+                await self._deliver(item, live=True)
+            elif kind == "error":
+                logger.error("News stream error", code=item.get("code"), msg=item.get("msg"))
+
+    async def _fill_gap(self):
+        """
+        REST fetch of everything published since the watermark, oldest first. A fetch
+        that comes back full resumes from the advanced watermark (the inclusive overlap is
+        dropped as already delivered), so a gap larger than `news_stream_gap_limit` is
+        filled in several fetches rather than losing its oldest part.
+        """
+        if self.market is None:
+            return
+        since = self.watermark
+        limit = settings.news_stream_gap_limit
+        delivered = 0
+        while True:
+            try:
+                items = await self.market.get_news(
+                    start=self.watermark,
+                    symbols=None if "*" in self.symbols else self.symbols,
+                    limit=limit,
+                    sort="asc"
+                )
+            except Exception as e:
+                # The watermark only covers what was delivered: the next connect resumes here
+                logger.error("News gap fill failed", since=self.watermark.isoformat(), error=str(e))
+                break
+
+            fresh = 0
+            for item in items:
+                fresh += await self._deliver(item, live=False)
+            delivered += fresh
+            # Short fetch: caught up. Nothing new: a full fetch of one timestamp, stop
+            if len(items) < limit or not fresh:
+                break
+        if delivered:
+            logger.info("News gap filled", since=since.isoformat(), articles=delivered)
+
+    async def _deliver(self, item: dict, live: bool) -> bool:
+        article_id = str(item.get("id"))
+        if article_id in self._recent:
+            return False
+        self._recent[article_id] = None
+        if len(self._recent) > RECENT_IDS:
+            self._recent.popitem(last=False)
+
+        created_at = parse_time(item.get("created_at"))
+        if live and created_at is not None:
+            latency = max(time.time() - created_at.timestamp(), 0.0)
+            self.stats["latency_sum"] += latency
+            self.stats["latency_max"] = max(self.stats["latency_max"], latency)
+        self.stats["articles"] += 1
+        if not live:
+            self.stats["gap_filled"] += 1
+
+        try:
+            await dispatch(self.on_article, item)
+        except Exception as e:
+            logger.exception("News handler failed", id=article_id, error=str(e))
+        # Advanced only once handled, so a persisted watermark never skips unprocessed news
+        if created_at is not None:
+            self.watermark = max(self.watermark, created_at)
+        return True
@@ -0,0 +1,153 @@
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, NamedTuple, Optional, Set
+import structlog
+from alpaca.trading.client import TradingClient
+from alpaca_trader.config.settings import settings
+
+logger = structlog.get_logger()
+
+ENTRY = "entry"
+EXIT = "exit"
+TRIM = "trim" # Partial exit
+STOP = "stop" # Broker-side protective order (placed directly, not tracked here)
+TERMINAL_EVENTS = ("fill", "canceled", "expired", "rejected", "done_for_day")
+ORDER_DONE = ("canceled", "filled", "expired", "rejected", "replaced", "done_for_day") # Order.status values
+
+def new_client_order_id(intent: str, symbol: str) -> str:
+    """Unique per order and fixed across the transport's retries (the broker dedups on it)."""
+    return f"{intent}-{symbol}-{uuid.uuid4().hex[:16]}"
+
+class InFlightOrder(NamedTuple):
+    symbol: str
+    intent: str
+    client_order_id: str
+    submitted_at: float # time.monotonic()
+
+class OrderRouter:
+    """
+    Concurrent order submission with an in-flight registry per symbol.
+
+    - `submit()` runs `send(client_order_id)` on a small thread pool, so a burst of
+      signals / exits goes out in parallel instead of one blocking call at a time.
+    - At most one order per (symbol, intent) is in flight: a second entry or exit for
+      the same symbol is suppressed until the first reaches a terminal trade-update
+      event (`complete()`) or fails. After `order_inflight_timeout` without one (stream
+      down) the broker is asked: a slot is only released once the order is done there.
+    - Every order carries a fresh client_order_id, and the transport's retries resend
+      the same request body, so a retried POST the broker already accepted is rejected
+      as a duplicate instead of doubling the order; that case resolves to the original.
+    """
+
+    def __init__(self, client: TradingClient, workers: Optional[int] = None):
+        self.client = client
+        self.stats = {"submitted": 0, "suppressed": 0, "failed": 0}
+        self._orders: Dict[str, InFlightOrder] = {} # client_order_id -> order
+        # Terminal events that beat the submit response (ids we didn't know yet)
+        self._ended = deque(maxlen=256)
+        self._futures: Set[Future] = set()
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers or settings.order_router_workers,
+                                        thread_name_prefix="orders")
+
+    def in_flight(self, symbol: str, intent: Optional[str] = None) -> Optional[InFlightOrder]:
+        """The live order for `symbol` (and `intent`), if any."""
+        self._expire()
+        with self._lock:
+            for order in self._orders.values():
+                if order.symbol == symbol and (intent is None or order.intent == intent):
+                    return order
+        return None
+
+    def submit(self, symbol: str, intent: str, send: Callable[[str], Any]) -> Optional[Future]:
+        """
+        Queue `send(client_order_id)` (returns the alpaca `Order`). Returns a future of the
+        order (None if it failed, already logged), or None when suppressed as a duplicate.
+        """
+        self._expire()
+        with self._lock:
+            if any(o.symbol == symbol and o.intent == intent for o in self._orders.values()):
+                self.stats["suppressed"] += 1
+                logger.info("Duplicate Order Suppressed", symbol=symbol, intent=intent)
+                return None
+            client_order_id = new_client_order_id(intent, symbol)
+            self._orders[client_order_id] = InFlightOrder(symbol, intent, client_order_id, time.monotonic())
+        future = self._pool.submit(self._run, client_order_id, send)
+        self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+        return future
+
+    def complete(self, client_order_id: Optional[str], event: str) -> Optional[InFlightOrder]:
+        """Trade-update hook: release the slot on a terminal event. Returns the order."""
+        if event not in TERMINAL_EVENTS or not client_order_id:
+            return None
+        with self._lock:
+            order = self._orders.pop(client_order_id, None)
+            if order is None:
+                self._ended.append(client_order_id)
+            return order
+
+    def wait(self, timeout: Optional[float] = None):
+        """Block until every queued submission has run (tests, shutdown)."""
+        wait(list(self._futures), timeout)
+
+    def close(self):
+        self._pool.shutdown(wait=True)
+
+    def _run(self, client_order_id: str, send: Callable[[str], Any]) -> Any:
+        try:
+            order = send(client_order_id)
+            self.stats["submitted"] += 1
+            self._rekey(client_order_id, getattr(order, "client_order_id", None))
+            return order
+        except Exception as e:
+            existing = self._lookup(client_order_id)
+            if existing is not None:
+                # A retry of a request the broker had already accepted
+                self.stats["submitted"] += 1
+                return existing
+            with self._lock:
+                order = self._orders.pop(client_order_id, None)
+            self.stats["failed"] += 1
+            logger.error("Order Failed", symbol=order.symbol if order else None,
+                         intent=order.intent if order else None, error=str(e))
+            return None
+
+    def _rekey(self, client_order_id: str, broker_id: Any):
+        """Track the order under the id the broker assigned (`close_position` can't take ours)."""
+        if not isinstance(broker_id, str) or broker_id == client_order_id:
+            return
+        with self._lock:
+            order = self._orders.pop(client_order_id, None)
+            if order is not None and broker_id not in self._ended:
+                self._orders[broker_id] = order._replace(client_order_id=broker_id)
+
+    def _lookup(self, client_order_id: str) -> Any:
+        try:
+            return self.client.get_order_by_client_id(client_order_id)
+        except Exception:
+            return None
+
+    def _expire(self):
+        """
+        Re-check slots whose terminal event never came (trade stream down / disabled):
+        an order still open at the broker keeps its slot for another timeout, one that
+        is done (or unknown) releases it. Lookups run outside the lock.
+        """
+        cutoff = time.monotonic() - settings.order_inflight_timeout
+        with self._lock:
+            stale = [k for k, o in self._orders.items() if o.submitted_at < cutoff]
+        for key in stale:
+            order = self._lookup(key)
+            status = getattr(order, "status", None)
+            done = order is None or str(getattr(status, "value", status)) in ORDER_DONE
+            with self._lock:
+                if key not in self._orders:
+                    continue
+                if done:
+                    del self._orders[key]
+                else:
+                    self._orders[key] = self._orders[key]._replace(submitted_at=time.monotonic())
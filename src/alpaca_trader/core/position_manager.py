@@ -1,14 +1,36 @@
-from datetime import datetime, timedelta
-from decimal import Decimal
-from typing import Optional
-from pydantic import BaseModel, Field
+import threading
+import time
+from datetime import datetime
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+import numpy as np
+from pydantic import BaseModel
 import structlog
 from alpaca.trading.client import TradingClient
-from alpaca.trading.requests import MarketOrderRequest, OrderSide, TimeInForce
-from alpaca_trader.core.technicals import Technicals
+from alpaca.trading.enums import QueryOrderStatus
+from alpaca.trading.requests import (
+    GetOrdersRequest, MarketOrderRequest, OrderSide, StopOrderRequest, TimeInForce, TrailingStopOrderRequest
+)
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.exit_rules import ExitDecision, ExitRules, PositionFrame
+from alpaca_trader.core.order_router import ENTRY, EXIT, ORDER_DONE, STOP, TRIM, OrderRouter, new_client_order_id
+from alpaca_trader.core.stream import parse_time
+from alpaca_trader.core.technicals import TechnicalSignals, Technicals
+from alpaca_trader.core.transport import Priority, request_priority
 
 logger = structlog.get_logger()
 
+PROTECTIVE_TYPES = ("stop", "trailing_stop")
+OPEN_ORDERS_LIMIT = 500 # Max page size of GET /v2/orders
+
+def _value(field: Any) -> str:
+    """Alpaca enum or plain string -> its string value."""
+    return str(getattr(field, "value", field))
+
+def _stop_price(price: float) -> float:
+    """Alpaca's price increments: cents at $1 and up, 1/100 cent below."""
+    return round(price, 2 if price >= 1.0 else 4)
+
 class TradeState(BaseModel):
     symbol: str
     entry_price: float
@@ -17,161 +39,457 @@ class TradeState(BaseModel):
     max_price: float
     tier1_sold: bool = False
     is_active: bool = True
+    # Open broker-side stop / trailing stop guarding the position (protective order mode)
+    stop_order_id: Optional[str] = None
+    # time.monotonic() the latest fill was applied (a positions fetch older than this is stale)
+    last_fill_at: Optional[float] = None
 
 class PositionManager:
     """
-    Manages the lifecycle of active trades:
+    Manages the lifecycle of active trades. Exits follow the declarative rules in
+    `settings.exit_rules` (core/exit_rules.py):
     - Safety Nets (`stale_timer`, `hard_stop`)
-    - Profit Taking (`tier1`, `runner`)
-    - Emergency Exits
+    - Profit Taking (`tier1`, `runner_trailing_stop`)
+    - Emergency Exits (`rsi_overheat`, `volume_exhaustion`)
+    With `protective_orders_enabled`, the hard stop and the runner's trailing stop are
+    resting broker-side orders instead, so they hold even if the bot is down.
     """
     def __init__(self, trading_client: TradingClient, technicals: Technicals):
         self.client = trading_client
         self.tech = technicals
         self.trades: dict[str, TradeState] = {}
+        # Orders submitted and not yet filled / ended, at most one entry and one exit per symbol
+        self.orders = OrderRouter(trading_client)
+        self.exit_rules = ExitRules()
+        # Trade updates arrive on the stream's executor thread, polling on the scheduler's
+        self._lock = threading.RLock()
+        # Called with the held symbols whenever they change (the price stream's subscription)
+        self.on_held_change: Optional[Callable[[Set[str]], Any]] = None
+        self._protecting: Set[str] = set()
+        self._tick_exit_at: Dict[str, float] = {}
 
-    def open_position(self, symbol: str, amount_usd: float = 1000.0) -> bool:
-        """Enter a new position."""
-        try:
-            # Get current price for estimating qty (Alpaca calc handles this too but good for logs)
-            quote = self.client.get_latest_quote(symbol) # Note: requires DataClient, using simple market order
-            # Actually simpler: Use Notional amount
-            
+    def can_enter(self, symbol: str) -> bool:
+        """Not held and no entry order in flight (two articles, one position)."""
+        state = self.trades.get(symbol)
+        held = state is not None and state.is_active
+        return not held and self.orders.in_flight(symbol, ENTRY) is None
+
+    def open_position(self, symbol: str, amount_usd: float = 1000.0) -> Optional[Future]:
+        """
+        Enter a new position (notional market order, submitted by the order router).
+        Returns the future of the order, or None if the symbol is held / being entered.
+        """
+        if not self.can_enter(symbol):
+            logger.info("Entry Skipped: already held or pending", symbol=symbol)
+            return None
+
+        def send(client_order_id: str):
             req = MarketOrderRequest(
                 symbol=symbol,
                 notional=amount_usd,
                 side=OrderSide.BUY,
-                time_in_force=TimeInForce.DAY
+                time_in_force=TimeInForce.DAY,
+                client_order_id=client_order_id
             )
-            order = self.client.submit_order(req)
+            with request_priority(Priority.ORDER):
+                order = self.client.submit_order(req)
             logger.info("Entry Order Submitted", symbol=symbol, id=order.id)
-            
-            # We need the fill price. For MVP assuming immediate fill or polling.
-            # IN PRODUCTION: Listen to trade updates via WebSocket.
-            # HERE: We create a placeholder state. We'll update it on next tick/poll if position exists.
-            
-            # For simplicity in MVP sync flow, we'll verify position existence in the update loop.
-            return True
-        except Exception as e:
-            logger.error("Failed to open position", symbol=symbol, error=str(e))
-            return False
+            return order
 
-    def update_trades(self):
+        # TradeState is created from the fill event on the trade-updates stream
+        # (`handle_trade_update`); `reconcile` picks it up if the stream missed it.
+        return self.orders.submit(symbol, ENTRY, send)
+
+    def handle_trade_update(self, update: dict):
         """
-        Main Loop: Check all active trades against rules.
-        Should be called every minute.
+        Apply one trade-updates event to TradeState, with the exact execution price / time:
+        - buy fill / partial_fill: open the trade, or fold the fill into it (average price)
+        - sell fill / partial_fill: shrink the trade, drop it once the position is flat
+        - fill / canceled / expired / rejected: release the order's in-flight slot
+        - events of the protective order: fill / cancel clear it, replace follows it
+        With protective orders on, a completed entry gets its broker-side stop.
+        """
+        event = update.get("event")
+        order = update.get("order") or {}
+        symbol = order.get("symbol")
+        if not symbol:
+            return
+
+        protect = False
+        with self._lock:
+            self._protective_event(symbol, event, order)
+            if event in ("fill", "partial_fill"):
+                price = float(update.get("price") or order.get("filled_avg_price") or 0.0)
+                fill_qty = float(update.get("qty") or 0.0)
+                position_qty = update.get("position_qty")
+                # Naive local time, like the datetime.now() the stale timer compares against
+                filled_at = parse_time(update.get("timestamp"))
+                filled_at = filled_at.astimezone().replace(tzinfo=None) if filled_at else datetime.now()
+
+                if order.get("side") == "buy":
+                    self._entry_fill(symbol, price, fill_qty, position_qty, filled_at)
+                else:
+                    self._exit_fill(symbol, position_qty)
+                protect = event == "fill" and order.get("side") == "buy"
+
+            ended = self.orders.complete(order.get("client_order_id"), event)
+            if ended is not None and ended.intent == ENTRY and event != "fill":
+                logger.warning("Entry Order Ended", symbol=symbol, status=event,
+                               filled_qty=order.get("filled_qty"))
+                # Partially filled entries still need their stop
+                protect = symbol in self.trades
+
+        if protect and settings.protective_orders_enabled:
+            self._protect(symbol)
+
+    def _protective_event(self, symbol: str, event: str, order: dict):
+        state = self.trades.get(symbol)
+        if state is None or state.stop_order_id is None or str(order.get("id")) != state.stop_order_id:
+            return
+        if event == "replaced":
+            state.stop_order_id = order.get("replaced_by")
+        elif event == "fill":
+            state.stop_order_id = None
+            logger.info("Protective Order Filled", symbol=symbol, type=order.get("type"),
+                        price=order.get("filled_avg_price"))
+        elif event in ("canceled", "expired", "rejected"):
+            # Not ours (we forget the id before cancelling); re-placed by the next reconcile
+            state.stop_order_id = None
+            logger.warning("Protective Order Ended", symbol=symbol, status=event)
+
+    def _entry_fill(self, symbol: str, price: float, fill_qty: float, position_qty, filled_at: datetime):
+        state = self.trades.get(symbol)
+        qty = float(position_qty) if position_qty is not None else (state.qty if state else 0.0) + fill_qty
+        if state is None or not state.is_active:
+            self.trades[symbol] = TradeState(
+                symbol=symbol, entry_price=price, entry_time=filled_at, qty=qty, max_price=price,
+                last_fill_at=time.monotonic()
+            )
+            logger.info("Tracking New Position", symbol=symbol, entry=price, qty=qty, filled_at=str(filled_at))
+            self._held_changed()
+            return
+        # Later partial fill (or add-on): volume-weighted entry, clock keeps the first fill
+        held = max(qty - fill_qty, 0.0)
+        state.entry_price = (state.entry_price * held + price * fill_qty) / qty if qty else price
+        state.qty = qty
+        state.max_price = max(state.max_price, price)
+        state.last_fill_at = time.monotonic()
+
+    def _exit_fill(self, symbol: str, position_qty):
+        state = self.trades.get(symbol)
+        if state is None or position_qty is None:
+            return
+        state.qty = float(position_qty)
+        state.last_fill_at = time.monotonic()
+        if state.qty <= 0:
+            self.trades.pop(symbol, None)
+            logger.info("Position Closed", symbol=symbol)
+            self._held_changed()
+
+    def reconcile(self) -> dict:
+        """
+        Sync local state with Alpaca's positions (periodic, and after stream reconnects).
+        Picks up fills the stream missed and corrects quantities. Returns positions by symbol.
         """
-        # Sync with Alpaca Port
         alpaca_positions = {p.symbol: p for p in self.client.get_all_positions()}
         
-        # Identify new fills we don't track yet
-        for symbol, p in alpaca_positions.items():
-            if symbol not in self.trades:
-                # New trade detected! Initialize state
-                self.trades[symbol] = TradeState(
-                    symbol=symbol,
-                    entry_price=float(p.avg_entry_price),
-                    entry_time=datetime.now(), # Approximate if missed
-                    qty=float(p.qty),
-                    max_price=float(p.current_price)
-                )
-                logger.info("Tracking New Position", symbol=symbol, entry=p.avg_entry_price)
-
-        # Process Logic
-        for symbol, state in list(self.trades.items()):
-            if not state.is_active:
-                continue
-
-            # API Position Data
-            if symbol not in alpaca_positions:
-                # Closed externally?
-                state.is_active = False
-                continue
-                
-            pos = alpaca_positions[symbol]
-            current_price = float(pos.current_price)
-            state.max_price = max(state.max_price, current_price)
-
-            # ---------------------------
-            # 1. Safety Nets
-            # ---------------------------
-            
-            # A. Hard Stop Loss (-5%)
-            if current_price < state.entry_price * 0.95:
-                self._sell(symbol, 1.0, "Hard Stop Loss Hit")
-                continue
-
-            # B. Stale Timer (45 mins, needs > 1.5% profit)
-            time_held = datetime.now() - state.entry_time
-            profit_pct = (current_price - state.entry_price) / state.entry_price
-            
-            if time_held > timedelta(minutes=45) and profit_pct < 0.015:
-                self._sell(symbol, 1.0, "Stale Timer: Dead Money")
-                continue
-
-            # ---------------------------
-            # 2. Profit Taking
-            # ---------------------------
-            
-            # A. Tier 1 (Sell 50% at +6.5%)
-            if not state.tier1_sold and profit_pct >= 0.065:
-                self._sell(symbol, 0.5, "Tier 1 Profit Take")
-                state.tier1_sold = True
-                continue
-
-            # B. The Runner (Trailing Stop -3% from Max)
-            if state.tier1_sold:
-                drawdown = (state.max_price - current_price) / state.max_price
-                if drawdown >= 0.03:
-                    self._sell(symbol, 1.0, "Runner Trailing Stop Hit")
-                    continue
+        with self._lock:
+            for symbol, p in alpaca_positions.items():
+                state = self.trades.get(symbol)
+                if state is None:
+                    # New trade detected! Initialize state
+                    self.trades[symbol] = TradeState(
+                        symbol=symbol,
+                        entry_price=float(p.avg_entry_price),
+                        entry_time=datetime.now(), # Approximate if missed
+                        qty=float(p.qty),
+                        max_price=float(p.current_price)
+                    )
+                    logger.info("Tracking New Position", symbol=symbol, entry=p.avg_entry_price, source="reconcile")
+                else:
+                    # Held at the broker, so live (even if a poll raced the fill)
+                    state.qty = float(p.qty)
+                    state.is_active = True
+        self._held_changed()
+        if settings.protective_orders_enabled:
+            self._reconcile_protection(alpaca_positions)
+        return alpaca_positions
 
-            # ---------------------------
-            # 3. Emergency Triggers
-            # ---------------------------
-            
-            # RSI Overheat (> 85)
-            rsi = self.tech.get_rsi(symbol)
-            if rsi > 85:
-                self._sell(symbol, 1.0, f"RSI Overheat: {rsi}")
-                continue
-
-            # Volume Exhaustion
-            if self.tech.check_volume_divergence(symbol):
-                self._sell(symbol, 1.0, "Volume Exhaustion Detected")
-                continue
-
-    def _sell(self, symbol: str, pct: float, reason: str):
-        """Execute sell order."""
+    def _reconcile_protection(self, positions: dict):
+        """Adopt open protective orders (e.g. after a restart) and re-place missing ones."""
         try:
+            with request_priority(Priority.EXIT):
+                # The API's default page is 50; protected positions past it would look bare
+                orders = self.client.get_orders(GetOrdersRequest(
+                    status=QueryOrderStatus.OPEN, side=OrderSide.SELL, limit=OPEN_ORDERS_LIMIT
+                ))
+        except Exception as e:
+            logger.error("Protective order reconcile failed", error=str(e))
+            return
+        # A full page may be missing stops: adopt what was listed, leave the rest as they are
+        truncated = len(orders) >= OPEN_ORDERS_LIMIT
+        if truncated:
+            logger.warning("Protective order reconcile may be incomplete", open_orders=len(orders))
+
+        open_stops = {o.symbol: o for o in orders if _value(o.order_type or o.type) in PROTECTIVE_TYPES}
+        unprotected = []
+        with self._lock:
+            for symbol, state in self.trades.items():
+                if not state.is_active or symbol not in positions or symbol in self._protecting:
+                    continue
+                order = open_stops.get(symbol)
+                if order is None:
+                    if not truncated:
+                        state.stop_order_id = None
+                        unprotected.append(symbol)
+                    continue
+                state.stop_order_id = str(order.id)
+                if _value(order.order_type or order.type) == "trailing_stop":
+                    state.tier1_sold = True
+        for symbol in unprotected:
+            self._protect(symbol)
+
+    def _protect(self, symbol: str, qty: Optional[float] = None):
+        """
+        Place the broker-side exit for `symbol`: a stop at the hard-stop price, or once Tier 1
+        is sold a native trailing stop for the runner. Whole shares only (stop orders can't
+        be fractional); a fractional remainder stays on the local rules.
+        """
+        with self._lock:
             state = self.trades.get(symbol)
-            if not state: return
-            
-            # Calculate qty
-            # Note: stored state.qty might be stale if we sold partial.
-            # Better to fetch live pos qty.
-            pos = self.client.get_position(symbol)
-            current_qty = float(pos.qty)
-            qty_to_sell = current_qty * pct
-            
-            if qty_to_sell < 1.0: # Fractional support or strict logic
-                 # For MVP, if < 1 share and not fractional enabled fully, close all
-                 # Assuming minimal fractional support
-                 pass 
-
-            logger.info("Selling", symbol=symbol, reason=reason, pct=pct)
-            
-            if pct >= 0.99:
-                self.client.close_position(symbol)
-                del self.trades[symbol]
+            if state is None or state.stop_order_id is not None or symbol in self._protecting:
+                return
+            shares = int(qty if qty is not None else state.qty)
+            if shares < 1:
+                return
+            # Mirror the configured rules. The id makes a retried submit safe
+            client_order_id = new_client_order_id(STOP, symbol)
+            if state.tier1_sold:
+                trail = self.exit_rules.threshold("runner_trailing_stop", "drawdown_pct")
+                if trail is None:
+                    return
+                req = TrailingStopOrderRequest(
+                    symbol=symbol, qty=shares, side=OrderSide.SELL, time_in_force=TimeInForce.GTC,
+                    trail_percent=round(trail * 100, 2), client_order_id=client_order_id
+                )
             else:
-                req = MarketOrderRequest(
-                    symbol=symbol,
-                    qty=qty_to_sell,
-                    side=OrderSide.SELL,
-                    time_in_force=TimeInForce.DAY
+                stop = self.exit_rules.threshold("hard_stop", "profit_pct")
+                if stop is None:
+                    return
+                req = StopOrderRequest(
+                    symbol=symbol, qty=shares, side=OrderSide.SELL, time_in_force=TimeInForce.GTC,
+                    stop_price=_stop_price(state.entry_price * (1 + stop)), client_order_id=client_order_id
                 )
-                self.client.submit_order(req)
-                
+            self._protecting.add(symbol)
+
+        try:
+            with request_priority(Priority.EXIT):
+                order = self._submit_protective(req)
+            with self._lock:
+                state.stop_order_id = str(order.id)
+            logger.info("Protective Order Placed", symbol=symbol, type=_value(req.type), qty=shares,
+                        stop_price=getattr(req, "stop_price", None))
+        except Exception as e:
+            logger.error("Protective Order Failed", symbol=symbol, error=str(e))
+        finally:
+            with self._lock:
+                self._protecting.discard(symbol)
+
+    def _submit_protective(self, req):
+        try:
+            return self.client.submit_order(req)
+        except Exception:
+            # The broker may have accepted it before the connection dropped
+            try:
+                return self.client.get_order_by_client_id(req.client_order_id)
+            except Exception:
+                pass
+            raise
+
+    def _unprotect(self, symbol: str):
+        """Cancel the protective order, waiting (briefly) for the broker to release its shares."""
+        with self._lock:
+            state = self.trades.get(symbol)
+            order_id = state.stop_order_id if state else None
+            if order_id is None:
+                return
+            state.stop_order_id = None
+        try:
+            self.client.cancel_order_by_id(order_id)
+            deadline = time.monotonic() + settings.protective_cancel_timeout
+            while time.monotonic() < deadline:
+                if _value(self.client.get_order_by_id(order_id).status) in ORDER_DONE:
+                    return
+                time.sleep(0.1)
+            logger.warning("Protective Order Cancel Pending", symbol=symbol, id=order_id)
         except Exception as e:
-            logger.error("Sell Failed", symbol=symbol, error=str(e))
+            logger.error("Protective Order Cancel Failed", symbol=symbol, error=str(e))
+
+    def held(self) -> Set[str]:
+        """Symbols of the active trades."""
+        return {s for s, st in list(self.trades.items()) if st.is_active}
+
+    def _held_changed(self):
+        if self.on_held_change is not None:
+            try:
+                self.on_held_change(self.held())
+            except Exception as e:
+                logger.error("Held symbols listener failed", error=str(e))
+
+    def on_price(self, symbol: str, price: float):
+        """
+        Tick path (trades / quotes from the price stream): raise the high-water mark and
+        apply the "tick" exit rules (hard stop, runner trailing stop) the moment they fire.
+        The other rules (Tier 1, stale timer, RSI / volume) stay on `update_trades`.
+        """
+        with self._lock:
+            state = self.trades.get(symbol)
+            if state is None or not state.is_active:
+                return
+            state.max_price = max(state.max_price, price)
+            decisions = self.exit_rules.decide(*self._frame([(symbol, state, price)]), tick=True)
+            if not decisions:
+                return
+            # A failed sell is retried on a later tick, not on every one
+            now = time.monotonic()
+            if now - self._tick_exit_at.get(symbol, float("-inf")) < settings.exit_retry_seconds:
+                return
+            self._tick_exit_at[symbol] = now
+
+        logger.info("Tick Exit", symbol=symbol, price=price, entry=state.entry_price, max_price=state.max_price)
+        self._exit(decisions[0], state)
+
+    def update_trades(self):
+        """
+        Main Loop: Check all active trades against rules.
+        Should be called every minute.
+        """
+        # Sync with Alpaca Port
+        fetched_at = time.monotonic()
+        alpaca_positions = self.reconcile()
+
+        # Indicators for the whole pass (one batched bar request, not one per symbol)
+        with self._lock:
+            held = [s for s, st in self.trades.items() if st.is_active and s in alpaca_positions]
+        signals = self.tech.get_batch(held)
+
+        # Positions still held, at the latest price. Fills land on the stream's thread,
+        # so the trades are walked (and the frame built) under the lock.
+        rows = []
+        closed = False
+        with self._lock:
+            for symbol, state in list(self.trades.items()):
+                if not state.is_active:
+                    continue
+
+                # API Position Data
+                if symbol not in alpaca_positions:
+                    # Filled after the fetch: the next poll sees the position
+                    if state.last_fill_at is not None and state.last_fill_at >= fetched_at:
+                        continue
+                    # Closed externally?
+                    state.is_active = False
+                    closed = True
+                    continue
+
+                current_price = float(alpaca_positions[symbol].current_price)
+                state.max_price = max(state.max_price, current_price)
+                rows.append((symbol, state, current_price))
+            symbols, frame = self._frame(rows, signals)
+        if closed:
+            self._held_changed()
+
+        # Every exit rule over every position, one vectorized pass (see core/exit_rules.py)
+        states = {symbol: state for symbol, state, _ in rows}
+        for decision in self.exit_rules.decide(symbols, frame):
+            self._exit(decision, states[decision.symbol])
+
+        # This pass's exits went out concurrently; return once they are submitted
+        self.orders.wait(settings.async_request_timeout)
+
+    def _frame(self, rows: List[Tuple[str, TradeState, float]],
+               signals: Optional[Dict[str, TechnicalSignals]] = None) -> Tuple[List[str], PositionFrame]:
+        """(symbol, state, price) rows -> the exit rules' columns. No `signals`: NaN indicators."""
+        now = datetime.now()
+        nan = float("nan")
+
+        def column(values) -> np.ndarray:
+            return np.fromiter(values, dtype=np.float64, count=len(rows))
+
+        if signals is None:
+            rsi = volume_divergence = np.full(len(rows), nan)
+        else:
+            readings = [signals.get(symbol) or TechnicalSignals() for symbol, _, _ in rows]
+            rsi = column(r.rsi for r in readings)
+            volume_divergence = column(r.volume_divergence for r in readings)
+
+        frame = {
+            "entry_price": column(state.entry_price for _, state, _ in rows),
+            "price": column(price for _, _, price in rows),
+            "max_price": column(state.max_price for _, state, _ in rows),
+            "held_minutes": column((now - state.entry_time).total_seconds() / 60 for _, state, _ in rows),
+            "tier1_sold": column(state.tier1_sold for _, state, _ in rows),
+            "protected": column(state.stop_order_id is not None for _, state, _ in rows),
+            "rsi": rsi,
+            "volume_divergence": volume_divergence,
+        }
+        return [symbol for symbol, _, _ in rows], frame
+
+    def _exit(self, decision: ExitDecision, state: TradeState):
+        """Act on an exit rule; a partial sell is Tier 1 (with protective orders, the runner gets a trailing stop)."""
+        if decision.sell >= 0.99:
+            self._sell(decision.symbol, 1.0, decision.rule)
+            return
+        state.tier1_sold = True
+        protect = (lambda remaining: self._protect(decision.symbol, qty=remaining)) \
+            if settings.protective_orders_enabled else None
+        self._sell(decision.symbol, decision.sell, decision.rule, then=protect)
+
+    def _sell(self, symbol: str, pct: float, reason: str,
+              then: Optional[Callable[[float], Any]] = None) -> Optional[Future]:
+        """
+        Execute sell order via the order router (one full and one partial exit in flight
+        per symbol: ticks and the poll may both trigger). Sized from the tracked quantity, which fills and
+        `reconcile` keep current, so there is no position lookup per sell. `then(remaining)`
+        runs once a partial sell is submitted.
+        """
+        with self._lock:
+            state = self.trades.get(symbol)
+            if state is None:
+                return None
+            qty_to_sell = state.qty * pct
+            remaining = state.qty - qty_to_sell
+
+        def send(client_order_id: str):
+            with request_priority(Priority.EXIT):
+                order = self._submit_sell(symbol, qty_to_sell, pct, reason, client_order_id)
+            if then is not None and pct < 0.99:
+                then(remaining)
+            return order
+
+        # A full exit isn't held back by an in-flight partial one (Tier 1)
+        return self.orders.submit(symbol, EXIT if pct >= 0.99 else TRIM, send)
+
+    def _submit_sell(self, symbol: str, qty_to_sell: float, pct: float, reason: str, client_order_id: str):
+        """Place the sell order."""
+        # A protective order holds the shares: release them first
+        self._unprotect(symbol)
+
+        logger.info("Selling", symbol=symbol, reason=reason, pct=pct)
+
+        if pct >= 0.99:
+            # Broker sizes the close (whatever is held, fractions included)
+            order = self.client.close_position(symbol)
+            with self._lock:
+                self.trades.pop(symbol, None)
+            self._held_changed()
+            return order
+
+        req = MarketOrderRequest(
+            symbol=symbol,
+            qty=qty_to_sell,
+            side=OrderSide.SELL,
+            time_in_force=TimeInForce.DAY,
+            client_order_id=client_order_id
+        )
+        return self.client.submit_order(req)
@@ -0,0 +1,97 @@
+import asyncio
+from typing import Any, Callable, Iterable, Optional, Set
+import aiohttp
+import structlog
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.stream import WebSocketStream, dispatch
+
+logger = structlog.get_logger()
+
+class PriceStream(WebSocketStream):
+    """
+    Live trades and quotes for a changing set of symbols (Alpaca's market-data stream),
+    handed to `on_tick(symbol, price)`: the trade price, or the quote midpoint.
+
+    - JSON protocol: "connected" greeting, auth, then subscribe / unsubscribe
+      {"trades": [...], "quotes": [...]} at any time; {"T": "t" | "q", ...} messages.
+    - `update(symbols)` may be called from any thread; only the difference from the
+      current subscription is sent. Every reconnect re-subscribes the full set.
+    - Reconnects / handler dispatch as in `WebSocketStream`.
+    """
+
+    name = "Price stream"
+
+    def __init__(self, on_tick: Callable[[str, float], Any], symbols: Iterable[str] = (),
+                 url: Optional[str] = None):
+        super().__init__(url or settings.price_stream_url)
+        self.on_tick = on_tick
+        self.symbols: Set[str] = set(symbols)
+        self.stats.update({"trades": 0, "quotes": 0})
+        # What the server has been asked for on this connection (None until authenticated)
+        self._subscribed: Optional[Set[str]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def update(self, symbols: Iterable[str]):
+        """Stream `symbols` from now on (thread-safe)."""
+        symbols = set(symbols)
+        if symbols == self.symbols:
+            return
+        self.symbols = symbols
+        if self._loop is not None and not self._loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self._sync(), self._loop)
+
+    async def run(self):
+        self._loop = asyncio.get_running_loop()
+        try:
+            await super().run()
+        finally:
+            self._loop = None
+
+    async def _handshake(self, ws: aiohttp.ClientWebSocketResponse):
+        """Greeting -> auth. Raises ValueError when the keys are rejected."""
+        self._subscribed = None
+        await self._data_auth(ws)
+
+    async def _on_connected(self):
+        self._subscribed = set()
+        await self._sync()
+
+    async def _sync(self):
+        """Send the (un)subscribe actions that bring the connection to `self.symbols`."""
+        ws, subscribed = self._ws, self._subscribed
+        if ws is None or subscribed is None:
+            return # Connecting: `_on_connected` subscribes the full set
+        wanted = set(self.symbols)
+        added, removed = sorted(wanted - subscribed), sorted(subscribed - wanted)
+        self._subscribed = wanted
+        try:
+            if added:
+                await ws.send_json({"action": "subscribe", "trades": added, "quotes": added})
+            if removed:
+                await ws.send_json({"action": "unsubscribe", "trades": removed, "quotes": removed})
+        except ConnectionError as e:
+            # The reconnect re-subscribes everything
+            logger.warning("Price stream subscription update failed", error=str(e))
+
+    async def _handle(self, message: list):
+        for item in message:
+            kind = item.get("T")
+            if kind == "t":
+                self.stats["trades"] += 1
+                price = item.get("p")
+            elif kind == "q":
+                self.stats["quotes"] += 1
+                bid, ask = item.get("bp") or 0.0, item.get("ap") or 0.0
+                price = (bid + ask) / 2 if bid and ask else bid or ask
+            else:
+                if kind == "error":
+                    logger.error("Price stream error", code=item.get("code"), msg=item.get("msg"))
+                continue
+
+            symbol = item.get("S")
+            if not price or symbol not in self.symbols:
+                continue # Unsubscribe in flight
+            try:
+                await dispatch(self.on_tick, symbol, float(price))
+            except Exception as e:
+                logger.exception("Price tick handler failed", symbol=symbol, error=str(e))
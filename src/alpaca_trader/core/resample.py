@@ -0,0 +1,99 @@
+from typing import Dict, Optional
+import numpy as np
+from alpaca.data.timeframe import TimeFrame, TimeFrameUnit
+
+OHLCV = ("open", "high", "low", "close", "volume")
+
+UNIT_SECONDS = {
+    TimeFrameUnit.Minute: 60,
+    TimeFrameUnit.Hour: 3600,
+    TimeFrameUnit.Day: 86400,
+}
+
+# Daily buckets start at 05:00 UTC (midnight EST) so a whole US session, including
+# extended hours, lands in one bucket under both EST and EDT.
+DAY_OFFSET = 5 * 3600
+
+def timeframe_seconds(timeframe: TimeFrame) -> Optional[int]:
+    """Bucket width for an Alpaca timeframe; None for weeks / months (not resampled)."""
+    unit = UNIT_SECONDS.get(timeframe.unit)
+    if unit is None:
+        return None
+    return timeframe.amount * unit
+
+def bucket_offset(seconds: int) -> int:
+    return DAY_OFFSET if seconds % 86400 == 0 else 0
+
+def resample(bars: Dict[str, np.ndarray], seconds: int) -> Dict[str, np.ndarray]:
+    """
+    Aggregate time-ordered minute bars ({field: array} with epoch-second timestamps)
+    into `seconds`-wide OHLCV buckets in one vectorized pass (`ufunc.reduceat` over
+    bucket boundaries). Buckets are stamped at their open, like Alpaca's bars.
+    """
+    ts = np.asarray(bars["timestamp"], dtype=np.float64)
+    if not len(ts):
+        return {field: np.empty(0) for field in ("timestamp",) + OHLCV}
+
+    offset = bucket_offset(seconds)
+    buckets = np.floor((ts - offset) / seconds) * seconds + offset
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(ts)] - 1
+
+    return {
+        "timestamp": buckets[starts],
+        "open": np.asarray(bars["open"], dtype=np.float64)[starts],
+        "high": np.maximum.reduceat(np.asarray(bars["high"], dtype=np.float64), starts),
+        "low": np.minimum.reduceat(np.asarray(bars["low"], dtype=np.float64), starts),
+        "close": np.asarray(bars["close"], dtype=np.float64)[ends],
+        "volume": np.add.reduceat(np.asarray(bars["volume"], dtype=np.float64), starts),
+    }
+
+class Resampler:
+    """
+    Incrementally maintained higher-timeframe bars for one symbol.
+
+    Closed buckets are kept (up to `capacity`); the newest bucket stays open and is
+    merged with later minute bars (high/low extend, close moves, volume adds) until a
+    minute bar from the next bucket arrives.
+    """
+
+    def __init__(self, seconds: int, capacity: int = 500):
+        self.seconds = seconds
+        self.capacity = capacity
+        self.bars = {field: np.empty(0) for field in ("timestamp",) + OHLCV}
+        self.last_ts: Optional[float] = None # last minute bar consumed
+
+    def __len__(self) -> int:
+        return len(self.bars["timestamp"])
+
+    def update(self, minute_bars: Dict[str, np.ndarray]) -> int:
+        """Consume minute bars newer than the last one seen. Returns minute bars used."""
+        ts = np.asarray(minute_bars["timestamp"], dtype=np.float64)
+        newer = slice(None) if self.last_ts is None else ts > self.last_ts
+        minute_bars = {field: np.asarray(minute_bars[field])[newer] for field in ("timestamp",) + OHLCV}
+        n = len(minute_bars["timestamp"])
+        if not n:
+            return 0
+
+        fresh = resample(minute_bars, self.seconds)
+        if len(self) and self.bars["timestamp"][-1] == fresh["timestamp"][0]:
+            # First fresh bucket continues the open one
+            fresh["open"][0] = self.bars["open"][-1]
+            fresh["high"][0] = max(fresh["high"][0], self.bars["high"][-1])
+            fresh["low"][0] = min(fresh["low"][0], self.bars["low"][-1])
+            fresh["volume"][0] += self.bars["volume"][-1]
+            kept = {field: values[:-1] for field, values in self.bars.items()}
+        else:
+            kept = self.bars
+
+        self.bars = {
+            field: np.concatenate([kept[field], fresh[field]])[-self.capacity:]
+            for field in self.bars
+        }
+        self.last_ts = float(minute_bars["timestamp"][-1])
+        return n
+
+    def window(self, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Last `n` buckets (the final one may still be open), as {field: array}."""
+        n = len(self) if n is None else min(n, len(self))
+        return {field: values[len(values) - n:] for field, values in self.bars.items()}
@@ -0,0 +1,128 @@
+from typing import Any, Callable, Collection, Dict, Mapping, Optional
+import numpy as np
+from alpaca_trader.core.fundamentals import FundamentalsIndex
+from alpaca_trader.core.snapshot_frame import SnapshotFrame
+
+# A compiled rule: SnapshotFrame (or any column mapping) -> boolean mask (one entry per row)
+Predicate = Callable[[SnapshotFrame], np.ndarray]
+
+def _ratio(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return a / b
+
+# Derived fields, computed once per frame on first use and cached as a column
+DERIVED_FIELDS: Dict[str, Callable[[SnapshotFrame], np.ndarray]] = {
+    "dollar_volume": lambda f: f["price"] * f["volume"],
+    "change_pct": lambda f: _ratio(f["price"] - f["prev_close"], f["prev_close"]),
+    "gap_pct": lambda f: _ratio(f["day_open"] - f["prev_close"], f["prev_close"]),
+    "range_pct": lambda f: _ratio(f["day_high"] - f["day_low"], f["price"]),
+    "relative_volume": lambda f: _ratio(f["volume"], f["prev_volume"]),
+    "market_cap": lambda f: f["price"] * f["shares_outstanding"],
+    "float_market_cap": lambda f: f["price"] * f["float_shares"],
+}
+
+# Columns the screener attaches from the fundamentals index
+FUNDAMENTAL_FIELDS = FundamentalsIndex.COLUMNS
+
+COMPARATORS = {
+    "eq": np.equal,
+    "gt": np.greater,
+    "gte": np.greater_equal,
+    "lt": np.less,
+    "lte": np.less_equal,
+}
+COMBINATORS = ("all", "any", "not")
+LEAF_KEYS = {"field", "between", *COMPARATORS}
+
+def resolve(frame: SnapshotFrame, field: str,
+            derived: Mapping[str, Callable[[Any], np.ndarray]] = DERIVED_FIELDS) -> np.ndarray:
+    """Return a raw or derived column, caching derived ones on the frame."""
+    if field in frame:
+        return frame[field]
+    column = derived[field](frame)
+    frame[field] = column
+    return column
+
+def compile_rule(spec: Mapping[str, Any], fields: Optional[Collection[str]] = None,
+                 derived: Optional[Mapping[str, Callable[[Any], np.ndarray]]] = None) -> Predicate:
+    """
+    Compile a declarative rule into a vectorized predicate.
+
+    Grammar (plain dicts, so it loads straight from JSON settings):
+        {"field": "price", "between": [2, 20]}       inclusive range
+        {"field": "volume", "gt": 100000}            also eq / gte / lt / lte (combinable)
+        {"all": [rule, ...]}                          logical AND
+        {"any": [rule, ...]}                          logical OR
+        {"not": rule}                                 logical NOT
+
+    Fields are any SnapshotFrame column, a fundamentals column or a DERIVED_FIELDS name. Missing data is
+    NaN and fails every comparison. Invalid specs (unknown keys included, and a combinator
+    next to any other key) raise ValueError at compile time, never mid-screen. Other tables (e.g. core/exit_rules.py) pass their own `fields` /
+    `derived` columns; the frame is then any mapping of column name -> array.
+    """
+    if fields is None:
+        fields = set(SnapshotFrame.FIELDS) | set(FUNDAMENTAL_FIELDS)
+    if derived is None:
+        derived = DERIVED_FIELDS
+
+    if not isinstance(spec, Mapping):
+        raise ValueError(f"Rule must be a mapping, got {type(spec).__name__}")
+
+    # A misspelled or extra key would otherwise be silently ignored
+    combinators = [key for key in COMBINATORS if key in spec]
+    if combinators and len(spec) > 1:
+        raise ValueError(f"'{combinators[0]}' can't be combined with other keys: {sorted(spec)}")
+    unknown = set(spec) - LEAF_KEYS - set(COMBINATORS)
+    if unknown:
+        raise ValueError(f"Unknown rule keys {sorted(unknown)} in {dict(spec)}")
+
+    if "all" in spec or "any" in spec:
+        key = "all" if "all" in spec else "any"
+        if not isinstance(spec[key], (list, tuple)):
+            raise ValueError(f"'{key}' takes a list of rules, got {type(spec[key]).__name__}")
+        children = [compile_rule(child, fields, derived) for child in spec[key]]
+        if not children:
+            raise ValueError(f"'{key}' needs at least one rule")
+        combine = np.logical_and if key == "all" else np.logical_or
+
+        def group(frame: SnapshotFrame) -> np.ndarray:
+            mask = children[0](frame)
+            for child in children[1:]:
+                mask = combine(mask, child(frame))
+            return mask
+        return group
+
+    if "not" in spec:
+        inner = compile_rule(spec["not"], fields, derived)
+        return lambda frame: ~inner(frame)
+
+    field = spec.get("field")
+    if field is None:
+        raise ValueError(f"Rule needs 'field', 'all', 'any' or 'not': {dict(spec)}")
+    if field not in fields and field not in derived:
+        raise ValueError(f"Unknown field: {field}")
+
+    checks = []
+    if "between" in spec:
+        if not isinstance(spec["between"], (list, tuple)) or len(spec["between"]) != 2:
+            raise ValueError(f"'between' takes [low, high], got {spec['between']!r}")
+        low, high = (float(v) for v in spec["between"])
+        checks.append((np.greater_equal, low))
+        checks.append((np.less_equal, high))
+    for op, compare in COMPARATORS.items():
+        if op in spec:
+            checks.append((compare, float(spec[op])))
+    if not checks:
+        raise ValueError(f"Rule on '{field}' has no comparison: {dict(spec)}")
+
+    def leaf(frame: SnapshotFrame) -> np.ndarray:
+        column = resolve(frame, field, derived)
+        mask = np.ones(len(column), dtype=bool)
+        for compare, value in checks:
+            mask &= compare(column, value)
+        return mask
+    return leaf
+
+def compile_profiles(profiles: Mapping[str, Mapping[str, Any]]) -> Dict[str, Predicate]:
+    """Compile every named screen profile once."""
+    return {name: compile_rule(spec) for name, spec in profiles.items()}
@@ -1,7 +1,15 @@
-from typing import List, Optional
-from decimal import Decimal
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+import numpy as np
 import structlog
+from alpaca_trader.config.settings import settings
 from alpaca_trader.core.market import MarketService
+from alpaca_trader.core.fundamentals import FundamentalsIndex
+from alpaca_trader.core.rules import Predicate, compile_profiles, resolve
+from alpaca_trader.core.snapshot_frame import SnapshotFrame
+from alpaca_trader.core.transport import Priority, request_priority
+from alpaca_trader.core.universe import UniverseCache, UniverseDiff
 from alpaca_trader.models.asset import Asset
 
 logger = structlog.get_logger()
@@ -9,73 +17,146 @@ logger = structlog.get_logger()
 class MarketScreener:
     """Filters the market for tradeable candidates."""
 
-    def __init__(self, market_service: MarketService):
+    def __init__(self, market_service: MarketService, universe: Optional[UniverseCache] = None):
         self.market = market_service
+        self.universe = universe or UniverseCache(market_service)
+        self.universe.subscribe(self.apply_universe_diff)
+        self.tradable_symbols: Optional[List[str]] = None
+        # Compile once; bad rules fail at startup rather than mid-screen
+        self.profiles: Dict[str, Predicate] = compile_profiles(settings.screen_profiles)
+        self.fundamentals: Optional[FundamentalsIndex] = None
 
-    def run_screen(self) -> List[Asset]:
+    def run_screen(self, profile: Optional[str] = None) -> List[Asset]:
         """
         Execute the screening process:
         1. Fetch all US Equities.
-        2. Filter by Price ($2 - $20).
-        3. Filter by Volume (> 500k).
+        2. Apply the screen profile rules (default: Price $2 - $20, Volume > 100k).
+        3. Filter by Market Cap ($300M - $2B).
         """
-        logger.info("Starting market screen...")
+        name = profile or settings.screen_profile
+        return self.run_profiles([name])[name]
+
+    def run_profiles(self, profiles: Optional[List[str]] = None) -> Dict[str, List[Asset]]:
+        """
+        Run several screen profiles over a single snapshot download.
+        Each profile is a precompiled vectorized predicate, so extra profiles cost
+        a mask evaluation, not another round of API calls.
+        """
+        names = profiles or list(self.profiles)
+        unknown = [n for n in names if n not in self.profiles]
+        if unknown:
+            raise ValueError(f"Unknown screen profile(s): {unknown}")
+
+        logger.info("Starting market screen...", profiles=names)
         
-        # 1. Fetch Universe
-        all_assets = self.market.get_all_assets()
-        tradable_symbols = [
-            a.symbol for a in all_assets 
-            if a.tradable and a.marginable
-        ]
+        # 1. Fetch Universe (disk cache, refreshed in the background when stale)
+        if self.tradable_symbols is None:
+            self.tradable_symbols = self.universe.get_symbols()
+        else:
+            self.universe.ensure_fresh()
+        tradable_symbols = self.tradable_symbols
         logger.info("Universe size", count=len(tradable_symbols))
 
-        # 2 & 3. Price & Liquidity Filter (using Alpaca Snapshots for speed)
-        candidates: List[Asset] = []
-        
-        # Process in chunks of 500 to avoid URL length limits
-        chunk_size = 500
-        for i in range(0, len(tradable_symbols), chunk_size):
-            chunk = tradable_symbols[i:i + chunk_size]
+        # 2. Snapshot download (once, shared by every profile)
+        snapshots = self._fetch_snapshots(tradable_symbols)
+        frame = SnapshotFrame.from_raw(snapshots)
+        self._attach_fundamentals(frame)
+
+        # 3. Market Cap Band (vectorized price x shares, shared by every profile)
+        cap_mask = self._filter_by_market_cap(frame)
+
+        results: Dict[str, List[Asset]] = {}
+        for name in names:
+            # ---------------------------------------------
+            # ⚡ LEVEL 1 FILTER: Profile rules (vectorized)
+            # ---------------------------------------------
+            # NaN (no trade / no bar) never passes a comparison.
+            mask = self.profiles[name](frame)
+            logger.info("Candidates after profile rules", profile=name, count=int(mask.sum()))
+
+            results[name] = frame.to_assets(mask & cap_mask)
+            logger.info("Final Screen Results", profile=name, count=len(results[name]))
+
+        return results
+
+    def apply_universe_diff(self, diff: UniverseDiff):
+        """Patch the running symbol list with delistings / status changes only."""
+        if self.tradable_symbols is None:
+            return
+        removed = set(diff.removed)
+        symbols = [s for s in self.tradable_symbols if s not in removed]
+        known = set(symbols)
+        symbols.extend(s for s in diff.added if s not in known)
+        # Swap in one assignment so a screen in flight keeps its own list
+        self.tradable_symbols = symbols
+        logger.info("Screener universe patched", added=len(diff.added), removed=len(diff.removed))
+
+    def _fetch_snapshots(self, symbols: List[str]) -> Dict:
+        """
+        Fetch raw snapshots for all symbols concurrently.
+        Chunks (500 symbols each, URL length limit) run on a bounded worker pool
+        so we stay inside the account's request budget. Results are merged in
+        chunk order, so the output is identical to a sequential fetch.
+        """
+        chunk_size = settings.screen_chunk_size
+        chunks = [symbols[i:i + chunk_size] for i in range(0, len(symbols), chunk_size)]
+        if not chunks:
+            return {}
+
+        workers = max(1, min(settings.screen_max_workers, len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="screen") as pool:
+            futures = [
+                pool.submit(self._fetch_chunk, index, chunk)
+                for index, chunk in enumerate(chunks)
+            ]
+            merged: Dict = {}
+            for future in futures:
+                merged.update(future.result())
+
+        return merged
+
+    def _fetch_chunk(self, index: int, chunk: List[str]) -> Dict:
+        """Fetch one chunk, retrying with backoff. Never raises: a dead chunk yields {}."""
+        attempts = settings.screen_chunk_retries + 1
+        error: Optional[Exception] = None
+
+        for attempt in range(attempts):
             try:
-                snapshots = self.market.get_snapshots(chunk)
-                
-                for symbol, snapshot in snapshots.items():
-                    # Latest Trade Price
-                    if not snapshot.latest_trade:
-                        continue
-                        
-                    price = snapshot.latest_trade.price
-                    
-                    if not snapshot.daily_bar:
-                        continue
-                        
-                    volume = snapshot.daily_bar.volume
-                    
-                    # ---------------------------------------------
-                    # ⚡ LEVEL 1 FILTER: Price $2-$20 & Vol Check
-                    # ---------------------------------------------
-                    if 2.0 <= price <= 20.0 and volume > 100_000:
-                        candidates.append(Asset(
-                            symbol=symbol,
-                            exchange="Unknown",
-                            price=Decimal(str(price)),
-                            volume=int(volume)
-                        ))
+                with request_priority(Priority.SCREEN):
+                    return dict(self.market.get_snapshots_raw(chunk))
             except Exception as e:
-                logger.error("Error processing chunk", error=str(e), chunk_index=i)
+                error = e
+                if attempt + 1 < attempts:
+                    # Only this worker sleeps, the other chunks keep going
+                    time.sleep(settings.screen_retry_backoff * (2 ** attempt))
 
-        logger.info("Candidates after Price/Vol filter", count=len(candidates))
+        logger.error("Error processing chunk", error=str(error), chunk_index=index, attempts=attempts)
+        return {}
 
-        # 4. Market Cap Filter (Simplified/Skipped for MVP)
-        final_list = self._filter_by_market_cap(candidates)
-        
-        logger.info("Final Screen Results", count=len(final_list))
-        return final_list
+    def _get_fundamentals(self) -> Optional[FundamentalsIndex]:
+        """Return the mapped fundamentals index, remapping it after an offline rebuild."""
+        if self.fundamentals is None or self.fundamentals.is_outdated():
+            self.fundamentals = FundamentalsIndex.open()
+        return self.fundamentals
 
-    def _filter_by_market_cap(self, assets: List[Asset]) -> List[Asset]:
+    def _attach_fundamentals(self, frame: SnapshotFrame):
+        """Add fundamentals columns to the frame (NaN when the index is missing)."""
+        index = self._get_fundamentals()
+        for name in FundamentalsIndex.COLUMNS:
+            frame[name] = index.column(name, frame.symbols) if index else np.full(len(frame), np.nan)
+
+    def _filter_by_market_cap(self, frame: SnapshotFrame) -> np.ndarray:
         """
-        Placeholder for Market Cap filter.
-        In MVP (Alpaca-only), we skip this or need a paid data subscription.
-        Passing all candidates for now.
+        Market Cap band ($300M - $2B by default) as a mask over the frame.
+        Market cap = last price x shares outstanding from the local fundamentals index.
+        Without an index there is nothing to filter on, so every row passes.
         """
-        return assets
+        if self.fundamentals is None:
+            logger.warning("Fundamentals index missing, market cap filter skipped", path=str(FundamentalsIndex.default_path()))
+            return np.ones(len(frame), dtype=bool)
+
+        market_cap = resolve(frame, "market_cap")
+        mask = (market_cap >= settings.market_cap_min) & (market_cap <= settings.market_cap_max)
+        if settings.market_cap_keep_unknown:
+            mask |= np.isnan(market_cap)
+        return mask
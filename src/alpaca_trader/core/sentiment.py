@@ -0,0 +1,208 @@
+import importlib.util
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from xml.etree import ElementTree
+from alpaca_trader.config.settings import settings
+
+class SentimentBackend(ABC):
+    """
+    Scores text polarity from -1.0 (negative) to 1.0 (positive).
+    Subclasses implement `_score`; `score` memoizes it per distinct text.
+    """
+
+    name = "base"
+
+    def __init__(self, cache_size: Optional[int] = None):
+        self.score = lru_cache(maxsize=cache_size or settings.sentiment_cache_size)(self._score)
+
+    @abstractmethod
+    def _score(self, text: str) -> float:
+        """Polarity of one text."""
+
+    def score_batch(self, texts: Iterable[str]) -> List[float]:
+        """Scores for many texts; repeated texts are scored once."""
+        texts = list(texts)
+        unique = {text: self.score(text) for text in dict.fromkeys(texts)}
+        return [unique[text] for text in texts]
+
+class TextBlobSentiment(SentimentBackend):
+    """Reference backend: TextBlob's PatternAnalyzer (slow import, slow per call)."""
+
+    name = "textblob"
+
+    def __init__(self, cache_size: Optional[int] = None):
+        super().__init__(cache_size)
+        from textblob import TextBlob
+        self._blob = TextBlob
+
+    def _score(self, text: str) -> float:
+        return self._blob(text).sentiment.polarity
+
+# --- Lexicon backend (pattern / TextBlob algorithm, without importing TextBlob) ---
+
+NEGATIONS = ("no", "not", "n't", "never")
+PUNCTUATION = ".,;:!?()[]{}`''\"@#$^&*+-|=~_"
+LEADING = PUNCTUATION.replace(".", "") # periods are only split off the end of a word
+# Words whose final period is kept (pattern's abbreviation rules: "U.S.", "T.", "Mr.", "etc.")
+ABBREVIATIONS = {
+    "a.", "adj.", "adv.", "al.", "a.m.", "c.", "cf.", "comp.", "conf.", "def.", "ed.", "e.g.",
+    "esp.", "etc.", "ex.", "f.", "fig.", "gen.", "id.", "i.e.", "int.", "l.", "m.", "Med.",
+    "Mil.", "Mr.", "n.", "n.q.", "orig.", "pl.", "pred.", "pres.", "p.m.", "ref.", "v.", "vs.",
+}
+ABBREVIATION = re.compile(r"^([A-Za-z]\.)+$|^[A-Z][bcdfghjklmnpqrstvwxz|]+.$")
+CONTRACTIONS = re.compile(r"('d|'m|'s|'ll|'re|'ve|n't)")
+SARCASM = re.compile(r"\( ?\! ?\)")
+IRONY = "(!)"
+QUOTES = str.maketrans({q: f" {q} " for q in "“”‘’'\""})
+
+# word -> (polarity, subjectivity, intensity, is_adverb)
+Lexicon = Dict[str, Tuple[float, float, float, bool]]
+
+def _avg(values) -> float:
+    values = list(values)
+    return sum(values) / float(len(values) or 1)
+
+def default_lexicon_path() -> Path:
+    """en-sentiment.xml shipped with textblob, located without importing the package."""
+    if settings.sentiment_lexicon_path:
+        return Path(settings.sentiment_lexicon_path)
+    spec = importlib.util.find_spec("textblob")
+    if spec is None or not spec.submodule_search_locations:
+        raise FileNotFoundError("textblob is not installed and no sentiment_lexicon_path is set")
+    return Path(spec.submodule_search_locations[0]) / "en" / "en-sentiment.xml"
+
+def load_lexicon(path: Optional[Path] = None) -> Lexicon:
+    """
+    Compile the XML lexicon into one flat dict, averaging word senses the way pattern does
+    (per part of speech, then across parts of speech) and deriving "-ly" adverbs from
+    adjectives ("terrible" -> "terribly").
+    """
+    root = ElementTree.parse(path or default_lexicon_path()).getroot()
+    senses: Dict[str, Dict[Optional[str], list]] = {}
+    for node in root.findall("word"):
+        form = node.attrib.get("form")
+        if not form:
+            continue
+        psi = (float(node.attrib.get("polarity", 0.0)),
+               float(node.attrib.get("subjectivity", 0.0)),
+               float(node.attrib.get("intensity", 1.0)))
+        senses.setdefault(form, {}).setdefault(node.attrib.get("pos"), []).append(psi)
+
+    words: Dict[str, Dict[Optional[str], tuple]] = {}
+    for form, by_pos in senses.items():
+        averaged = {pos: tuple(_avg(v) for v in zip(*psi)) for pos, psi in by_pos.items()}
+        averaged[None] = tuple(_avg(v) for v in zip(*averaged.values()))
+        words[form] = averaged
+
+    for form, by_pos in list(words.items()):
+        if "JJ" in by_pos:
+            stem = form[:-1] + "i" if form.endswith("y") else form
+            stem = stem[:-2] if stem.endswith("le") else stem
+            entry = words.setdefault(stem + "ly", {})
+            entry["RB"] = entry[None] = by_pos["JJ"]
+
+    return {form: by_pos[None] + ("RB" in by_pos,) for form, by_pos in words.items()}
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased tokens with contractions and leading / trailing punctuation split off."""
+    text = CONTRACTIONS.sub(r" \1", text).translate(QUOTES)
+    text = SARCASM.sub(f" {IRONY} ", text)
+    tokens: List[str] = []
+    for token in text.split():
+        if token == IRONY:
+            tokens.append(token)
+            continue
+        head = []
+        while token and token[0] in LEADING:
+            head.append(token[0])
+            token = token[1:]
+        tail = []
+        while token and token[-1] in PUNCTUATION:
+            if token[-1] in LEADING:
+                tail.append(token[-1])
+                token = token[:-1]
+            if token.endswith("..."):
+                tail.append("...")
+                token = token[:-3].rstrip(".")
+            if token.endswith("."):
+                if token in ABBREVIATIONS or ABBREVIATION.match(token):
+                    break
+                tail.append(".")
+                token = token[:-1]
+        tokens.extend(head)
+        if token:
+            tokens.append(token.lower())
+        tokens.extend(reversed(tail))
+    return tokens
+
+class LexiconSentiment(SentimentBackend):
+    """
+    TextBlob's default polarity algorithm over a precompiled lexicon: known words are
+    averaged, adverbs ("very good") scale the next word, negations ("not good") flip
+    and halve it, "!" boosts the previous word, "(!)" adds a neutral (ironic) score.
+    Emoticons are not scored. No TextBlob import, no object per call.
+    """
+
+    name = "lexicon"
+
+    def __init__(self, lexicon: Optional[Lexicon] = None, cache_size: Optional[int] = None):
+        super().__init__(cache_size)
+        self.lexicon = lexicon if lexicon is not None else load_lexicon()
+
+    def _score(self, text: str) -> float:
+        lexicon = self.lexicon
+        scores: List[list] = [] # [polarity, intensity, negated]
+        modifier: Optional[str] = None
+        negation: Optional[str] = None
+
+        for w in tokenize(text):
+            entry = lexicon.get(w)
+            if entry is not None:
+                p, _, i, is_adverb = entry
+                if modifier is None:
+                    scores.append([p, i, False])
+                else:
+                    last = scores[-1]
+                    last[0] = max(-1.0, min(p * last[1], 1.0))
+                    last[1] = i
+                if negation is not None:
+                    scores[-1][1] = 1.0 / scores[-1][1]
+                    scores[-1][2] = True
+                modifier = w if is_adverb else None
+                negation = w if w in NEGATIONS else None
+            else:
+                if w in NEGATIONS:
+                    negation = w
+                elif negation and len(w.strip("'")) > 1:
+                    negation = None
+                if negation is not None and modifier is not None and modifier.endswith("ly"):
+                    scores[-1][2] = True
+                    negation = None
+                elif modifier and len(w) > 2:
+                    modifier = None
+                if w == "!" and scores:
+                    scores[-1][0] = max(-1.0, min(scores[-1][0] * 1.25, 1.0))
+                if w == IRONY:
+                    scores.append([0.0, 1.0, False])
+
+        # Plain running sum (not sum(), which compensates rounding on 3.12+) for bit-parity
+        total = 0.0
+        for p, _, negated in scores:
+            total += p * -0.5 if negated else p
+        return total / (len(scores) or 1)
+
+BACKENDS = {
+    LexiconSentiment.name: LexiconSentiment,
+    TextBlobSentiment.name: TextBlobSentiment,
+}
+
+def get_backend(name: Optional[str] = None) -> SentimentBackend:
+    """Sentiment backend by name (`settings.sentiment_backend` by default)."""
+    name = name or settings.sentiment_backend
+    try:
+        return BACKENDS[name]()
+    except KeyError as e:
+        raise ValueError(f"Unknown sentiment backend '{name}' (choose from {sorted(BACKENDS)})") from e
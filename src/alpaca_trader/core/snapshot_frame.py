@@ -0,0 +1,102 @@
+from typing import Dict, List, Mapping, Optional
+from decimal import Decimal
+import numpy as np
+from alpaca_trader.models.asset import Asset
+
+class SnapshotFrame:
+    """
+    Columnar view of a snapshot download.
+    Every field lives in its own float64 NumPy array (one row per symbol), so filters
+    run as vectorized masks and `Asset` models are only built for the survivors.
+
+    Built either from raw snapshot JSON (preferred: skips alpaca-py's per-symbol
+    pydantic parsing entirely) or from parsed `Snapshot` models. Columns are unpacked
+    lazily on first access, so a screen only pays for the fields it filters on.
+    Missing data (no trade / no daily bar) is NaN and never passes a comparison.
+    """
+
+    # Column name -> (model attribute, model field, raw key, raw field)
+    FIELDS = {
+        "price": ("latest_trade", "price", "latestTrade", "p"),
+        "volume": ("daily_bar", "volume", "dailyBar", "v"),
+        "day_open": ("daily_bar", "open", "dailyBar", "o"),
+        "day_high": ("daily_bar", "high", "dailyBar", "h"),
+        "day_low": ("daily_bar", "low", "dailyBar", "l"),
+        "vwap": ("daily_bar", "vwap", "dailyBar", "vw"),
+        "prev_close": ("previous_daily_bar", "close", "prevDailyBar", "c"),
+        "prev_volume": ("previous_daily_bar", "volume", "prevDailyBar", "v"),
+    }
+
+    def __init__(self, symbols: np.ndarray, columns: Dict[str, np.ndarray],
+                 rows: Optional[list] = None, raw: bool = False):
+        self.symbols = symbols
+        self.columns = columns
+        self._rows = rows
+        self._raw = raw
+
+    @classmethod
+    def from_snapshots(cls, snapshots: Mapping) -> "SnapshotFrame":
+        """Wrap parsed {symbol: Snapshot} models."""
+        symbols = np.array(list(snapshots.keys()), dtype=object)
+        return cls(symbols, {}, list(snapshots.values()))
+
+    @classmethod
+    def from_raw(cls, snapshots: Mapping) -> "SnapshotFrame":
+        """Wrap raw {symbol: {"latestTrade": {...}, "dailyBar": {...}}} API payloads."""
+        symbols = np.array(list(snapshots.keys()), dtype=object)
+        return cls(symbols, {}, list(snapshots.values()), raw=True)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns or name in self.FIELDS
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        column = self.columns.get(name)
+        if column is None:
+            if name not in self.FIELDS or self._rows is None:
+                raise KeyError(name)
+            column = self.columns[name] = self._unpack(name)
+        return column
+
+    def __setitem__(self, name: str, column: np.ndarray):
+        self.columns[name] = column
+
+    def _unpack(self, name: str) -> np.ndarray:
+        """Pull one field out of every row into a float64 array (NaN if missing)."""
+        attr, field, raw_key, raw_field = self.FIELDS[name]
+        nan = float("nan")
+
+        if self._raw:
+            sources = [row.get(raw_key) for row in self._rows]
+            values = [nan if source is None else source.get(raw_field, nan) for source in sources]
+        else:
+            sources = [getattr(row, attr, None) for row in self._rows]
+            values = [nan if source is None else getattr(source, field, nan) for source in sources]
+
+        # None (field present but empty) converts to NaN under dtype=float64
+        return np.array(values, dtype=np.float64)
+
+    def take(self, mask: np.ndarray) -> "SnapshotFrame":
+        """Return the rows selected by a boolean mask (materializes every column)."""
+        names = set(self.FIELDS) | set(self.columns)
+        return SnapshotFrame(self.symbols[mask], {name: self[name][mask] for name in names})
+
+    def to_assets(self, mask: np.ndarray) -> List[Asset]:
+        """Build `Asset` models for the rows selected by `mask` only."""
+        rows = np.flatnonzero(mask)
+        symbols = self.symbols[rows].tolist()
+        prices = self["price"][rows].tolist()
+        volumes = self["volume"][rows].tolist()
+        caps = self.columns["market_cap"][rows].tolist() if "market_cap" in self.columns else [None] * len(rows)
+        return [
+            Asset(
+                symbol=symbol,
+                exchange="Unknown",
+                price=Decimal(str(price)),
+                volume=0 if volume != volume else int(volume), # No daily bar yet -> 0
+                market_cap=None if cap is None or cap != cap else cap # NaN -> None
+            )
+            for symbol, price, volume, cap in zip(symbols, prices, volumes, caps)
+        ]
@@ -0,0 +1,120 @@
+import asyncio
+import inspect
+import json
+import random
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+import aiohttp
+import structlog
+from alpaca_trader.config.settings import settings
+
+logger = structlog.get_logger()
+
+def parse_time(value: Any) -> Optional[datetime]:
+    """Alpaca timestamp ("2025-12-12T15:04:05Z" or a datetime) -> aware datetime."""
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+class WebSocketStream(ABC):
+    """
+    Reconnecting JSON WebSocket client, the base of Alpaca's push feeds (news, trade updates).
+
+    - `run()` connects, performs the subclass handshake, calls `_on_connected` (gap fills,
+      reconciliation), then hands every decoded message to `_handle`.
+    - Dropped connections are retried until `stop()`, with capped exponential backoff
+      (+/-50% jitter). Handshake errors (ValueError: bad keys, no subscription) are not
+      retried: `run()` raises.
+    - Text and binary frames are both JSON (the trading stream sends binary frames).
+    """
+
+    name = "stream"
+
+    def __init__(self, url: str):
+        self.url = url
+        self.stats = {"connects": 0}
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._stopping = False
+
+    async def run(self):
+        """Connect, consume and reconnect until `stop()`."""
+        attempt = 0
+        async with aiohttp.ClientSession() as session:
+            while not self._stopping:
+                try:
+                    async with session.ws_connect(self.url, heartbeat=settings.stream_heartbeat) as ws:
+                        self._ws = ws
+                        await self._handshake(ws)
+                        attempt = 0
+                        self.stats["connects"] += 1
+                        logger.info(f"{self.name} connected", url=self.url, connects=self.stats["connects"])
+                        await self._on_connected()
+                        async for msg in ws:
+                            if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                                await self._handle(json.loads(msg.data))
+                    if not self._stopping:
+                        logger.warning(f"{self.name} closed by server")
+                except (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError) as e:
+                    logger.warning(f"{self.name} disconnected", error=str(e))
+                finally:
+                    self._ws = None
+
+                if self._stopping:
+                    break
+                delay = self._backoff_delay(attempt)
+                attempt += 1
+                logger.info(f"{self.name} reconnecting", delay=round(delay, 2), attempt=attempt)
+                await asyncio.sleep(delay)
+
+    async def stop(self):
+        self._stopping = True
+        if self._ws is not None:
+            await self._ws.close()
+
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        delay = min(settings.api_backoff_base * (2 ** attempt), settings.stream_reconnect_max)
+        return delay * random.uniform(0.5, 1.5)
+
+    async def _receive(self, ws: aiohttp.ClientWebSocketResponse) -> Any:
+        """Next decoded message during the handshake."""
+        msg = await ws.receive(timeout=settings.async_request_timeout)
+        if msg.type not in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+            raise ConnectionError(f"{self.name} handshake interrupted ({msg.type.name})")
+        return json.loads(msg.data)
+
+    async def _data_auth(self, ws: aiohttp.ClientWebSocketResponse):
+        """Market-data protocol (news, prices): greeting -> auth. Raises ValueError if rejected."""
+        await self._receive(ws) # [{"T": "success", "msg": "connected"}]
+
+        await ws.send_json({"action": "auth", "key": settings.alpaca_api_key, "secret": settings.alpaca_secret_key})
+        reply = (await self._receive(ws))[0]
+        if reply.get("T") != "success" or reply.get("msg") != "authenticated":
+            raise ValueError(f"{self.name} auth failed: {reply.get('msg', reply)}")
+
+    @abstractmethod
+    async def _handshake(self, ws: aiohttp.ClientWebSocketResponse):
+        """Authenticate / subscribe on a fresh connection. ValueError if rejected."""
+
+    async def _on_connected(self):
+        """Hook run after every successful handshake."""
+
+    @abstractmethod
+    async def _handle(self, message: Any):
+        """One decoded message from the feed."""
+
+async def dispatch(handler: Callable[..., Any], *args: Any):
+    """
+    Call a stream handler: coroutines are awaited, plain functions run in the loop's
+    default executor (one at a time, in order), so slow handlers never stall heartbeats.
+    """
+    if inspect.iscoroutinefunction(handler):
+        return await handler(*args)
+    return await asyncio.get_running_loop().run_in_executor(None, handler, *args)
@@ -1,50 +1,196 @@
+import math
+import threading
+import numpy as np
 import pandas as pd
 import pandas_ta as ta
-from typing import List
+from typing import Dict, Iterable, List, Optional, Tuple
 from alpaca.data.historical import StockHistoricalDataClient
 from alpaca.data.requests import StockBarsRequest
 from alpaca.data.timeframe import TimeFrame
+from pydantic import BaseModel
 from datetime import datetime, timedelta
 from alpaca_trader.config.settings import settings
+from alpaca_trader.core.bar_cache import BarCache
+from alpaca_trader.core.indicators import IndicatorState
+from alpaca_trader.core.resample import Resampler, timeframe_seconds
+
+NEUTRAL_RSI = 50.0 # Neutral default if no data
+RSI_LENGTH = 14 # Length kept as streaming state
+RSI_WINDOW = 100 # Bars fed to the RSI (14 + buffer)
+
+def _flatten(df: pd.DataFrame) -> pd.DataFrame:
+    """Reseting index to ensure simple integer index if multi-index."""
+    if isinstance(df.index, pd.MultiIndex):
+        df = df.reset_index()
+    return df
+
+def rsi_from_closes(closes: np.ndarray, length: int = 14) -> float:
+    """Latest RSI of a close series."""
+    if len(closes) < length:
+        return NEUTRAL_RSI
+
+    rsi_series = ta.rsi(pd.Series(closes, dtype="float64"), length=length)
+    if rsi_series is None or rsi_series.empty:
+        return NEUTRAL_RSI
+        
+    return float(rsi_series.iloc[-1])
+
+def volume_divergence(closes: np.ndarray, volumes: np.ndarray) -> bool:
+    """New High (in close) with Lower Volume, last candle vs previous candle."""
+    if len(closes) < 2:
+        return False
+    return bool(closes[-1] > closes[-2] and volumes[-1] < volumes[-2])
+
+def rsi_from_bars(df: pd.DataFrame, length: int = 14) -> float:
+    """Latest RSI from a bars frame with a 'close' column."""
+    if df is None or df.empty:
+        return NEUTRAL_RSI
+    return rsi_from_closes(_flatten(df)['close'].to_numpy(), length)
+
+class TechnicalSignals(BaseModel):
+    """Exit-relevant indicator readings for one symbol."""
+    rsi: float = NEUTRAL_RSI
+    volume_divergence: bool = False
 
 class Technicals:
     """Helper for technical analysis calculations."""
 
-    def __init__(self, data_client: StockHistoricalDataClient):
+    def __init__(self, data_client: StockHistoricalDataClient, bar_cache: Optional[BarCache] = None):
+        # Minute bars come from the shared cache: one incremental fetch serves every indicator
+        self.bars = bar_cache or BarCache(data_client)
         self.data_client = data_client
+        # Streaming indicator state per symbol, advanced only by bars it has not seen
+        self.states: Dict[str, IndicatorState] = {}
+        # Higher timeframes resampled locally from minute bars, per (symbol, bucket seconds)
+        self.frames: Dict[Tuple[str, int], Resampler] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def data_client(self) -> StockHistoricalDataClient:
+        return self.bars.data_client
+
+    @data_client.setter
+    def data_client(self, client: StockHistoricalDataClient):
+        self.bars.data_client = client
+
+    def get_indicators(self, symbol: str) -> IndicatorState:
+        """Streaming indicators (RSI, EMA, VWAP, volume average) advanced to the newest cached bar."""
+        self.bars.refresh([symbol])
+        return self._advance(symbol)
+
+    def _advance(self, symbol: str) -> IndicatorState:
+        """Feed cached bars the state has not seen yet (no network)."""
+        with self._lock:
+            state = self.states.get(symbol)
+            if state is None:
+                state = self.states[symbol] = IndicatorState(rsi_length=RSI_LENGTH)
+            state.update_many(self.bars.since(symbol, state.last_ts))
+        return state
+
+    def get_bars(self, symbol: str, timeframe: TimeFrame, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Latest `n` bars of `timeframe` built from local minute bars (no extra request).
+        The resampler is seeded once from the on-disk store (or the cache) and then
+        only consumes minute bars it has not seen; the last bucket may still be open.
+        """
+        seconds = timeframe_seconds(timeframe)
+        if seconds is None:
+            raise ValueError(f"Cannot resample to {timeframe.value}")
+        if seconds == 60:
+            return self.bars.get(symbol, n)
+
+        self.bars.refresh([symbol])
+        with self._lock:
+            frame = self.frames.get((symbol, seconds))
+            if frame is None:
+                frame = self.frames[(symbol, seconds)] = Resampler(seconds)
+                if self.bars.store is not None:
+                    frame.update(self.bars.store.window(symbol))
+            if frame.last_ts is None:
+                frame.update(self.bars.peek(symbol))
+            else:
+                frame.update(self.bars.since(symbol, frame.last_ts))
+            return frame.window(n)
+
+    def get_batch(self, symbols: List[str]) -> Dict[str, TechnicalSignals]:
+        """
+        RSI and volume divergence for many symbols in one pass.
+        Bars for every symbol come from one batched refresh (a single multi-symbol
+        request, plus one backfill request for symbols seen for the first time).
+        Divergence is evaluated on a stacked (N, 2) matrix of the last two bars; RSI
+        comes from each symbol's streaming state.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return {}
+        try:
+            self.bars.refresh(symbols)
+
+            closes = np.full((len(symbols), 2), np.nan)
+            volumes = np.full((len(symbols), 2), np.nan)
+            rsi = np.full(len(symbols), NEUTRAL_RSI)
+            for i, symbol in enumerate(symbols):
+                window = self.bars.peek(symbol, 2)
+                k = len(window["close"])
+                closes[i, 2 - k:] = window["close"]
+                volumes[i, 2 - k:] = window["volume"]
+                state = self._advance(symbol).rsi
+                if state.ready and not math.isnan(state.value):
+                    rsi[i] = state.value
+
+            # New High (in close) with Lower Volume; NaN rows (< 2 bars) compare False
+            diverging = (closes[:, 1] > closes[:, 0]) & (volumes[:, 1] < volumes[:, 0])
+
+            return {
+                symbol: TechnicalSignals(rsi=float(rsi[i]), volume_divergence=bool(diverging[i]))
+                for i, symbol in enumerate(symbols)
+            }
+        except Exception:
+            return {symbol: TechnicalSignals() for symbol in symbols}
+
+    def evict(self, keep: Iterable[str]):
+        """Forget bars and indicator state for symbols we neither watch nor hold."""
+        keep = set(keep)
+        self.bars.evict(keep)
+        with self._lock:
+            for symbol in [s for s in self.states if s not in keep]:
+                del self.states[symbol]
+            for key in [k for k in self.frames if k[0] not in keep]:
+                del self.frames[key]
 
     def get_rsi(self, symbol: str, timeframe=TimeFrame.Minute, length: int = 14) -> float:
         """Calculate latest RSI."""
         try:
+            if timeframe.value == TimeFrame.Minute.value:
+                if length == RSI_LENGTH:
+                    # O(1) per new bar: Wilder state carried between calls
+                    rsi = self.get_indicators(symbol).rsi
+                    return rsi.value if rsi.ready and not math.isnan(rsi.value) else NEUTRAL_RSI
+                closes = self.bars.get(symbol, RSI_WINDOW)["close"]
+                return rsi_from_closes(closes, length)
+
+            # Higher timeframes: resample local minute bars
+            if timeframe_seconds(timeframe) is not None:
+                closes = self.get_bars(symbol, timeframe, RSI_WINDOW)["close"]
+                if len(closes) > length:
+                    return rsi_from_closes(closes, length)
+
+            # Not enough local history (or weekly / monthly): direct request
             # Fetch enough bars for RSI calculation (14 + buffer)
-            # Getting last 100 bars to be safe
             req = StockBarsRequest(
                 symbol_or_symbols=symbol,
                 timeframe=timeframe,
                 start=datetime.now() - timedelta(days=2), # small window for 5m/1m bars
-                limit=100
+                limit=RSI_WINDOW
             )
             
             bars = self.data_client.get_stock_bars(req)
             if not bars.data:
-                return 50.0 # Neural default if no data
-                
-            df = bars.df
-            if df.empty or len(df) < length:
-                return 50.0
-                
-            # Reseting index to ensure simple integer index if multi-index
-            if isinstance(df.index, pd.MultiIndex):
-                df = df.reset_index()
-
-            # Calculate RSI
-            rsi_series = ta.rsi(df['close'], length=length)
-            if rsi_series is None or rsi_series.empty:
-                return 50.0
+                return NEUTRAL_RSI
                 
-            return float(rsi_series.iloc[-1])
+            return rsi_from_bars(bars.df, length)
         except Exception:
-            return 50.0
+            return NEUTRAL_RSI
 
     def check_volume_divergence(self, symbol: str) -> bool:
         """
@@ -52,30 +198,7 @@ class Technicals:
         Simple logic: Compare last candle to previous candle.
         """
         try:
-            req = StockBarsRequest(
-                symbol_or_symbols=symbol,
-                timeframe=TimeFrame.Minute,
-                start=datetime.now() - timedelta(days=1), # REQUIRED PARAM
-                limit=5
-            )
-            bars = self.data_client.get_stock_bars(req)
-            if not bars.data:
-                return False
-                
-            df = bars.df
-            if isinstance(df.index, pd.MultiIndex):
-                df = df.reset_index()
-                
-            if len(df) < 2:
-                return False
-                
-            curr = df.iloc[-1]
-            prev = df.iloc[-2]
-            
-            # New High (in close) with Lower Volume
-            if curr['close'] > prev['close'] and curr['volume'] < prev['volume']:
-                return True
-                
-            return False
+            window = self.bars.get(symbol, 2)
+            return volume_divergence(window["close"], window["volume"])
         except Exception:
             return False
@@ -0,0 +1,60 @@
+from typing import Any, Callable, Optional
+import aiohttp
+import structlog
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.stream import WebSocketStream, dispatch
+
+logger = structlog.get_logger()
+
+def default_url() -> str:
+    """The trading API's stream endpoint (paper or live, following alpaca_base_url)."""
+    if settings.trade_stream_url:
+        return settings.trade_stream_url
+    base = settings.alpaca_base_url.rstrip("/")
+    return base.replace("https://", "wss://", 1).replace("http://", "ws://", 1) + "/stream"
+
+class TradeUpdatesStream(WebSocketStream):
+    """
+    Order lifecycle events from Alpaca's trading stream (`trade_updates`): new, fill,
+    partial_fill, canceled, expired, rejected, replaced...
+
+    Each event's `data` ({"event", "order", "price", "qty", "position_qty", "timestamp"})
+    goes to `on_update`. `on_connect` runs after every (re)connect, for reconciling
+    whatever happened while the socket was down.
+    """
+
+    name = "Trade updates stream"
+
+    def __init__(self, on_update: Callable[[dict], Any], on_connect: Optional[Callable[[], Any]] = None,
+                 url: Optional[str] = None):
+        super().__init__(url or default_url())
+        self.on_update = on_update
+        self.on_connect = on_connect
+        self.stats["updates"] = 0
+
+    async def _handshake(self, ws: aiohttp.ClientWebSocketResponse):
+        """auth -> listen. Raises ValueError when the keys are rejected."""
+        await ws.send_json({"action": "auth", "key": settings.alpaca_api_key, "secret": settings.alpaca_secret_key})
+        reply = await self._receive(ws)
+        if reply.get("stream") != "authorization" or reply.get("data", {}).get("status") != "authorized":
+            raise ValueError(f"Trade updates stream auth failed: {reply.get('data', reply)}")
+
+        await ws.send_json({"action": "listen", "data": {"streams": ["trade_updates"]}})
+        await self._receive(ws) # {"stream": "listening", ...}
+
+    async def _on_connected(self):
+        if self.on_connect is None:
+            return
+        try:
+            await dispatch(self.on_connect)
+        except Exception as e:
+            logger.error("Trade updates reconcile failed", error=str(e))
+
+    async def _handle(self, message: dict):
+        if message.get("stream") != "trade_updates":
+            return
+        self.stats["updates"] += 1
+        try:
+            await dispatch(self.on_update, message["data"])
+        except Exception as e:
+            logger.exception("Trade update handler failed", error=str(e))
@@ -0,0 +1,277 @@
+import asyncio
+import contextvars
+import heapq
+import itertools
+import random
+import threading
+import time
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Any, Dict, Optional
+import aiohttp
+import requests
+import structlog
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from alpaca_trader.config.settings import settings
+
+logger = structlog.get_logger()
+
+class Priority(IntEnum):
+    """Request classes, lowest value is served first when the budget is tight."""
+    ORDER = 0    # Entry order submission
+    EXIT = 1     # Exits / position closes
+    NORMAL = 2   # Position sync, news, technicals
+    SCREEN = 3   # Bulk screening downloads
+
+_current_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar("alpaca_priority", default=Priority.NORMAL)
+
+@contextmanager
+def request_priority(priority: Priority):
+    """Tag every Alpaca request made inside the block (on this thread) with `priority`."""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with priority queueing.
+    Refills at `rate_per_min`, holds at most `burst` tokens. Waiters queue by
+    (priority, arrival) and only the head of the queue may take a token, so an
+    order never waits behind a backlog of screening requests.
+    """
+
+    def __init__(self, rate_per_min: float, burst: int):
+        self.rate = rate_per_min / 60.0
+        self.capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._cond = threading.Condition()
+        self._waiters: list = []
+        self._seq = itertools.count()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, priority: Priority = Priority.NORMAL) -> float:
+        """Block until a token is granted. Returns the time spent queueing (seconds)."""
+        start = time.monotonic()
+        with self._cond:
+            ticket = (int(priority), next(self._seq))
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    self._refill()
+                    if self._waiters[0] == ticket:
+                        if self._tokens >= 1.0:
+                            self._tokens -= 1.0
+                            return time.monotonic() - start
+                        # Head of the queue: sleep until the next token is due
+                        self._cond.wait((1.0 - self._tokens) / self.rate)
+                    else:
+                        self._cond.wait()
+            finally:
+                # Remove our ticket (normally the head) and wake the next in line
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+
+    def try_acquire(self, priority: Priority = Priority.NORMAL) -> float:
+        """
+        Non-blocking acquire for event loops.
+        Returns 0.0 if a token was taken, otherwise the seconds to wait before retrying.
+        Yields to queued (blocking) waiters of the same or higher priority.
+        """
+        with self._cond:
+            self._refill()
+            blocked = bool(self._waiters) and self._waiters[0][0] <= int(priority)
+            if not blocked and self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            return max((1.0 - self._tokens) / self.rate, 0.001)
+
+class TransportMetrics:
+    """Counters for queue wait time and throttling, per priority class."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests: Dict[str, int] = {p.name: 0 for p in Priority}
+            self.wait_total: Dict[str, float] = {p.name: 0.0 for p in Priority}
+            self.wait_max: Dict[str, float] = {p.name: 0.0 for p in Priority}
+            self.throttled = 0  # 429 responses
+            self.retries = 0
+            self.failures = 0
+
+    def record_wait(self, priority: Priority, wait: float):
+        with self._lock:
+            self.requests[priority.name] += 1
+            self.wait_total[priority.name] += wait
+            self.wait_max[priority.name] = max(self.wait_max[priority.name], wait)
+
+    def record_retry(self, throttled: bool):
+        with self._lock:
+            self.retries += 1
+            if throttled:
+                self.throttled += 1
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "requests": dict(self.requests),
+                "wait_avg_ms": {
+                    name: round(1000 * self.wait_total[name] / count, 1) if count else 0.0
+                    for name, count in self.requests.items()
+                },
+                "wait_max_ms": {name: round(1000 * w, 1) for name, w in self.wait_max.items()},
+                "throttled": self.throttled,
+                "retries": self.retries,
+                "failures": self.failures,
+            }
+
+class AlpacaTransport:
+    """
+    Shared HTTP layer for every Alpaca REST client in the process.
+    - One pooled `requests.Session` (keep-alive connections reused across clients).
+    - One token bucket for the account's request budget, served by priority.
+    - Retry with jittered exponential backoff on 429 / 5xx / connection errors.
+      A POST without a client_order_id could duplicate an order the broker already
+      accepted, so it is only retried when it provably never got there (429, or a
+      failure while connecting).
+    """
+
+    RETRY_STATUS = {429, 500, 502, 503, 504}
+    # Errors without an HTTP status that are still worth retrying
+    TRANSIENT_ERRORS = (requests.ConnectionError, requests.Timeout, ConnectionError, asyncio.TimeoutError)
+
+    def __init__(self, rate_per_min: Optional[float] = None, burst: Optional[int] = None,
+                 max_retries: Optional[int] = None, backoff: Optional[float] = None):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=settings.http_pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.limiter = TokenBucket(
+            rate_per_min if rate_per_min is not None else settings.api_rate_limit_per_min,
+            burst if burst is not None else settings.api_burst
+        )
+        self.max_retries = max_retries if max_retries is not None else settings.api_max_retries
+        self.backoff = backoff if backoff is not None else settings.api_backoff_base
+        self.metrics = TransportMetrics()
+
+    def attach(self, client):
+        """
+        Route an alpaca-py REST client through this transport.
+        Swaps in the shared session and wraps its single-request hook; the SDK's own
+        fixed-wait retry loop is disabled so retries happen here, inside the budget.
+        """
+        if getattr(client, "_transport", None) is self:
+            return client
+
+        one_request = client._one_request
+        transport = self
+
+        def limited_one_request(method, url, opts, retry):
+            idempotent = transport.idempotent(method, opts.get("json"))
+            return transport.execute(lambda: one_request(method, url, opts, 0), idempotent)
+
+        client._session = self.session
+        client._retry = 0
+        client._one_request = limited_one_request
+        client._transport = self
+        return client
+
+    @staticmethod
+    def idempotent(method: str, body: Any) -> bool:
+        """Safe to resend? Everything but a POST, or a POST the broker dedups by client_order_id."""
+        if method.upper() != "POST":
+            return True
+        return isinstance(body, dict) and bool(body.get("client_order_id"))
+
+    @staticmethod
+    def _not_sent(error: Exception) -> bool:
+        """Failed while connecting, so the server never saw the request."""
+        cause = error.__cause__ or error # async_market wraps aiohttp errors in ConnectionError
+        if isinstance(cause, (requests.ConnectTimeout, aiohttp.ClientConnectorError)):
+            return True
+        if isinstance(cause, requests.ConnectionError):
+            reason = cause.args[0] if cause.args else None
+            return isinstance(getattr(reason, "reason", reason), NewConnectionError)
+        return False
+
+    def _retryable(self, error: Exception, attempt: int, idempotent: bool = True) -> bool:
+        """Transient (429 / 5xx / connection) and retries left? Records metrics either way."""
+        # alpaca APIError exposes status_code, aiohttp ClientResponseError exposes status
+        status = getattr(error, "status_code", None) or getattr(error, "status", None)
+        transient = status in self.RETRY_STATUS if status is not None else isinstance(error, self.TRANSIENT_ERRORS)
+        if transient and not idempotent:
+            transient = status == 429 or self._not_sent(error)
+        if not transient or attempt >= self.max_retries:
+            self.metrics.record_failure()
+            return False
+        self.metrics.record_retry(throttled=status == 429)
+        return True
+
+    def _backoff_delay(self, attempt: int) -> float:
+        return self.backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+    def execute(self, send, idempotent: bool = True):
+        """
+        Run one logical request: acquire budget, send, retry transient failures
+        (only those before the request was sent unless `idempotent`).
+        """
+        priority = _current_priority.get()
+        attempt = 0
+        while True:
+            wait = self.limiter.acquire(priority)
+            self.metrics.record_wait(priority, wait)
+            try:
+                return send()
+            except Exception as e:
+                if not self._retryable(e, attempt, idempotent):
+                    raise
+                delay = self._backoff_delay(attempt)
+                logger.debug("Alpaca request retry", error=str(e), attempt=attempt + 1, delay=round(delay, 2), priority=priority.name)
+                time.sleep(delay)
+                attempt += 1
+
+    async def execute_async(self, send, idempotent: bool = True):
+        """Async twin of `execute`: same budget, priorities and retry policy, never blocks the loop."""
+        priority = _current_priority.get()
+        attempt = 0
+        while True:
+            start = time.monotonic()
+            while (delay := self.limiter.try_acquire(priority)) > 0:
+                await asyncio.sleep(delay)
+            self.metrics.record_wait(priority, time.monotonic() - start)
+            try:
+                return await send()
+            except Exception as e:
+                if not self._retryable(e, attempt, idempotent):
+                    raise
+                delay = self._backoff_delay(attempt)
+                logger.debug("Alpaca request retry", error=str(e), attempt=attempt + 1, delay=round(delay, 2), priority=priority.name)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+_transport: Optional[AlpacaTransport] = None
+_transport_lock = threading.Lock()
+
+def get_transport() -> AlpacaTransport:
+    """Process-wide shared transport (created on first use)."""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = AlpacaTransport()
+        return _transport
@@ -0,0 +1,171 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import structlog
+from pydantic import BaseModel
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.market import MarketService
+
+logger = structlog.get_logger()
+
+# Compact per-asset flags stored on disk
+TRADABLE = 1
+MARGINABLE = 2
+SHORTABLE = 4
+EASY_TO_BORROW = 8
+FRACTIONABLE = 16
+
+SCREENABLE = TRADABLE | MARGINABLE
+
+class UniverseDiff(BaseModel):
+    """Changes between two universe snapshots."""
+    added: List[str] = []     # Newly screenable (listings, became tradable/marginable)
+    removed: List[str] = []   # No longer screenable (delistings, halted, lost margin)
+    changed: List[str] = []   # Flags changed but still screenable
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+class UniverseCache:
+    """
+    On-disk cache of the active US equity universe.
+
+    The asset list barely changes during a day, so it is stored as a compact
+    {symbol: flags} file and reused across restarts until the TTL expires.
+    Stale reads return the cached list immediately and refresh in the background;
+    listeners receive only the diff (delistings, status changes).
+    """
+
+    FILENAME = "universe.json"
+
+    def __init__(self, market_service: MarketService, path: Optional[Path] = None, ttl_hours: Optional[float] = None):
+        self.market = market_service
+        self.path = Path(path) if path else Path(settings.data_dir) / self.FILENAME
+        self.ttl = (ttl_hours if ttl_hours is not None else settings.universe_cache_ttl_hours) * 3600
+        self.flags: Dict[str, int] = {}
+        self.fetched_at: float = 0.0
+        self._listeners: List[Callable[[UniverseDiff], None]] = []
+        self._lock = threading.Lock()
+        self._refreshing = threading.Event()
+
+    @property
+    def is_stale(self) -> bool:
+        return time.time() - self.fetched_at > self.ttl
+
+    def subscribe(self, listener: Callable[[UniverseDiff], None]):
+        """Register a callback that receives every non-empty diff."""
+        self._listeners.append(listener)
+
+    def screenable_symbols(self) -> List[str]:
+        """Tradable & marginable symbols, in a stable (sorted) order."""
+        return sorted(s for s, f in self.flags.items() if f & SCREENABLE == SCREENABLE)
+
+    def get_symbols(self) -> List[str]:
+        """
+        Return the screenable universe.
+        1. Cold start: load the local file (or fetch synchronously if none).
+        2. Stale: serve the cached list, refresh in the background.
+        """
+        if not self.flags:
+            self.load()
+        if not self.flags:
+            self.refresh()
+        else:
+            self.ensure_fresh()
+        return self.screenable_symbols()
+
+    def ensure_fresh(self):
+        """Kick off a background refresh if the cached universe has expired."""
+        if self.is_stale:
+            self.refresh_async()
+
+    def load(self) -> bool:
+        """Load the cached universe from disk. Returns False if missing or unreadable."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            self.flags = {s: int(v) for s, v in payload["assets"].items()}
+            self.fetched_at = float(payload["fetched_at"])
+            logger.info("Universe loaded from cache", count=len(self.flags), age_min=round((time.time() - self.fetched_at) / 60))
+            return True
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning("Universe cache unreadable, refetching", path=str(self.path), error=str(e))
+            return False
+
+    def refresh(self) -> UniverseDiff:
+        """Fetch the asset list, persist it and notify listeners of the diff."""
+        with self._lock:
+            assets = self.market.get_all_assets()
+            new_flags = {a.symbol: self._encode(a) for a in assets}
+
+            diff = self.diff(self.flags, new_flags)
+            self.flags = new_flags
+            self.fetched_at = time.time()
+            self._save()
+
+        logger.info("Universe refreshed", count=len(new_flags), added=len(diff.added),
+                    removed=len(diff.removed), changed=len(diff.changed))
+        if not diff.is_empty:
+            for listener in self._listeners:
+                try:
+                    listener(diff)
+                except Exception as e:
+                    logger.error("Universe listener failed", error=str(e))
+        return diff
+
+    def refresh_async(self) -> bool:
+        """Refresh on a daemon thread. Returns False if a refresh is already running."""
+        if self._refreshing.is_set():
+            return False
+        self._refreshing.set()
+
+        def run():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error("Background universe refresh failed", error=str(e))
+            finally:
+                self._refreshing.clear()
+
+        threading.Thread(target=run, name="universe-refresh", daemon=True).start()
+        return True
+
+    @staticmethod
+    def diff(old: Dict[str, int], new: Dict[str, int]) -> UniverseDiff:
+        """Compare two {symbol: flags} maps in terms of screenability."""
+        def screenable(flags: Dict[str, int]):
+            return {s for s, f in flags.items() if f & SCREENABLE == SCREENABLE}
+
+        old_set, new_set = screenable(old), screenable(new)
+        return UniverseDiff(
+            added=sorted(new_set - old_set),
+            removed=sorted(old_set - new_set),
+            changed=sorted(s for s in old_set & new_set if old[s] != new[s])
+        )
+
+    @staticmethod
+    def _encode(asset) -> int:
+        flags = 0
+        if asset.tradable: flags |= TRADABLE
+        if asset.marginable: flags |= MARGINABLE
+        if getattr(asset, "shortable", False): flags |= SHORTABLE
+        if getattr(asset, "easy_to_borrow", False): flags |= EASY_TO_BORROW
+        if getattr(asset, "fractionable", False): flags |= FRACTIONABLE
+        return flags
+
+    def _save(self):
+        """Write atomically so a crash never leaves a half-written cache."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"fetched_at": self.fetched_at, "assets": self.flags}, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except Exception as e:
+            logger.error("Failed to persist universe cache", path=str(self.path), error=str(e))
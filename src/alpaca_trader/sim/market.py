@@ -0,0 +1,76 @@
+import json
+from datetime import datetime, timezone
+from typing import Optional
+from aiohttp import WSMsgType, web
+from alpaca_trader.sim.server import StandInServer
+
+def _stamp() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+class PriceFeedServer(StandInServer):
+    """
+    Local stand-in for Alpaca's market-data stream (`/v2/iex`), for testing tick-driven
+    exits offline.
+
+    Speaks the real protocol: greeting, auth, subscribe / unsubscribe {"trades", "quotes"}
+    at any time, [{"T": "t" | "q", ...}] messages. `trade()` / `quote()` push one tick to
+    every client subscribed to the symbol; `disconnect()` drops them all.
+    """
+
+    def __init__(self, key: Optional[str] = None, secret: Optional[str] = None):
+        super().__init__()
+        self.key = key
+        self.secret = secret
+        self.app.router.add_get("/v2/iex", self._stream)
+
+    @property
+    def ws_url(self) -> str:
+        return self.base_url.replace("http://", "ws://", 1) + "/v2/iex"
+
+    def subscribed(self, channel: str = "trades") -> set:
+        """Symbols any client is subscribed to on `channel`."""
+        return set().union(*(channels[channel] for channels in self._clients.values()))
+
+    async def trade(self, symbol: str, price: float, size: int = 100):
+        await self._push("trades", {"T": "t", "S": symbol, "p": price, "s": size, "t": _stamp()})
+
+    async def quote(self, symbol: str, bid: float, ask: float):
+        await self._push("quotes", {"T": "q", "S": symbol, "bp": bid, "bs": 1, "ap": ask, "as": 1, "t": _stamp()})
+
+    async def _push(self, channel: str, tick: dict):
+        # Clients' subscriptions are {"trades": symbols, "quotes": symbols}
+        await self._broadcast([tick], lambda channels: tick["S"] in channels[channel])
+
+    async def _stream(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        await ws.send_json([{"T": "success", "msg": "connected"}])
+        authenticated = False
+
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                continue
+            action = json.loads(msg.data)
+            if action.get("action") == "auth":
+                if (self.key is None or action.get("key") == self.key) and \
+                        (self.secret is None or action.get("secret") == self.secret):
+                    authenticated = True
+                    await ws.send_json([{"T": "success", "msg": "authenticated"}])
+                else:
+                    await ws.send_json([{"T": "error", "code": 402, "msg": "auth failed"}])
+                    break
+            elif action.get("action") in ("subscribe", "unsubscribe"):
+                if not authenticated:
+                    await ws.send_json([{"T": "error", "code": 401, "msg": "not authenticated"}])
+                    break
+                channels = self._clients.setdefault(ws, {"trades": set(), "quotes": set()})
+                for channel in ("trades", "quotes"):
+                    symbols = set(action.get(channel, []))
+                    if action["action"] == "subscribe":
+                        channels[channel] |= symbols
+                    else:
+                        channels[channel] -= symbols
+                await ws.send_json([{"T": "subscription", **{c: sorted(s) for c, s in channels.items()}}])
+
+        self._clients.pop(ws, None)
+        return ws
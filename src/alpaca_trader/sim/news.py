@@ -0,0 +1,106 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, List, Optional
+from aiohttp import WSMsgType, web
+from alpaca_trader.core.stream import parse_time
+from alpaca_trader.sim.server import StandInServer
+
+def load_recording(path: str) -> List[dict]:
+    """Recorded articles, one raw Alpaca news JSON object per line."""
+    lines = Path(path).read_text(encoding="utf-8").splitlines()
+    return [json.loads(line) for line in lines if line.strip()]
+
+def _stamp() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+class NewsReplayServer(StandInServer):
+    """
+    Local stand-in for Alpaca's news feed, for testing the streaming path offline.
+
+    - WebSocket `/v1beta1/news`: the real JSON protocol (greeting, auth, subscribe,
+      {"T": "n", ...} messages).
+    - REST `GET /v1beta1/news`: everything published so far (newest first, `start` /
+      `symbols` / `sort` / `limit` / `page_token`), so reconnect gap fills can be exercised.
+
+    `publish()` stamps an article's created_at with the current time (so receipt delay
+    is the delivery latency) and pushes it to every subscribed client; `replay()` does
+    that for a recording at a fixed interval. `disconnect()` drops every client while
+    publishing carries on, which is what a network blip looks like to the bot.
+    """
+
+    def __init__(self, key: Optional[str] = None, secret: Optional[str] = None):
+        super().__init__()
+        self.key = key
+        self.secret = secret
+        self.published: List[dict] = []
+        self.rest_requests = 0
+        self.app.router.add_get("/v1beta1/news", self._route)
+
+    @property
+    def ws_url(self) -> str:
+        return self.base_url.replace("http://", "ws://", 1) + "/v1beta1/news"
+
+    async def publish(self, article: dict) -> dict:
+        article = dict(article, created_at=_stamp(), updated_at=_stamp())
+        self.published.append(article)
+        symbols = set(article.get("symbols", []))
+        # Clients' subscriptions are symbol sets
+        await self._broadcast([dict(article, T="n")], lambda subscribed: "*" in subscribed or subscribed & symbols)
+        return article
+
+    async def replay(self, articles: Iterable[dict], interval: float = 0.0):
+        for article in articles:
+            await self.publish(article)
+            await asyncio.sleep(interval)
+
+    async def _route(self, request: web.Request) -> web.StreamResponse:
+        if request.headers.get("Upgrade", "").lower() == "websocket":
+            return await self._stream(request)
+        return self._rest(request)
+
+    def _rest(self, request: web.Request) -> web.Response:
+        self.rest_requests += 1
+        start = parse_time(request.query.get("start"))
+        symbols = set(filter(None, request.query.get("symbols", "").split(",")))
+        limit = int(request.query.get("limit", 50))
+        offset = int(request.query.get("page_token", 0))
+        published = self.published if request.query.get("sort") == "asc" else reversed(self.published)
+
+        items = [
+            a for a in published
+            if (start is None or parse_time(a["created_at"]) >= start)
+            and (not symbols or symbols & set(a.get("symbols", [])))
+        ]
+        page = items[offset:offset + limit]
+        token = str(offset + limit) if offset + limit < len(items) else None
+        return web.json_response({"news": page, "next_page_token": token})
+
+    async def _stream(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        await ws.send_json([{"T": "success", "msg": "connected"}])
+        authenticated = False
+
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                continue
+            action = json.loads(msg.data)
+            if action.get("action") == "auth":
+                if (self.key is None or action.get("key") == self.key) and \
+                        (self.secret is None or action.get("secret") == self.secret):
+                    authenticated = True
+                    await ws.send_json([{"T": "success", "msg": "authenticated"}])
+                else:
+                    await ws.send_json([{"T": "error", "code": 402, "msg": "auth failed"}])
+                    break
+            elif action.get("action") == "subscribe":
+                if not authenticated:
+                    await ws.send_json([{"T": "error", "code": 401, "msg": "not authenticated"}])
+                    break
+                await ws.send_json([{"T": "subscription", "news": action.get("news", [])}])
+                self._clients.setdefault(ws, set()).update(action.get("news", []))
+
+        self._clients.pop(ws, None)
+        return ws
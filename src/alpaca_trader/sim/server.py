@@ -0,0 +1,60 @@
+import asyncio
+import json
+from typing import Any, Dict, Optional
+from aiohttp import web
+
+class StandInServer:
+    """
+    Base of the local Alpaca stand-ins: an aiohttp app served in the running loop, plus
+    the set of subscribed WebSocket clients (with what each subscribed to).
+    """
+
+    binary_frames = False # Send pushed messages as binary frames (the trading stream does)
+
+    def __init__(self):
+        self.app = web.Application()
+        self.base_url = ""
+        self._runner: Optional[web.AppRunner] = None
+        self._clients: Dict[web.WebSocketResponse, Any] = {}
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve in the running loop. Returns the base URL."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://{host}:{port}"
+        return self.base_url
+
+    async def close(self):
+        await self.disconnect()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def disconnect(self):
+        """Drop every client (what a network blip looks like to the bot)."""
+        for ws in list(self._clients):
+            await ws.close()
+        self._clients.clear()
+
+    async def wait_for_clients(self, count: int = 1, timeout: float = 5.0):
+        """Block until `count` clients are subscribed."""
+        deadline = asyncio.get_running_loop().time() + timeout
+        while len(self._clients) < count:
+            if asyncio.get_running_loop().time() > deadline:
+                raise TimeoutError(f"{len(self._clients)} of {count} clients subscribed")
+            await asyncio.sleep(0.01)
+
+    async def _broadcast(self, message: Any, wants=lambda subscription: True):
+        payload = json.dumps(message)
+        for ws, subscription in list(self._clients.items()):
+            if not wants(subscription):
+                continue
+            try:
+                if self.binary_frames:
+                    await ws.send_bytes(payload.encode())
+                else:
+                    await ws.send_str(payload)
+            except ConnectionError:
+                self._clients.pop(ws, None)
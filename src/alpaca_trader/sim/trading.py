@@ -0,0 +1,79 @@
+import json
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+from aiohttp import WSMsgType, web
+from alpaca_trader.sim.server import StandInServer
+
+class TradeUpdatesServer(StandInServer):
+    """
+    Local stand-in for Alpaca's trading stream (`/stream`), for testing fill tracking offline.
+
+    Speaks the real protocol: auth -> {"stream": "authorization"}, listen ->
+    {"stream": "listening"}, then {"stream": "trade_updates", "data": {...}} events,
+    as binary frames like the live endpoint. `emit()` pushes one order event to every
+    client listening to trade_updates; `disconnect()` drops them all.
+    """
+
+    binary_frames = True
+
+    def __init__(self, key: Optional[str] = None, secret: Optional[str] = None):
+        super().__init__()
+        self.key = key
+        self.secret = secret
+        self.app.router.add_get("/stream", self._stream)
+
+    @property
+    def ws_url(self) -> str:
+        return self.base_url.replace("http://", "ws://", 1) + "/stream"
+
+    async def emit(self, event: str, order: dict, price: Optional[float] = None, qty: Optional[float] = None,
+                   position_qty: Optional[float] = None, timestamp: Optional[datetime] = None) -> dict:
+        """Push one order event. Numbers go out as strings, like Alpaca's."""
+        order = dict({"id": str(uuid.uuid4()), "side": "buy", "filled_qty": "0"}, **order)
+        data = {"event": event, "order": order,
+                "timestamp": (timestamp or datetime.now(timezone.utc)).isoformat().replace("+00:00", "Z")}
+        if price is not None:
+            data["price"] = str(price)
+        if qty is not None:
+            data["qty"] = str(qty)
+        if position_qty is not None:
+            data["position_qty"] = str(position_qty)
+        # Clients' subscriptions are the sets of streams they listen to
+        await self._broadcast({"stream": "trade_updates", "data": data},
+                              lambda streams: "trade_updates" in streams)
+        return data
+
+    async def _stream(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        authenticated = False
+
+        async for msg in ws:
+            if msg.type not in (WSMsgType.TEXT, WSMsgType.BINARY):
+                continue
+            action = json.loads(msg.data)
+            if action.get("action") == "auth":
+                if (self.key is None or action.get("key") == self.key) and \
+                        (self.secret is None or action.get("secret") == self.secret):
+                    authenticated = True
+                    await self._send(ws, {"stream": "authorization",
+                                          "data": {"action": "authenticate", "status": "authorized"}})
+                else:
+                    await self._send(ws, {"stream": "authorization",
+                                          "data": {"action": "authenticate", "status": "unauthorized"}})
+                    break
+            elif action.get("action") == "listen":
+                if not authenticated:
+                    await self._send(ws, {"stream": "authorization", "data": {"status": "unauthorized"}})
+                    break
+                streams = action.get("data", {}).get("streams", [])
+                await self._send(ws, {"stream": "listening", "data": {"streams": streams}})
+                self._clients.setdefault(ws, set()).update(streams)
+
+        self._clients.pop(ws, None)
+        return ws
+
+    @staticmethod
+    async def _send(ws: web.WebSocketResponse, message: dict):
+        await ws.send_bytes(json.dumps(message).encode())
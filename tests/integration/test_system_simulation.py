@@ -1,8 +1,10 @@
 import pytest
 from unittest.mock import MagicMock, call
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from alpaca_trader.config.settings import settings
 from alpaca_trader.core.bot import AlpacaBot
+from alpaca_trader.core.news_archive import NewsArchive
 from alpaca_trader.models.asset import Asset
 from alpaca_trader.core.news import NewsArticle
 from alpaca.trading.requests import MarketOrderRequest, OrderSide
@@ -12,9 +14,12 @@ from alpaca.trading.requests import MarketOrderRequest, OrderSide
 # ----------------------------------------------------------------
 
 @pytest.fixture
-def mock_bot(mocker):
+def mock_bot(mocker, monkeypatch, tmp_path):
     """Creates a bot with all external clients mocked."""
     
+    # Local stores (bars, news archive) go to a scratch directory
+    monkeypatch.setattr(settings, "data_dir", str(tmp_path))
+    
     # Mock MarketService
     mocker.patch('alpaca_trader.core.market.StockHistoricalDataClient')
     mocker.patch('alpaca_trader.core.market.TradingClient') # This patches the class instantiation
@@ -37,6 +42,7 @@ def mock_bot(mocker):
     bot.market.data_client = MagicMock()
     
     bot.news_client = MagicMock()
+    bot.news_poller.client = bot.news_client
     
     # Override components to use these same mocks
     bot.screener.market = bot.market
@@ -77,17 +83,18 @@ def test_full_system_simulation(mock_bot):
     # ----------------------------------------
     # STEP 2: NEWS & SIGNAL SIMULATION
     # ----------------------------------------
-    # Mock News API returning a valid hit
-    mock_item = MagicMock()
-    mock_item.id = "news_123"
-    mock_item.headline = "WXYZ Reports Massive Earnings Beat Amazing Excellent"
-    mock_item.symbols = [symbol]
-    mock_item.source = "Benzinga"
-    mock_item.created_at = datetime.now()
-    mock_item.summary = "EPS up 500% year over year. Wonderful performance. Fantastic."
-    mock_item.url = "http://fake.url"
-    
-    mock_bot.news_client.get_news.return_value.news = [mock_item]
+    # Mock News API returning a valid hit (raw JSON page)
+    mock_item = {
+        "id": "news_123",
+        "headline": "WXYZ Reports Massive Earnings Beat Amazing Excellent",
+        "symbols": [symbol],
+        "source": "Benzinga",
+        "created_at": datetime.now().isoformat(),
+        "summary": "EPS up 500% year over year. Wonderful performance. Fantastic.",
+        "url": "http://fake.url",
+    }
+    
+    mock_bot.news_client.get.return_value = {"news": [mock_item], "next_page_token": None}
     
     # Mock Techs (RSI) to be safe (50)
     mock_bot.tech.get_rsi = MagicMock(return_value=50.0)
@@ -172,3 +179,30 @@ def test_full_system_simulation(mock_bot):
     # Position should be removed from local tracking
     assert symbol not in mock_bot.pm.trades
     print(f"[5] Runner Stopped out at $11.50")
+
+# ----------------------------------------------------------------
+# 🔁 RESTART
+# ----------------------------------------------------------------
+
+@pytest.mark.parametrize("downtime, resumes_at", [
+    (timedelta(hours=2), timedelta(hours=2)), # Past the stream's 30 minute lookback
+    (timedelta(hours=30), timedelta(hours=24)), # Clamped like the poller
+])
+def test_restart_resumes_news_stream_from_archive(mocker, monkeypatch, tmp_path, downtime, resumes_at):
+    """The stream resumes where the previous run stopped, not at its default lookback."""
+    monkeypatch.setattr(settings, "data_dir", str(tmp_path))
+    now = datetime.now(timezone.utc)
+    archive = NewsArchive()
+    archive.set_watermark(now - downtime)
+    archive.close()
+
+    mocker.patch('alpaca_trader.core.bot.MarketService')
+    mocker.patch('alpaca_trader.core.bot.NewsClient')
+    mocker.patch('alpaca_trader.core.bot.BackgroundScheduler')
+    bot = AlpacaBot()
+    bot.market.runner.submit.side_effect = lambda coro: coro.close() or MagicMock()
+
+    bot.start_news_stream()
+
+    assert bot.news_stream.watermark == bot.news_poller.watermark
+    assert abs((now - bot.news_stream.watermark) - resumes_at) < timedelta(minutes=1)
@@ -0,0 +1,52 @@
+import asyncio
+from contextlib import AsyncExitStack
+import pytest
+from alpaca_trader.config.settings import settings
+
+# ----------------------------------------------------------------
+# 🔌 STREAMS AGAINST THE LOCAL STAND-INS (see alpaca_trader/sim)
+# ----------------------------------------------------------------
+
+@pytest.fixture
+def fast_reconnect(monkeypatch):
+    monkeypatch.setattr(settings, "api_backoff_base", 0.01)
+
+async def _wait_until(condition, timeout=5.0, interval=0.005):
+    for _ in range(int(timeout / interval)):
+        if condition():
+            return
+        await asyncio.sleep(interval)
+    raise TimeoutError("condition not met")
+
+@pytest.fixture
+def wait_until():
+    """`await wait_until(condition)`: poll until true, TimeoutError after `timeout` seconds."""
+    return _wait_until
+
+@pytest.fixture
+def run_stream(fast_reconnect):
+    """
+    `run_stream(server, make_stream, test)`: start the stand-in `server`, run the stream
+    `make_stream(server, stack)` builds against it (extra resources go on the AsyncExitStack),
+    return `await test(server, stream, task)`, then stop and tear everything down.
+    `connected=True` waits for the stream to subscribe before the test starts.
+    """
+    def run(server, make_stream, test, connected=False):
+        async def main():
+            await server.start()
+            async with AsyncExitStack() as stack:
+                stream = make_stream(server, stack)
+                task = asyncio.create_task(stream.run())
+                try:
+                    if connected:
+                        await server.wait_for_clients()
+                    return await test(server, stream, task)
+                finally:
+                    await stream.stop()
+                    if not task.done():
+                        await asyncio.wait_for(task, 5)
+                    await server.close()
+
+        return asyncio.run(main())
+
+    return run
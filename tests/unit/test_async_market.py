@@ -0,0 +1,116 @@
+import asyncio
+import time
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from alpaca_trader.core.async_market import AsyncMarketService, AsyncRunner
+from alpaca_trader.core.transport import AlpacaTransport
+
+# ----------------------------------------------------------------
+# 🧪 LOCAL ALPACA STAND-IN
+# ----------------------------------------------------------------
+
+CLOSES = [10 + (i % 7) * 0.1 + i * 0.01 for i in range(60)]
+
+def make_bar(i, close):
+    return {"t": f"2025-12-12T15:{i:02d}:00Z", "o": close, "h": close, "l": close, "c": close, "v": 1000 + i}
+
+def build_app(state):
+    async def snapshots(request):
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.05)
+        state["in_flight"] -= 1
+        if state.get("throttle", 0) > 0:
+            state["throttle"] -= 1
+            return web.json_response({"message": "too many requests"}, status=429)
+        symbols = request.query["symbols"].split(",")
+        return web.json_response({s: {"latestTrade": {"p": 5.0}} for s in symbols})
+
+    async def bars(request):
+        # Two pages of 30 bars each
+        page = int(request.query.get("page_token", "0"))
+        rows = [make_bar(i, CLOSES[i]) for i in range(page * 30, page * 30 + 30)]
+        body = {"bars": {request.query["symbols"]: rows}, "next_page_token": "1" if page == 0 else None}
+        return web.json_response(body)
+
+    async def news(request):
+        return web.json_response({"news": [{"id": 1, "headline": "FDA approval"}], "next_page_token": None})
+
+    app = web.Application()
+    app.router.add_get("/v2/stocks/snapshots", snapshots)
+    app.router.add_get("/v2/stocks/bars", bars)
+    app.router.add_get("/v1beta1/news", news)
+    return app
+
+def run_with_server(test, state=None):
+    """Start the stand-in, run `test(service, state)` against it, tear everything down."""
+    state = state if state is not None else {}
+    state.setdefault("in_flight", 0)
+    state.setdefault("max_in_flight", 0)
+
+    async def main():
+        server = TestServer(build_app(state))
+        await server.start_server()
+        url = str(server.make_url("")).rstrip("/")
+        transport = AlpacaTransport(rate_per_min=60_000, burst=100, max_retries=3, backoff=0.001)
+        try:
+            async with AsyncMarketService(transport, data_url=url, trading_url=url) as service:
+                return await test(service, state)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+# ----------------------------------------------------------------
+# ⚡ CONCURRENCY
+# ----------------------------------------------------------------
+
+def test_snapshot_requests_are_in_flight_together():
+    chunks = [[f"S{i}" for i in range(j, j + 10)] for j in range(0, 100, 10)]
+
+    async def test(service, state):
+        start = time.perf_counter()
+        results = await asyncio.gather(*(service.get_snapshots(c) for c in chunks))
+        return results, time.perf_counter() - start
+
+    state = {}
+    results, elapsed = run_with_server(test, state)
+
+    assert [list(r) for r in results] == chunks
+    assert state["max_in_flight"] == 10
+    assert elapsed < 10 * 0.05 # Far below ten sequential round trips
+
+def test_throttled_requests_are_retried():
+    async def test(service, state):
+        return await service.get_snapshots(["AAA"])
+
+    state = {"throttle": 2}
+    assert run_with_server(test, state) == {"AAA": {"latestTrade": {"p": 5.0}}}
+    assert state["throttle"] == 0
+
+# ----------------------------------------------------------------
+# 📈 BARS & NEWS
+# ----------------------------------------------------------------
+
+def test_bars_follow_pagination():
+    async def test(service, state):
+        return await service.get_bars(["AAA"])
+
+    bars = run_with_server(test)
+    assert len(bars["AAA"]) == 60
+
+def test_news_returns_raw_articles():
+    async def test(service, state):
+        return await service.get_news(limit=10)
+
+    assert run_with_server(test)[0]["headline"] == "FDA approval"
+
+def test_runner_bridges_sync_callers():
+    runner = AsyncRunner()
+    try:
+        async def add(a, b):
+            await asyncio.sleep(0)
+            return a + b
+        assert runner.run(add(2, 3), timeout=1) == 5
+    finally:
+        runner.stop()
@@ -0,0 +1,307 @@
+import pytest
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+from datetime import datetime, timedelta, timezone
+from alpaca.data.timeframe import TimeFrame, TimeFrameUnit
+from types import SimpleNamespace
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.bar_cache import BarBuffer, BarCache
+from alpaca_trader.core.technicals import Technicals, rsi_from_closes, volume_divergence
+
+# ----------------------------------------------------------------
+# 🧪 FAKE MARKET (minute bars generated on a simulated clock)
+# ----------------------------------------------------------------
+
+# Simulated session starts a day ago, inside the cache's backfill window
+T0 = (datetime.now(timezone.utc) - timedelta(days=1)).replace(second=0, microsecond=0)
+
+def as_utc(ts):
+    """The SDK stores request times as naive UTC."""
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+class FakeDataClient:
+    def __init__(self, history_minutes=600):
+        self.now = T0 + timedelta(minutes=history_minutes)
+        self.requests = []
+        self.bars_served = 0
+
+    def bar(self, minute):
+        close = 10 + np.sin(minute / 5.0)
+        return SimpleNamespace(
+            timestamp=T0 + timedelta(minutes=minute),
+            open=close, high=close + 0.05, low=close - 0.05, close=close, volume=1000 + minute
+        )
+
+    def get_stock_bars(self, req):
+        self.requests.append(req)
+        symbols = req.symbol_or_symbols if isinstance(req.symbol_or_symbols, list) else [req.symbol_or_symbols]
+        first = max(0, int((as_utc(req.start) - T0).total_seconds() // 60))
+        last = int((self.now - T0).total_seconds() // 60)
+        data = {s: [self.bar(m) for m in range(first, last)] for s in symbols}
+        self.bars_served += sum(len(v) for v in data.values())
+        return SimpleNamespace(data=data)
+
+@pytest.fixture(autouse=True)
+def no_throttle(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "bar_cache_refresh_seconds", 0.0)
+    monkeypatch.setattr(settings, "data_dir", str(tmp_path))
+
+# ----------------------------------------------------------------
+# 🔁 RING BUFFER
+# ----------------------------------------------------------------
+
+def test_ring_buffer_keeps_latest_bars_in_order():
+    buffer = BarBuffer(capacity=5)
+    for start in (0, 3, 6):
+        ts = np.arange(start, start + 3, dtype=float)
+        buffer.append(ts, np.vstack([ts] * 5))
+
+    window = buffer.window()
+    np.testing.assert_array_equal(window["timestamp"], [4, 5, 6, 7, 8])
+    np.testing.assert_array_equal(buffer.window(2)["close"], [7, 8])
+
+def test_ring_buffer_ignores_stale_bars():
+    buffer = BarBuffer(capacity=10)
+    buffer.append(np.array([1.0, 2.0]), np.ones((5, 2)))
+    added = buffer.append(np.array([2.0, 3.0]), np.ones((5, 2)))
+
+    assert added == 1
+    assert buffer.last_ts == 3.0
+
+# ----------------------------------------------------------------
+# 📦 CACHE
+# ----------------------------------------------------------------
+
+def test_incremental_refresh_fetches_only_new_bars():
+    client = FakeDataClient()
+    cache = BarCache(client, capacity=1000)
+
+    cache.get("AAA")
+    client.now += timedelta(minutes=2)
+    client.bars_served = 0
+    cache.get("AAA")
+
+    assert client.bars_served == 2
+    assert as_utc(client.requests[-1].start) == client.now - timedelta(minutes=2)
+
+def test_warm_symbols_share_one_request():
+    client = FakeDataClient()
+    cache = BarCache(client, capacity=1000)
+    cache.refresh(["AAA", "BBB", "CCC"])
+    client.now += timedelta(minutes=1)
+    client.requests.clear()
+
+    cache.refresh(["AAA", "BBB", "CCC"])
+
+    assert len(client.requests) == 1
+    assert client.requests[0].symbol_or_symbols == ["AAA", "BBB", "CCC"]
+
+def test_stale_symbol_does_not_widen_the_shared_window():
+    client = FakeDataClient()
+    cache = BarCache(client, capacity=1000)
+    cache.refresh(["AAA", "BBB", "CCC"])
+    # Halted since: its last bar stays an hour behind the others
+    client.now += timedelta(minutes=60)
+    cache.refresh(["AAA", "BBB"])
+    client.now += timedelta(minutes=1)
+    client.requests.clear()
+    client.bars_served = 0
+
+    cache.refresh(["AAA", "BBB", "CCC"])
+
+    assert [r.symbol_or_symbols for r in client.requests] == [["AAA", "BBB"], ["CCC"]]
+    assert client.bars_served == 2 * 1 + 61
+
+def test_incremental_fetch_is_capped_at_the_lookback():
+    client = FakeDataClient()
+    cache = BarCache(client, capacity=1000)
+    # Last cached bar from a week ago (e.g. restored from disk after a long outage)
+    week_ago = (datetime.now(timezone.utc) - timedelta(days=7)).timestamp()
+    cache.buffers["AAA"] = BarBuffer(1000)
+    cache.buffers["AAA"].append(np.array([week_ago]), np.ones((5, 1)))
+
+    cache.refresh(["AAA"])
+
+    floor = datetime.now(timezone.utc) - timedelta(days=settings.bar_cache_lookback_days)
+    assert abs(as_utc(client.requests[0].start) - floor) < timedelta(minutes=1)
+
+def test_evict_drops_symbols_outside_keep_set():
+    cache = BarCache(FakeDataClient())
+    cache.refresh(["AAA", "BBB"])
+    cache.store.last_ts("BBB") # Maps the symbol's file
+
+    assert cache.evict({"AAA"}) == ["BBB"]
+    assert "AAA" in cache and "BBB" not in cache
+    # The store's mapping (an open file descriptor) goes with it
+    assert "BBB" not in cache.store._maps
+
+def test_bar_traffic_reduced_by_more_than_95_percent():
+    """One hour of update_trades (RSI + divergence every minute) on a held position."""
+    client = FakeDataClient()
+    tech = Technicals(client)
+
+    for _ in range(60):
+        client.now += timedelta(minutes=1)
+        tech.get_rsi("AAA")
+        tech.check_volume_divergence("AAA")
+
+    warm_bars = client.bars_served - 600 # Excluding the one-off backfill
+    legacy_bars = 60 * (100 + 5) # 100 bars for RSI + 5 for divergence, every minute
+    assert warm_bars / legacy_bars < 0.05
+
+def test_rsi_streams_over_cached_history():
+    client = FakeDataClient()
+    tech = Technicals(client)
+
+    tech.get_rsi("AAA")
+    client.now += timedelta(minutes=3)
+    rsi = tech.get_rsi("AAA")
+
+    closes = pd.Series([client.bar(m).close for m in range(603)])
+    assert rsi == pytest.approx(ta.rsi(closes, length=14).iloc[-1])
+    assert tech.get_indicators("AAA").last_ts == client.bar(602).timestamp.timestamp()
+
+def test_non_default_rsi_length_uses_window():
+    client = FakeDataClient()
+    tech = Technicals(client)
+
+    closes = np.array([client.bar(m).close for m in range(500, 600)])
+    assert tech.get_rsi("AAA", length=7) == pytest.approx(rsi_from_closes(closes, 7))
+
+# ----------------------------------------------------------------
+# 📊 BATCHED TECHNICALS
+# ----------------------------------------------------------------
+
+def test_batch_matches_single_symbol_results():
+    client = FakeDataClient()
+    batch = Technicals(client).get_batch(["AAA", "BBB"])
+    single = Technicals(FakeDataClient())
+
+    for symbol in ("AAA", "BBB"):
+        assert batch[symbol].rsi == pytest.approx(single.get_rsi(symbol))
+        assert batch[symbol].volume_divergence == single.check_volume_divergence(symbol)
+
+def test_batch_pass_is_one_request_for_all_positions():
+    client = FakeDataClient()
+    tech = Technicals(client)
+    symbols = [f"S{i}" for i in range(25)]
+    tech.get_batch(symbols) # Backfill
+    client.now += timedelta(minutes=1)
+    client.requests.clear()
+
+    tech.get_batch(symbols)
+
+    assert len(client.requests) == 1
+    assert client.requests[0].symbol_or_symbols == symbols
+
+def test_batch_divergence_is_vectorized_per_symbol():
+    """Only the symbol whose last bar made a higher close on lower volume is flagged."""
+    client = FakeDataClient()
+    tech = Technicals(client)
+    tech.bars.refresh(["UP", "DOWN"])
+    for symbol, (close, volume) in {"UP": (99.0, 1.0), "DOWN": (1.0, 1e9)}.items():
+        last = tech.bars.buffers[symbol].last_ts
+        tech.bars.buffers[symbol].append(np.array([last + 60]), np.array([[close], [close], [close], [close], [volume]]))
+
+    signals = tech.get_batch(["UP", "DOWN", "NEW"])
+
+    assert signals["UP"].volume_divergence is True
+    assert signals["DOWN"].volume_divergence is False
+    assert signals["NEW"].volume_divergence == volume_divergence(
+        tech.bars.peek("NEW", 2)["close"], tech.bars.peek("NEW", 2)["volume"])
+
+def test_batch_degrades_to_neutral_on_errors():
+    client = FakeDataClient()
+    client.get_stock_bars = lambda req: (_ for _ in ()).throw(Exception("API Error"))
+
+    signals = Technicals(client).get_batch(["AAA"])
+
+    assert signals["AAA"].rsi == 50.0
+    assert signals["AAA"].volume_divergence is False
+
+# ----------------------------------------------------------------
+# 💽 ON-DISK STORE
+# ----------------------------------------------------------------
+
+def test_fetched_bars_are_written_through_to_store():
+    client = FakeDataClient(history_minutes=120)
+    cache = BarCache(client)
+    cache.refresh(["AAPL"])
+
+    stored = cache.store.read("AAPL")
+    np.testing.assert_array_equal(stored["close"], cache.peek("AAPL")["close"])
+
+def test_warm_restart_needs_only_the_missing_bars():
+    client = FakeDataClient(history_minutes=600)
+    BarCache(client).refresh(["AAPL", "MSFT"])
+    assert client.bars_served == 1200
+
+    # Process restarts 5 minutes later: buffers come from disk, network serves the gap
+    client.now += timedelta(minutes=5)
+    client.bars_served = 0
+    restarted = BarCache(client)
+    restarted.refresh(["AAPL", "MSFT"])
+
+    assert client.bars_served == 10
+    assert restarted.stats["loaded"] == 1200
+    assert len(restarted.peek("AAPL")["close"]) == 605
+
+def test_backfill_fills_store_without_touching_buffers():
+    client = FakeDataClient(history_minutes=300)
+    cache = BarCache(client)
+
+    assert cache.backfill(["AAPL", "MSFT"]) == 600
+    assert "AAPL" not in cache
+    # Second pass resumes from the last stored bar
+    client.now += timedelta(minutes=3)
+    assert cache.backfill(["AAPL", "MSFT"]) == 6
+    assert len(client.requests) == 2
+
+def test_technicals_read_store_before_network():
+    client = FakeDataClient(history_minutes=600)
+    BarCache(client).backfill(["AAPL"])
+    client.requests.clear()
+
+    tech = Technicals(client)
+    rsi = tech.get_rsi("AAPL")
+
+    # One incremental request from the last stored bar, none of it a cold backfill
+    assert len(client.requests) == 1
+    assert client.bars_served == 600
+    closes = tech.bars.peek("AAPL")["close"]
+    assert rsi == pytest.approx(rsi_from_closes(closes))
+
+# ----------------------------------------------------------------
+# 🕯️ HIGHER TIMEFRAMES
+# ----------------------------------------------------------------
+
+def test_higher_timeframe_rsi_needs_no_extra_requests():
+    client = FakeDataClient(history_minutes=1200)
+    tech = Technicals(client)
+    tech.get_rsi("AAPL")
+    requests = len(client.requests)
+
+    five = TimeFrame(5, TimeFrameUnit.Minute)
+    rsi_5m = tech.get_rsi("AAPL", timeframe=five)
+    rsi_15m = tech.get_rsi("AAPL", timeframe=TimeFrame(15, TimeFrameUnit.Minute))
+    rsi_1h = tech.get_rsi("AAPL", timeframe=TimeFrame.Hour)
+
+    assert len(client.requests) == requests + 3 # one incremental refresh each, no backfills
+    assert client.bars_served == 1200
+    closes = tech.get_bars("AAPL", five)["close"]
+    assert len(closes) >= 240 # seeded from the store, beyond the 1000-bar cache
+    assert rsi_5m == pytest.approx(rsi_from_closes(closes[-100:]))
+    assert 0 < rsi_15m < 100 and 0 < rsi_1h < 100
+
+def test_resampled_bars_follow_new_minutes():
+    client = FakeDataClient(history_minutes=600)
+    tech = Technicals(client)
+    five = TimeFrame(5, TimeFrameUnit.Minute)
+    tech.get_bars("AAPL", five)
+
+    client.now += timedelta(minutes=7)
+    bars = tech.get_bars("AAPL", five)
+    minutes = tech.bars.peek("AAPL")
+    assert bars["close"][-1] == minutes["close"][-1]
+    assert bars["timestamp"][-1] <= minutes["timestamp"][-1] < bars["timestamp"][-1] + 300
@@ -0,0 +1,78 @@
+import pytest
+import numpy as np
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.bar_store import BarStore
+
+# ----------------------------------------------------------------
+# 🧪 FIXTURES
+# ----------------------------------------------------------------
+
+@pytest.fixture
+def store(tmp_path):
+    return BarStore(tmp_path / "bars")
+
+def bars(start, n):
+    ts = 60.0 * np.arange(start, start + n)
+    return ts, np.vstack([ts / 60 + i for i in range(5)])
+
+# ----------------------------------------------------------------
+# 💽 APPEND / READ
+# ----------------------------------------------------------------
+
+def test_append_then_read_round_trips(store):
+    ts, values = bars(0, 10)
+    assert store.append("AAPL", ts, values) == 10
+
+    records = store.read("AAPL")
+    np.testing.assert_array_equal(records["timestamp"], ts)
+    np.testing.assert_array_equal(records["close"], values[3])
+    assert store.last_ts("AAPL") == ts[-1]
+    assert store.symbols() == ["AAPL"]
+
+def test_symbol_names_round_trip_through_file_names(store):
+    for symbol in ("BRK/B", "BRK_B", "BRK.B"):
+        store.append(symbol, *bars(0, 3))
+
+    assert store.symbols() == ["BRK.B", "BRK/B", "BRK_B"]
+    assert store.count("BRK/B") == 3
+
+def test_append_skips_bars_already_stored(store):
+    store.append("AAPL", *bars(0, 10))
+    assert store.append("AAPL", *bars(5, 10)) == 5
+    np.testing.assert_array_equal(store.read("AAPL")["timestamp"], 60.0 * np.arange(15))
+
+def test_read_time_range_is_a_zero_copy_view(store):
+    store.append("AAPL", *bars(0, 100))
+
+    window = store.window("AAPL", start=60.0 * 10, end=60.0 * 19)
+    assert len(window["close"]) == 10
+    assert window["timestamp"][0] == 600.0
+    assert np.shares_memory(window["close"], store.read("AAPL"))
+
+def test_tail_and_missing_symbol(store):
+    store.append("AAPL", *bars(0, 10))
+    np.testing.assert_array_equal(store.tail("AAPL", 3)["timestamp"], [420.0, 480.0, 540.0])
+    assert len(store.read("MSFT")) == 0
+    assert store.last_ts("MSFT") is None
+
+def test_torn_trailing_record_is_dropped(store):
+    store.append("AAPL", *bars(0, 5))
+    with open(store.path("AAPL"), "ab") as f:
+        f.write(b"\x00" * 7) # Crash mid-write
+
+    assert store.count("AAPL") == 5
+    store.append("AAPL", *bars(5, 2))
+    np.testing.assert_array_equal(store.read("AAPL")["timestamp"], 60.0 * np.arange(7))
+
+def test_open_mappings_are_bounded(store, monkeypatch):
+    monkeypatch.setattr(settings, "bar_store_open_maps", 4)
+    symbols = [f"S{i}" for i in range(10)]
+    for symbol in symbols:
+        store.append(symbol, *bars(0, 5))
+        assert store.last_ts(symbol) == 240.0
+
+    assert list(store._maps) == symbols[-4:]
+    # An evicted symbol is simply mapped again
+    np.testing.assert_array_equal(store.read("S0")["timestamp"], 60.0 * np.arange(5))
+    store.release("S0")
+    assert "S0" not in store._maps
@@ -0,0 +1,79 @@
+import threading
+import time
+import pytest
+from alpaca_trader.core.dedup import DedupStore, minhash, similarity
+
+# ----------------------------------------------------------------
+# 🧪 FIXTURES
+# ----------------------------------------------------------------
+
+T0 = 1_700_000_000.0
+
+@pytest.fixture
+def store():
+    return DedupStore(ttl_hours=48, max_entries=100, min_similarity=0.7)
+
+# ----------------------------------------------------------------
+# 🔁 ID AND NEAR-DUPLICATES
+# ----------------------------------------------------------------
+
+def test_repeat_id_is_duplicate(store):
+    assert store.check("1", "Moderna Receives FDA Approval For RSV Vaccine", "MRNA", now=T0) is None
+    assert store.check("1", "Completely different headline", "MRNA", now=T0 + 60) == "id"
+
+def test_rewritten_headline_is_near_duplicate(store):
+    store.check("1", "Moderna Receives FDA Approval For RSV Vaccine", "MRNA", now=T0)
+    assert store.check("2", "Moderna Gets FDA Approval For RSV Vaccine", "MRNA", now=T0 + 60) == "near_duplicate"
+    assert store.check("3", "MODERNA RECEIVES FDA APPROVAL FOR RSV VACCINE", "MRNA", now=T0 + 60) == "near_duplicate"
+
+def test_unrelated_and_other_symbol_are_new(store):
+    store.check("1", "Moderna Receives FDA Approval For RSV Vaccine", "MRNA", now=T0)
+    assert store.check("2", "Tesla Recalls 2 Million Vehicles Over Autopilot", "TSLA", now=T0) is None
+    # Same template, different ticker: not a rewrite
+    assert store.check("3", "Pfizer Receives FDA Approval For RSV Vaccine", "PFE", now=T0) is None
+
+def test_find_does_not_record(store):
+    assert store.find("1", "Apple Beats Q3 Earnings Estimates", now=T0) is None
+    assert "1" not in store
+    store.add("1", "Apple Beats Q3 Earnings Estimates", now=T0)
+    assert store.find("9", "Apple beats Q3 earnings estimates", now=T0) == "near_duplicate"
+
+def test_concurrent_checks_record_the_article_once(store, monkeypatch):
+    # Widen the window between lookup and insert: both threads would see "new" without one lock
+    find = store._find
+    monkeypatch.setattr(store, "_find", lambda *args: (find(*args), time.sleep(0.05))[0])
+    reasons = []
+    threads = [threading.Thread(target=lambda: reasons.append(store.check("1", "Apple Beats Q3 Estimates", now=T0)))
+               for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(reasons, key=str) == [None, "id"]
+
+def test_similarity_estimates_word_overlap():
+    a = minhash("XYZ Corp Announces Merger Agreement With ABC Inc")
+    assert similarity(a, minhash("xyz corp announces merger agreement with abc inc.")) == 1.0
+    assert similarity(a, minhash("Tesla Recalls 2 Million Vehicles Over Autopilot")) < 0.3
+
+# ----------------------------------------------------------------
+# 🧹 BOUNDED MEMORY
+# ----------------------------------------------------------------
+
+def test_entries_expire_after_ttl(store):
+    store.check("1", "Apple Beats Q3 Earnings Estimates", "AAPL", now=T0)
+    assert store.check("2", "Apple Beats Q3 Earnings Estimates", "AAPL", now=T0 + 47 * 3600) == "near_duplicate"
+    assert store.check("3", "Apple Beats Q3 Earnings Estimates", "AAPL", now=T0 + 49 * 3600) is None
+    assert "1" not in store
+
+def test_max_entries_caps_memory():
+    store = DedupStore(ttl_hours=48, max_entries=50, min_similarity=0.7)
+    for i in range(500):
+        store.check(str(i), f"w{i} x{i} y{i} z{i}", "SYM", now=T0 + i)
+
+    assert len(store) == 50
+    assert "0" not in store and "499" in store
+    # Index holds only live entries
+    live = {article_id for bucket in store._index.values() for article_id in bucket}
+    assert live == {str(i) for i in range(450, 500)}
@@ -1,9 +1,10 @@
 import pytest
 from unittest.mock import MagicMock
 from datetime import datetime, timedelta
+from alpaca_trader.config.settings import settings
 from alpaca_trader.core.position_manager import PositionManager, TradeState
-from alpaca.trading.requests import OrderSide
-from alpaca_trader.core.technicals import Technicals
+from alpaca.trading.requests import OrderSide, StopOrderRequest, TrailingStopOrderRequest
+from alpaca_trader.core.technicals import TechnicalSignals, Technicals
 
 # ----------------------------------------------------------------
 # 🧪 FIXTURES
@@ -12,10 +13,20 @@ from alpaca_trader.core.technicals import Technicals
 @pytest.fixture
 def mock_clients():
     trading_client = MagicMock()
+    # Like the API: unknown client_order_id -> error (no earlier attempt went through)
+    trading_client.get_order_by_client_id.side_effect = Exception("order not found")
     technicals = MagicMock()
     # Default behavior: RSI is normal
     technicals.get_rsi.return_value = 50.0
     technicals.check_volume_divergence.return_value = False
+    # Batch API reads the same knobs, so tests can keep tuning get_rsi / check_volume_divergence
+    technicals.get_batch.side_effect = lambda symbols: {
+        s: TechnicalSignals(
+            rsi=technicals.get_rsi.return_value,
+            volume_divergence=technicals.check_volume_divergence.return_value
+        )
+        for s in symbols
+    }
     return trading_client, technicals
 
 @pytest.fixture
@@ -38,7 +49,7 @@ def create_mock_position(symbol, entry_price, current_price, qty=100):
 def test_open_position_submits_buy_order(pm):
     """Verify that open_position calls client.submit_order with BUY side."""
     symbol = "TEST"
-    pm.open_position(symbol, amount_usd=5000)
+    pm.open_position(symbol, amount_usd=5000).result()
     
     assert pm.client.submit_order.called
     args, kwargs = pm.client.submit_order.call_args
@@ -47,12 +58,107 @@ def test_open_position_submits_buy_order(pm):
     assert request.symbol == symbol
     assert request.side == OrderSide.BUY
     assert request.notional == 5000 
+    assert request.client_order_id.startswith("entry-TEST-")
 
 def test_open_position_handles_error(pm):
     """Verify that exceptions during order submission are handled gracefully."""
     pm.client.submit_order.side_effect = Exception("API Error")
-    result = pm.open_position("FAIL", amount_usd=1000)
-    assert result is False
+    result = pm.open_position("FAIL", amount_usd=1000).result()
+    assert result is None
+    # The failed order no longer blocks a new entry
+    assert pm.can_enter("FAIL")
+
+def test_duplicate_entry_suppressed_until_order_ends(pm):
+    """Verify two signals close together buy once; the slot frees on the order's final event."""
+    first = pm.open_position("TEST")
+    assert pm.open_position("TEST") is None
+    first.result()
+    assert pm.client.submit_order.call_count == 1
+    assert "TEST" not in pm.trades
+
+    client_order_id = pm.orders.in_flight("TEST").client_order_id
+    pm.handle_trade_update({"event": "canceled",
+                            "order": {"id": "order-1", "client_order_id": client_order_id, "symbol": "TEST"}})
+    assert pm.open_position("TEST") is not None
+
+def test_entry_without_trade_updates_blocks_until_reconciled(pm, monkeypatch):
+    """Verify a stream-down entry keeps blocking past the timeout until the position is tracked."""
+    monkeypatch.setattr(settings, "order_inflight_timeout", 0.0)
+    order = MagicMock(status="accepted")
+    pm.client.get_order_by_client_id.side_effect = None
+    pm.client.get_order_by_client_id.return_value = order
+    pm.open_position("DOWN").result()
+
+    # No fill / cancel event ever arrives; the broker still has the order open
+    assert not pm.can_enter("DOWN")
+    assert pm.open_position("DOWN") is None
+
+    # Filled at the broker: the slot is released once reconcile already tracks the position
+    order.status = "filled"
+    pm.client.get_all_positions.return_value = [create_mock_position("DOWN", 10.0, 10.0)]
+    pm.reconcile()
+    assert pm.orders.in_flight("DOWN") is None
+    assert not pm.can_enter("DOWN")
+    assert pm.client.submit_order.call_count == 1
+
+def test_retried_submit_resolves_to_accepted_order(pm):
+    """Verify a duplicate client_order_id rejection (retry of an accepted POST) is not a failure."""
+    accepted = MagicMock()
+    pm.client.submit_order.side_effect = Exception("client_order_id must be unique")
+    pm.client.get_order_by_client_id.side_effect = None
+    pm.client.get_order_by_client_id.return_value = accepted
+
+    assert pm.open_position("TEST").result() is accepted
+    assert pm.orders.stats["failed"] == 0
+
+# ----------------------------------------------------------------
+# 📡 TRADE UPDATE TESTS
+# ----------------------------------------------------------------
+
+def test_fill_event_tracks_exact_entry(pm):
+    """Verify a buy fill opens the trade at the execution price, not a later poll's."""
+    pm.open_position("FILL").result()
+    client_order_id = pm.orders.in_flight("FILL").client_order_id
+    pm.handle_trade_update({
+        "event": "fill", "price": "12.34", "qty": "50", "position_qty": "50",
+        "timestamp": "2025-12-12T14:30:05Z",
+        "order": {"id": "order-1", "client_order_id": client_order_id, "symbol": "FILL", "side": "buy"},
+    })
+
+    state = pm.trades["FILL"]
+    assert state.entry_price == 12.34
+    assert state.qty == 50
+    assert state.entry_time.tzinfo is None
+    assert pm.orders.in_flight("FILL") is None
+
+def test_reconcile_reactivates_filled_trade(pm):
+    """Verify a poll that raced the fill does not leave the trade inactive."""
+    pm.handle_trade_update({
+        "event": "fill", "price": "10", "qty": "100", "position_qty": "100",
+        "order": {"id": "order-1", "symbol": "RACE", "side": "buy"},
+    })
+    pm.trades["RACE"].is_active = False
+    pm.client.get_all_positions.return_value = [create_mock_position("RACE", 10.0, 10.5)]
+
+    pm.reconcile()
+
+    assert pm.trades["RACE"].is_active is True
+    assert pm.trades["RACE"].entry_price == 10.0
+
+def test_fill_during_positions_fetch_stays_active(pm):
+    """Verify a fill newer than the poll's positions is not taken for an external close."""
+    def positions_before_the_fill():
+        pm.handle_trade_update({
+            "event": "fill", "price": "10", "qty": "100", "position_qty": "100",
+            "order": {"id": "order-1", "symbol": "LATE", "side": "buy"},
+        })
+        return []
+    pm.client.get_all_positions.side_effect = positions_before_the_fill
+
+    pm.update_trades()
+
+    assert pm.trades["LATE"].is_active is True
+    assert "LATE" in pm.held()
 
 # ----------------------------------------------------------------
 # 🔴 SELL TESTS
@@ -186,3 +292,138 @@ def test_rsi_overheat_sell(pm):
     pm.update_trades()
     
     assert pm.client.close_position.called
+
+def test_tick_stop_retries_after_cooldown(pm, monkeypatch):
+    """Verify a failed tick-triggered sell is not re-sent on every tick."""
+    monkeypatch.setattr(settings, "exit_retry_seconds", 60.0)
+    pm.trades["DROP"] = TradeState(symbol="DROP", entry_price=100.0, entry_time=datetime.now(),
+                                   qty=100, max_price=100.0)
+    pm.client.get_position.return_value = create_mock_position("DROP", 100.0, 90.0)
+    pm.client.close_position.side_effect = Exception("API Error")
+
+    pm.on_price("DROP", 99.0)
+    assert not pm.client.close_position.called
+
+    for _ in range(5):
+        pm.on_price("DROP", 90.0)
+        pm.orders.wait()
+    assert pm.client.close_position.call_count == 1
+    assert "DROP" in pm.trades
+
+# ----------------------------------------------------------------
+# 🛡️ PROTECTIVE ORDER TESTS
+# ----------------------------------------------------------------
+
+@pytest.fixture
+def protected_pm(pm, monkeypatch):
+    monkeypatch.setattr(settings, "protective_orders_enabled", True)
+    pm.client.submit_order.return_value.id = "stop-1"
+    pm.client.get_order_by_id.return_value.status = "canceled"
+    pm.client.get_orders.return_value = []
+    return pm
+
+def entry_fill(pm, symbol="SAFE", price="20.0", qty="10.6"):
+    pm.handle_trade_update({
+        "event": "fill", "price": price, "qty": qty, "position_qty": qty,
+        "order": {"id": "order-1", "symbol": symbol, "side": "buy"},
+    })
+
+def test_entry_fill_attaches_broker_stop(protected_pm):
+    """Verify a completed entry gets a whole-share stop at the hard-stop price."""
+    entry_fill(protected_pm)
+
+    req = protected_pm.client.submit_order.call_args[0][0]
+    assert isinstance(req, StopOrderRequest)
+    assert req.side == OrderSide.SELL
+    assert req.qty == 10
+    assert req.stop_price == 19.0
+    assert req.client_order_id.startswith("stop-SAFE-")
+    assert protected_pm.trades["SAFE"].stop_order_id == "stop-1"
+
+def test_protective_submit_resolves_to_accepted_order(protected_pm):
+    """Verify a stop the broker accepted before the connection dropped is adopted, not re-placed."""
+    protected_pm.client.submit_order.side_effect = ConnectionError("reset")
+    protected_pm.client.get_order_by_client_id.side_effect = None
+    protected_pm.client.get_order_by_client_id.return_value.id = "stop-9"
+
+    entry_fill(protected_pm)
+
+    req = protected_pm.client.submit_order.call_args[0][0]
+    protected_pm.client.get_order_by_client_id.assert_called_once_with(req.client_order_id)
+    assert protected_pm.trades["SAFE"].stop_order_id == "stop-9"
+
+def test_protected_trade_skips_local_stops(protected_pm):
+    """Verify the broker, not a local market order, enforces the protected stop."""
+    entry_fill(protected_pm)
+    protected_pm.client.get_orders.return_value = [
+        MagicMock(symbol="SAFE", id="stop-1", order_type="stop")
+    ]
+    protected_pm.client.get_all_positions.return_value = [create_mock_position("SAFE", 20.0, 18.0, qty=10.6)]
+
+    protected_pm.on_price("SAFE", 18.0)
+    protected_pm.update_trades()
+
+    assert not protected_pm.client.close_position.called
+    assert protected_pm.trades["SAFE"].stop_order_id == "stop-1"
+
+def test_tier1_replaces_stop_with_trailing_stop(protected_pm):
+    """Verify Tier 1 cancels the stop, sells half, then trails the runner at the broker."""
+    entry_fill(protected_pm, qty="100")
+    pos = create_mock_position("SAFE", 20.0, 21.5, qty=100)
+    protected_pm.client.get_all_positions.return_value = [pos]
+    protected_pm.client.get_orders.return_value = [MagicMock(symbol="SAFE", id="stop-1", order_type="stop")]
+    protected_pm.client.get_position.return_value = pos
+    protected_pm.client.submit_order.return_value.id = "trail-1"
+
+    protected_pm.update_trades()
+
+    protected_pm.client.cancel_order_by_id.assert_called_once_with("stop-1")
+    sell, trail = [c[0][0] for c in protected_pm.client.submit_order.call_args_list[1:]]
+    assert sell.qty == 50 and sell.side == OrderSide.SELL
+    assert isinstance(trail, TrailingStopOrderRequest)
+    assert trail.qty == 50 and trail.trail_percent == 3.0
+    state = protected_pm.trades["SAFE"]
+    assert state.tier1_sold is True
+    assert state.stop_order_id == "trail-1"
+
+def test_protective_order_events_update_state(protected_pm):
+    """Verify replace / fill events of the protective order are followed."""
+    entry_fill(protected_pm, qty="10")
+    stop = {"id": "stop-1", "symbol": "SAFE", "side": "sell", "type": "stop"}
+
+    protected_pm.handle_trade_update({"event": "replaced", "order": dict(stop, replaced_by="stop-2")})
+    assert protected_pm.trades["SAFE"].stop_order_id == "stop-2"
+
+    protected_pm.handle_trade_update({"event": "fill", "price": "18.9", "qty": "10", "position_qty": "0",
+                                      "order": dict(stop, id="stop-2")})
+    assert "SAFE" not in protected_pm.trades
+
+def test_reconcile_adopts_open_protective_orders(protected_pm):
+    """Verify a restart picks up the broker's trailing stop instead of placing another order."""
+    protected_pm.client.get_all_positions.return_value = [create_mock_position("SAFE", 20.0, 22.0, qty=50)]
+    protected_pm.client.get_orders.return_value = [
+        MagicMock(symbol="SAFE", id="trail-9", order_type="trailing_stop")
+    ]
+
+    protected_pm.reconcile()
+
+    state = protected_pm.trades["SAFE"]
+    assert state.stop_order_id == "trail-9"
+    assert state.tier1_sold is True
+    assert not protected_pm.client.submit_order.called
+    # One request covers up to the API's max page, not its default 50
+    assert protected_pm.client.get_orders.call_args[0][0].limit == 500
+
+def test_reconcile_places_nothing_from_a_full_order_page(protected_pm):
+    """Verify a possibly truncated order list never makes a protected position look bare."""
+    entry_fill(protected_pm)
+    protected_pm.client.submit_order.reset_mock()
+    protected_pm.client.get_all_positions.return_value = [create_mock_position("SAFE", 20.0, 20.0, qty=10.6)]
+    protected_pm.client.get_orders.return_value = [
+        MagicMock(symbol=f"S{i}", id=f"stop-{i}", order_type="stop") for i in range(500)
+    ]
+
+    protected_pm.reconcile()
+
+    assert protected_pm.trades["SAFE"].stop_order_id == "stop-1"
+    assert not protected_pm.client.submit_order.called
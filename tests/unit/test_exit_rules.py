@@ -0,0 +1,97 @@
+import time
+import numpy as np
+import pytest
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.exit_rules import ExitRules
+
+# ----------------------------------------------------------------
+# 🧪 FIXTURES
+# ----------------------------------------------------------------
+
+def frame(**columns):
+    """One row per position; unspecified columns hold a flat, fresh, neutral position."""
+    rows = len(next(iter(columns.values()))) if columns else 1
+    defaults = {"entry_price": 100.0, "price": 100.0, "max_price": 100.0, "held_minutes": 5.0,
+                "tier1_sold": 0.0, "protected": 0.0, "rsi": 50.0, "volume_divergence": 0.0}
+    return {name: np.asarray(columns.get(name, [value] * rows), dtype=np.float64)
+            for name, value in defaults.items()}
+
+@pytest.fixture
+def engine():
+    return ExitRules()
+
+def fired(engine, f, tick=False):
+    return [None if i < 0 else engine.rules[i].name for i in engine.evaluate(f, tick)]
+
+# ----------------------------------------------------------------
+# 📏 DEFAULT RULES (the thresholds update_trades used to hard-code)
+# ----------------------------------------------------------------
+
+def test_each_default_rule_fires(engine):
+    f = frame(
+        price=[94.0, 101.0, 107.0, 106.0, 105.0, 105.0, 102.0],
+        max_price=[100.0, 101.0, 107.0, 110.0, 105.0, 105.0, 102.0],
+        held_minutes=[5, 50, 5, 5, 5, 5, 5],
+        tier1_sold=[0, 0, 0, 1, 0, 0, 0],
+        rsi=[50, 50, 50, 50, 90, 50, 50],
+        volume_divergence=[0, 0, 0, 0, 0, 1, 0],
+    )
+    assert fired(engine, f) == ["hard_stop", "stale_timer", "tier1", "runner_trailing_stop",
+                                "rsi_overheat", "volume_exhaustion", None]
+
+def test_first_matching_rule_wins(engine):
+    # Stale and overheated, but also through the hard stop
+    f = frame(price=[90.0], held_minutes=[60], rsi=[95])
+    decisions = engine.decide(["AAA"], f)
+    assert [(d.symbol, d.rule, d.sell) for d in decisions] == [("AAA", "hard_stop", 1.0)]
+
+def test_protected_positions_skip_price_stops(engine):
+    f = frame(price=[90.0, 106.0], max_price=[100.0, 110.0], tier1_sold=[0, 1], protected=[1, 1])
+    assert fired(engine, f) == [None, None]
+
+def test_tick_pass_only_runs_tick_rules(engine):
+    f = frame(price=[94.0, 101.0], held_minutes=[5, 60], rsi=[np.nan, np.nan], volume_divergence=[np.nan, np.nan])
+    assert fired(engine, f, tick=True) == ["hard_stop", None]
+
+def test_partial_rule_and_thresholds(engine):
+    assert [r.sell for r in engine.rules if r.name == "tier1"] == [0.5]
+    assert engine.threshold("hard_stop", "profit_pct") == -0.05
+    assert engine.threshold("runner_trailing_stop", "drawdown_pct") == 0.03
+    assert engine.threshold("missing", "profit_pct") is None
+
+# ----------------------------------------------------------------
+# ⚙️ CONFIGURATION
+# ----------------------------------------------------------------
+
+def test_thresholds_come_from_settings(monkeypatch):
+    monkeypatch.setattr(settings, "exit_rules", [
+        {"name": "tight_stop", "sell": 1.0, "when": {"field": "profit_pct", "lt": -0.02}},
+    ])
+    engine = ExitRules()
+    assert fired(engine, frame(price=[97.0, 99.0])) == ["tight_stop", None]
+
+@pytest.mark.parametrize("spec", [
+    {"name": "x", "when": {"field": "nope", "gt": 1}},
+    {"name": "x", "sell": 1.5, "when": {"field": "rsi", "gt": 80}},
+    {"when": {"field": "rsi", "gt": 80}},
+    {"name": "x", "sel": 0.5, "when": {"field": "rsi", "gt": 80}},
+])
+def test_invalid_rules_fail_at_compile_time(spec):
+    with pytest.raises(ValueError):
+        ExitRules([spec])
+
+def test_thousand_positions_in_one_pass(engine):
+    rng = np.random.default_rng(0)
+    n = 1000
+    f = frame(price=rng.uniform(80, 120, n), max_price=np.full(n, 120.0), held_minutes=rng.uniform(0, 90, n),
+              tier1_sold=rng.integers(0, 2, n), rsi=rng.uniform(20, 95, n), volume_divergence=rng.integers(0, 2, n))
+    symbols = [f"S{i}" for i in range(n)]
+
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter()
+        decisions = engine.decide(symbols, dict(f))
+        best = min(best, time.perf_counter() - started)
+
+    assert len(decisions) > 0
+    assert best < 0.01
@@ -0,0 +1,90 @@
+import os
+import pytest
+import numpy as np
+from unittest.mock import MagicMock
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.fundamentals import FundamentalsIndex
+from alpaca_trader.core.screener import MarketScreener
+
+# ----------------------------------------------------------------
+# 🧪 FIXTURES
+# ----------------------------------------------------------------
+
+RECORDS = [
+    {"symbol": "SMALL", "shares_outstanding": 100_000_000, "float_shares": 80_000_000, "sector": "Healthcare"},
+    {"symbol": "MEGA", "shares_outstanding": 5_000_000_000, "float_shares": 4_900_000_000, "sector": "Technology"},
+    {"symbol": "MICRO", "shares_outstanding": 10_000_000, "sector": "Energy"},
+]
+
+def create_raw_snapshot(price, volume=500_000):
+    return {"latestTrade": {"p": price}, "dailyBar": {"v": volume}}
+
+@pytest.fixture
+def data_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "data_dir", str(tmp_path))
+    return tmp_path
+
+@pytest.fixture
+def screener(data_dir):
+    market = MagicMock()
+    market.get_snapshots_raw.return_value = {
+        "SMALL": create_raw_snapshot(10.0),   # $1B
+        "MEGA": create_raw_snapshot(10.0),    # $50B
+        "MICRO": create_raw_snapshot(10.0),   # $100M
+        "UNLISTED": create_raw_snapshot(10.0),
+    }
+    screener = MarketScreener(market)
+    screener.tradable_symbols = ["MEGA", "MICRO", "SMALL", "UNLISTED"]
+    return screener
+
+# ----------------------------------------------------------------
+# 📚 INDEX
+# ----------------------------------------------------------------
+
+def test_index_is_memory_mapped_and_vectorized(data_dir):
+    FundamentalsIndex.write(RECORDS)
+    index = FundamentalsIndex.open()
+
+    assert isinstance(index.table, np.memmap)
+    shares = index.column("shares_outstanding", np.array(["MICRO", "NOPE", "SMALL"], dtype=object))
+    np.testing.assert_array_equal(shares, [10_000_000, np.nan, 100_000_000])
+    assert np.isnan(index.column("float_shares", np.array(["MICRO"]))[0])
+    assert index.sector("SMALL") == "Healthcare"
+    assert index.sector("NOPE") is None
+
+def test_missing_index_file_returns_none(data_dir):
+    assert FundamentalsIndex.open() is None
+
+# ----------------------------------------------------------------
+# 💰 MARKET CAP FILTER
+# ----------------------------------------------------------------
+
+def test_screen_enforces_market_cap_band(screener):
+    FundamentalsIndex.write(RECORDS)
+
+    assets = screener.run_screen()
+
+    assert [a.symbol for a in assets] == ["SMALL"]
+    assert assets[0].market_cap == pytest.approx(1_000_000_000)
+
+def test_unknown_market_cap_can_be_kept(screener, monkeypatch):
+    FundamentalsIndex.write(RECORDS)
+    monkeypatch.setattr(settings, "market_cap_keep_unknown", True)
+
+    assets = screener.run_screen()
+
+    assert [a.symbol for a in assets] == ["SMALL", "UNLISTED"]
+    assert assets[1].market_cap is None
+
+def test_screen_passes_through_without_index(screener):
+    assets = screener.run_screen()
+    assert len(assets) == 4
+
+def test_offline_rebuild_is_picked_up(screener):
+    FundamentalsIndex.write(RECORDS)
+    assert [a.symbol for a in screener.run_screen()] == ["SMALL"]
+
+    path = FundamentalsIndex.write(RECORDS + [{"symbol": "UNLISTED", "shares_outstanding": 50_000_000}])
+    os.utime(path, (screener.fundamentals.mtime + 10, screener.fundamentals.mtime + 10))
+
+    assert [a.symbol for a in screener.run_screen()] == ["SMALL", "UNLISTED"]
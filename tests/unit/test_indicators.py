@@ -0,0 +1,83 @@
+import pytest
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+from alpaca_trader.core.indicators import EMA, VWAP, IndicatorState, RollingMean, WilderRSI
+
+# ----------------------------------------------------------------
+# 🧪 REPLAYED HISTORY
+# ----------------------------------------------------------------
+
+@pytest.fixture
+def history():
+    """Two sessions of random-walk minute bars."""
+    rng = np.random.default_rng(42)
+    n = 780
+    close = 10 + np.cumsum(rng.normal(0, 0.05, n))
+    spread = rng.uniform(0.01, 0.1, n)
+    index = pd.date_range("2025-12-11 14:30", periods=390, freq="min").append(
+        pd.date_range("2025-12-12 14:30", periods=390, freq="min"))
+    return pd.DataFrame({
+        "high": close + spread,
+        "low": close - spread,
+        "close": close,
+        "volume": rng.integers(1_000, 50_000, n).astype(float),
+    }, index=index)
+
+def epoch_seconds(index):
+    return (index - pd.Timestamp("1970-01-01")).total_seconds().to_numpy()
+
+def replay(indicator, values):
+    return np.array([indicator.update(v) for v in values])
+
+def assert_matches(streamed, reference):
+    reference = reference.to_numpy(dtype=float)
+    ready = ~np.isnan(reference)
+    np.testing.assert_array_equal(np.isnan(streamed), ~ready)
+    np.testing.assert_allclose(streamed[ready], reference[ready], rtol=1e-9)
+
+# ----------------------------------------------------------------
+# 📐 EQUIVALENCE WITH pandas_ta
+# ----------------------------------------------------------------
+
+@pytest.mark.parametrize("length", [2, 14, 30])
+def test_wilder_rsi_matches_pandas_ta(history, length):
+    streamed = replay(WilderRSI(length), history["close"])
+    assert_matches(streamed, ta.rsi(history["close"], length=length))
+
+@pytest.mark.parametrize("length", [5, 9, 21])
+def test_ema_matches_pandas_ta(history, length):
+    streamed = replay(EMA(length), history["close"])
+    assert_matches(streamed, ta.ema(history["close"], length=length))
+
+def test_vwap_matches_pandas_ta_and_resets_daily(history):
+    vwap = VWAP()
+    ts = epoch_seconds(history.index)
+    streamed = np.array([
+        vwap.update(t, h, l, c, v)
+        for t, h, l, c, v in zip(ts, history["high"], history["low"], history["close"], history["volume"])
+    ])
+    assert_matches(streamed, ta.vwap(history["high"], history["low"], history["close"], history["volume"]))
+
+def test_volume_average_matches_pandas_ta(history):
+    streamed = replay(RollingMean(20), history["volume"])
+    assert_matches(streamed, ta.sma(history["volume"], length=20))
+
+# ----------------------------------------------------------------
+# 🔁 INCREMENTAL STATE
+# ----------------------------------------------------------------
+
+def test_state_skips_bars_already_consumed(history):
+    ts = epoch_seconds(history.index)
+    bars = {"timestamp": ts, **{c: history[c].to_numpy() for c in ("high", "low", "close", "volume")}}
+    head = {k: v[:500] for k, v in bars.items()}
+
+    state = IndicatorState()
+    state.update_many(head)
+    state.update_many(bars) # Overlapping window: first 500 bars are ignored
+
+    assert state.last_ts == ts[-1]
+    assert state.rsi.value == pytest.approx(ta.rsi(history["close"], length=14).iloc[-1])
+
+def test_rsi_flat_series_has_no_value():
+    assert np.isnan(replay(WilderRSI(3), [5.0] * 10)[-1])
@@ -0,0 +1,76 @@
+import pytest
+from alpaca_trader.core.keywords import KeywordMatcher, literal_prefix
+from alpaca_trader.core.news import NewsEngine
+
+# ----------------------------------------------------------------
+# 🧪 FIXTURES
+# ----------------------------------------------------------------
+
+@pytest.fixture
+def material():
+    return KeywordMatcher(NewsEngine.ALLOWED_KEYWORDS)
+
+@pytest.fixture
+def banned():
+    return KeywordMatcher(NewsEngine.BANNED_KEYWORDS)
+
+# ----------------------------------------------------------------
+# 🔎 MATCHING
+# ----------------------------------------------------------------
+
+def test_reports_which_keywords_matched(material, banned):
+    assert material.matches("ABC Reports Q3 Earnings Beat") == ["earnings", "beat", "report"]
+    assert banned.matches("Why AAPL Is Moving After Analyst Upgrade") == ["why (.*) is moving", "upgrade"]
+    assert material.matches("CEO eats a sandwich") == []
+
+def test_keywords_must_start_on_word_boundary(material, banned):
+    assert not material.search("Company steps up hiring") # "eps"
+    assert not banned.search("Operating income rose") # "rating"
+    assert material.search("EPS of $1.20")
+    assert material.search("Pre-earnings drift")
+
+def test_case_insensitive(material):
+    assert material.search("FDA CLEARANCE GRANTED")
+    assert material.matches("Form 4 filed") == ["form 4"]
+
+def test_regex_escapes_keep_their_case():
+    matcher = KeywordMatcher([r"phase\S+"])
+    assert matcher.matches("Phase-3 data") == [r"phase\S+"]
+    assert not matcher.search("Phase 3 data")
+
+def test_keywords_starting_with_a_symbol_match():
+    matcher = KeywordMatcher(["$1b deal", r"\$2b buyback"])
+    assert matcher.matches("XYZ announces $1B deal") == ["$1b deal"]
+    assert matcher.search("Board approves $2B buyback")
+
+def test_literal_prefix():
+    assert literal_prefix("form 4") == "form 4"
+    assert literal_prefix("why (.*) is moving") == "why "
+    assert literal_prefix("colou?r") == "colo"
+    assert literal_prefix("buy|sell") is None
+    assert literal_prefix(".*guidance") is None
+
+def test_empty_list_matches_nothing():
+    matcher = KeywordMatcher([])
+    assert not matcher.search("anything at all")
+    assert matcher.matches("anything") == []
+
+# ----------------------------------------------------------------
+# 📂 RUNTIME-LOADED LISTS
+# ----------------------------------------------------------------
+
+def test_from_file_skips_comments_and_blanks(tmp_path):
+    path = tmp_path / "keywords.txt"
+    path.write_text("# catalysts\nSpin-off\n\nbuyback\nphase (2|3)\n", encoding="utf-8")
+    matcher = KeywordMatcher.from_file(str(path))
+
+    assert matcher.keywords == ["Spin-off", "buyback", "phase (2|3)"]
+    assert matcher.search("Board approves $1B buyback")
+    assert matcher.matches("Phase 3 trial and spin-off") == ["Spin-off", "phase (2|3)"]
+
+def test_engine_reloads_keywords_at_runtime():
+    engine = NewsEngine()
+    assert not engine._is_material("Company announces stock buyback")
+    engine.load_keywords(allowed=["buyback"])
+    assert engine._is_material("Company announces stock buyback")
+    assert engine._is_banned("Top 10 Stocks to Watch") # banned list untouched
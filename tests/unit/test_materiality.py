@@ -0,0 +1,92 @@
+import pytest
+import numpy as np
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.materiality import MaterialityModel, featurize
+from alpaca_trader.core.news import NewsEngine
+
+# ----------------------------------------------------------------
+# 🧪 FIXTURES
+# ----------------------------------------------------------------
+
+MATERIAL = [
+    "{} reports third quarter earnings above estimates",
+    "{} receives FDA approval for lead drug candidate",
+    "{} to be acquired in all-cash buyout",
+    "{} awarded $300 million government contract",
+    "{} raises full-year revenue guidance",
+    "{} announces merger agreement with rival",
+]
+NOISE = [
+    "Top stocks to watch this week including {}",
+    "Why {} shares are trading higher today",
+    "{} CEO to speak at investor conference",
+    "Is {} a buy? Our analysts weigh in",
+    "{} stock: what the charts say",
+    "5 things to know about {} before the open",
+]
+SYMBOLS = ["ACME", "GLOBEX", "INITECH", "UMBRELLA", "HOOLI", "STARK", "WAYNE", "TYRELL"]
+
+@pytest.fixture(scope="module")
+def corpus():
+    texts, labels = [], []
+    for symbol in SYMBOLS:
+        texts += [t.format(symbol) for t in MATERIAL] + [t.format(symbol) for t in NOISE]
+        labels += [1] * len(MATERIAL) + [0] * len(NOISE)
+    return texts, np.array(labels)
+
+@pytest.fixture(scope="module")
+def model(corpus):
+    return MaterialityModel.train(*corpus, n_bits=12, epochs=150)
+
+# ----------------------------------------------------------------
+# 🧠 MODEL
+# ----------------------------------------------------------------
+
+def test_featurize_is_stable_and_signed():
+    index, sign = featurize("FDA approval granted", n_bits=10)
+    again, _ = featurize("fda APPROVAL granted", n_bits=10)
+    assert len(index) == 5 # 3 words + 2 bigrams
+    np.testing.assert_array_equal(index, again)
+    assert index.max() < 1024 and set(np.unique(sign)) <= {-1.0, 1.0}
+
+def test_trained_model_separates_unseen_symbols(model):
+    texts = ["Cyberdyne receives FDA approval for new device", "Top stocks to watch including Cyberdyne"]
+    probs = model.predict_proba(texts)
+    assert probs[0] > 0.5 > probs[1]
+
+def test_batch_scores_match_single_scores(model, corpus):
+    texts = corpus[0][:10]
+    batch = model.decision(texts)
+    single = [model.decision([t])[0] for t in texts]
+    np.testing.assert_allclose(batch, single)
+
+def test_save_and_open_round_trip(model, tmp_path):
+    path = model.save(tmp_path / "materiality.npz")
+    loaded = MaterialityModel.open(path)
+    assert loaded.n_bits == 12 and loaded.weights.dtype == np.float32
+    np.testing.assert_allclose(loaded.decision(["merger agreement"]), model.decision(["merger agreement"]), rtol=1e-5)
+    assert MaterialityModel.open(tmp_path / "missing.npz") is None
+
+# ----------------------------------------------------------------
+# 🔀 SWITCHABLE FILTER STAGE
+# ----------------------------------------------------------------
+
+def test_engine_uses_model_when_selected(model, tmp_path, monkeypatch):
+    path = model.save(tmp_path / "materiality.npz")
+    monkeypatch.setattr(settings, "news_materiality_filter", "model")
+    monkeypatch.setattr(settings, "news_materiality_model_path", str(path))
+
+    engine = NewsEngine()
+    assert engine.classifier is not None
+    assert engine._is_material("Cyberdyne awarded $1B government contract")
+    mask = engine.material_mask(["Cyberdyne awarded $1B government contract", "Cyberdyne CEO to speak at conference"])
+    assert mask.tolist() == [True, False]
+
+def test_engine_falls_back_to_keywords_without_model(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "news_materiality_filter", "model")
+    monkeypatch.setattr(settings, "news_materiality_model_path", str(tmp_path / "missing.npz"))
+
+    engine = NewsEngine()
+    assert engine.classifier is None
+    assert engine._is_material("ABC Reports Q3 Earnings Beat")
+    assert engine.material_mask(["FDA Approves New Drug", "CEO eats a sandwich"]).tolist() == [True, False]
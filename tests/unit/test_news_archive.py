@@ -0,0 +1,78 @@
+import time
+from datetime import datetime, timedelta, timezone
+import pytest
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.news import NewsArticle, NewsEngine
+from alpaca_trader.core.news_archive import NewsArchive
+
+def make_article(i, symbol="AAA", headline=None, minutes_ago=0):
+    return NewsArticle(
+        id=str(i), symbol=symbol, source="Benzinga",
+        headline=headline or f"{symbol} wins excellent contract number {i}",
+        summary="Amazing quarter", created_at=datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)
+    )
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = NewsArchive(tmp_path / "news.sqlite3")
+    yield archive
+    archive.close()
+
+# ----------------------------------------------------------------
+# 💾 STORAGE
+# ----------------------------------------------------------------
+
+def test_missing_archive_reads_empty_without_creating_a_file(archive):
+    assert archive.recent(0) == []
+    assert archive.watermark() is None
+    assert archive.articles() == []
+    assert not archive.path.exists()
+
+def test_records_round_trip_as_raw_articles(archive):
+    archive.record(make_article(2, minutes_ago=1), "signal", 0.6)
+    archive.record(make_article(1, minutes_ago=5), "banned")
+    archive.record(make_article(1, symbol="BBB", minutes_ago=5), "not_material")
+
+    rows = archive.articles()
+    assert [(r["id"], r["symbols"]) for r in rows] == [("1", ["AAA"]), ("1", ["BBB"]), ("2", ["AAA"])]
+    assert rows[-1]["sentiment"] == 0.6 and rows[0]["sentiment"] is None
+
+    assert [r["id"] for r in archive.articles(verdict="signal")] == ["2"]
+    assert [r["symbols"] for r in archive.articles(symbol="BBB")] == [["BBB"]]
+    since = datetime.now(timezone.utc) - timedelta(minutes=2)
+    assert [r["id"] for r in archive.articles(start=since)] == ["2"]
+
+def test_watermark_never_moves_backwards(archive):
+    t = datetime(2025, 12, 12, 15, 0, tzinfo=timezone.utc)
+    archive.set_watermark(t)
+    archive.set_watermark(t - timedelta(minutes=5))
+    assert archive.watermark() == t
+
+    archive.close()
+    assert NewsArchive(archive.path).watermark() == t # Survives a restart
+
+# ----------------------------------------------------------------
+# 🔁 WARM RESTART
+# ----------------------------------------------------------------
+
+def test_restarted_engine_does_not_trade_twice(archive):
+    article = make_article(1, headline="AAA Reports Earnings Beat, Excellent Results")
+    assert NewsEngine(archive=archive).process_article(article) is not None
+    assert archive.recent(0)[0][4] is not None # Headline signature stored with the row
+    archive.close()
+
+    restarted = NewsEngine(archive=NewsArchive(archive.path))
+    assert len(restarted.dedup) == 1
+    assert restarted.process_article(article.model_copy()) is None
+
+    # Rewritten headline of the same story is caught too
+    rewrite = make_article(2, headline="AAA Reports Earnings Beat, Excellent Results Today")
+    assert restarted.process_article(rewrite) is None
+
+def test_restore_only_covers_the_dedup_window(archive, monkeypatch):
+    monkeypatch.setattr(settings, "news_dedup_ttl_hours", 1.0)
+    archive.record(make_article(1), "signal", 0.5, processed_at=time.time() - 7200)
+    archive.record(make_article(2), "signal", 0.5)
+
+    engine = NewsEngine(archive=archive)
+    assert "AAA:2" in engine.dedup and "AAA:1" not in engine.dedup
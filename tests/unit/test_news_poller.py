@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.news_poller import NewsPoller
+from alpaca_trader.core.stream import parse_time
+
+# ----------------------------------------------------------------
+# 🧪 FAKE NEWS ENDPOINT
+# ----------------------------------------------------------------
+
+T0 = datetime(2025, 12, 12, 14, 30, tzinfo=timezone.utc)
+
+def stamp(seconds: float) -> str:
+    return (T0 + timedelta(seconds=seconds)).isoformat().replace("+00:00", "Z")
+
+class FakeNewsClient:
+    """`GET /news` with inclusive `start`, ascending sort and page tokens, like Alpaca's."""
+
+    def __init__(self):
+        self.articles = []
+        self.requests = []
+
+    def publish(self, count: int, at=None):
+        for _ in range(count):
+            i = len(self.articles)
+            self.articles.append({"id": i, "headline": f"Article {i}", "symbols": ["AAA"],
+                                  "created_at": stamp(i if at is None else at)})
+
+    def get(self, path, data):
+        assert path == "/news"
+        self.requests.append(dict(data))
+        start = parse_time(data["start"])
+        matching = [a for a in self.articles if parse_time(a["created_at"]) >= start]
+        offset = int(data.get("page_token") or 0)
+        page = matching[offset:offset + data["limit"]]
+        more = offset + data["limit"] < len(matching)
+        return {"news": page, "next_page_token": str(offset + data["limit"]) if more else None}
+
+@pytest.fixture
+def client():
+    return FakeNewsClient()
+
+@pytest.fixture
+def poller(client):
+    return NewsPoller(client, watermark=T0 - timedelta(minutes=1))
+
+# ----------------------------------------------------------------
+# 📄 PAGINATION & WATERMARK
+# ----------------------------------------------------------------
+
+def test_busy_interval_follows_every_page(client, poller):
+    client.publish(620)
+
+    articles = poller.poll()
+
+    assert [a["id"] for a in articles] == list(range(620))
+    assert len(client.requests) == 13 # 50 per page
+    assert poller.watermark == parse_time(stamp(619))
+
+def test_watermark_comes_from_received_articles(client, poller):
+    client.publish(3)
+    assert len(poller.poll()) == 3
+
+    # Nothing new: the inclusive start re-sends the newest article, which is skipped
+    assert poller.poll() == []
+
+    client.publish(2)
+    assert [a["id"] for a in poller.poll()] == [3, 4]
+
+def test_articles_sharing_the_watermark_timestamp_are_not_lost(client, poller):
+    client.publish(2, at=10)
+    assert len(poller.poll()) == 2
+
+    # Published later, stamped the same second
+    client.publish(1, at=10)
+    assert [a["id"] for a in poller.poll()] == [2]
+
+def test_page_limit_resumes_on_next_poll(client, poller, monkeypatch):
+    monkeypatch.setattr(settings, "news_poll_max_pages", 2)
+    client.publish(230)
+
+    first = poller.poll()
+    second = poller.poll()
+    rest = poller.poll() + poller.poll()
+
+    assert len(first) == 100
+    assert [a["id"] for a in first + second + rest] == list(range(230))
+
+def test_content_only_requested_when_needed(client):
+    NewsPoller(client, watermark=T0).poll()
+    NewsPoller(client, watermark=T0, include_content=True).poll()
+
+    assert "include_content" not in client.requests[0]
+    assert client.requests[1]["include_content"] == "true"
+    assert client.requests[0]["sort"] == "asc"
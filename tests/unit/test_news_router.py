@@ -0,0 +1,55 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+import pytest
+from alpaca_trader.core.news import NewsEngine
+from alpaca_trader.core.news_router import NewsRouter, normalize
+
+def raw(symbols, i=1, headline="Acme wins Navy contract, raises guidance strongly"):
+    return {"id": i, "headline": headline, "summary": "Excellent quarter", "symbols": symbols,
+            "source": "Benzinga", "url": "http://x", "created_at": datetime.now(timezone.utc).isoformat()}
+
+@pytest.fixture
+def router():
+    return NewsRouter({"AAA", "BBB"})
+
+# ----------------------------------------------------------------
+# 🧭 ROUTING
+# ----------------------------------------------------------------
+
+def test_irrelevant_articles_produce_no_candidates(router):
+    assert router.route(raw(["ZZZ", "YYY"])) == []
+    assert router.route(raw([])) == []
+    assert router.stats == {"routed": 0, "ignored": 2, "candidates": 0}
+
+def test_one_candidate_per_watched_symbol(router):
+    candidates = router.route(raw(["ZZZ", "BBB", "AAA", "BBB"]))
+
+    assert [a.symbol for a in candidates] == ["BBB", "AAA"]
+    assert {a.id for a in candidates} == {"1"}
+    assert candidates[0].headline == candidates[1].headline
+
+def test_watchlist_update_rebuilds_the_index(router):
+    router.update({"ZZZ"})
+    assert [a.symbol for a in router.route(raw(["ZZZ", "AAA"]))] == ["ZZZ"]
+
+def test_models_and_dicts_normalize_the_same():
+    item = raw(["AAA"])
+    model = SimpleNamespace(**dict(item, created_at=datetime.fromisoformat(item["created_at"])))
+
+    assert normalize(item) == normalize(model)
+    assert normalize(item).symbols == ("AAA",)
+    assert normalize({"id": 7}).headline == "No Headline"
+
+# ----------------------------------------------------------------
+# 🔥 MULTI-SYMBOL SIGNALS
+# ----------------------------------------------------------------
+
+def test_each_symbol_of_a_shared_article_can_signal(router):
+    engine = NewsEngine()
+    candidates = router.route(raw(["AAA", "BBB"]))
+
+    signals = [engine.process_article(a) for a in candidates]
+    assert [s.symbol for s in signals if s] == ["AAA", "BBB"]
+
+    # A repeat of the same article is still a duplicate for both symbols
+    assert not any(engine.process_article(a) for a in router.route(raw(["AAA", "BBB"])))
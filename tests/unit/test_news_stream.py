@@ -0,0 +1,151 @@
+import asyncio
+import pytest
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.async_market import AsyncMarketService
+from alpaca_trader.core.news_stream import NewsStream
+from alpaca_trader.core.stream import parse_time
+from alpaca_trader.core.transport import AlpacaTransport
+from alpaca_trader.sim.news import NewsReplayServer, load_recording
+
+# ----------------------------------------------------------------
+# 🧪 HELPERS
+# ----------------------------------------------------------------
+
+def article(i, symbol="AAA"):
+    return {"id": i, "headline": f"{symbol} wins contract #{i}", "summary": "", "symbols": [symbol], "source": "test"}
+
+@pytest.fixture
+def run_news(run_stream):
+    """`run_news(test, server=None, **stream_kwargs)`: run `test(server, stream, received, task)`."""
+    def run(test, server=None, **stream_kwargs):
+        received = []
+
+        async def handler(item):
+            received.append(item)
+
+        def make_stream(server, stack):
+            transport = AlpacaTransport(rate_per_min=60_000, burst=100, max_retries=0, backoff=0.001)
+            market = AsyncMarketService(transport, data_url=server.base_url)
+            stack.push_async_callback(market.close)
+            return NewsStream(handler, market=market, url=server.ws_url, **stream_kwargs)
+
+        return run_stream(server or NewsReplayServer(), make_stream,
+                          lambda server, stream, task: test(server, stream, received, task))
+
+    return run
+
+# ----------------------------------------------------------------
+# 📡 STREAMING
+# ----------------------------------------------------------------
+
+def test_published_articles_are_pushed(run_news, wait_until):
+    async def test(server, stream, received, task):
+        await server.wait_for_clients()
+        # Published after the connect's gap fill, so every article arrives over the socket
+        await wait_until(lambda: server.rest_requests == 1)
+        for i in range(3):
+            await server.publish(article(i))
+        await wait_until(lambda: len(received) == 3)
+        return received, stream
+
+    received, stream = run_news(test)
+    assert [item["id"] for item in received] == [0, 1, 2]
+    assert "T" in received[0] # Raw stream message, handed over as-is
+    assert stream.latency()["articles"] == 3
+    assert stream.latency()["max_ms"] < 1000
+
+def test_symbol_subscription_filters_articles(run_news, wait_until):
+    async def test(server, stream, received, task):
+        await server.wait_for_clients()
+        await server.publish(article(1, "BBB"))
+        await server.publish(article(2, "AAA"))
+        await wait_until(lambda: len(received) == 1)
+        return received
+
+    received = run_news(test, symbols=["AAA"])
+    assert [item["id"] for item in received] == [2]
+
+def test_sync_handlers_run_off_the_loop(run_stream, wait_until):
+    calls = []
+
+    async def test(server, stream, task):
+        await server.publish(article(1))
+        await wait_until(lambda: calls)
+
+    run_stream(NewsReplayServer(), lambda server, stack: NewsStream(calls.append, url=server.ws_url), test,
+               connected=True)
+    assert calls[0]["id"] == 1
+
+# ----------------------------------------------------------------
+# 🔌 RECONNECT & GAP FILL
+# ----------------------------------------------------------------
+
+def test_first_connect_fills_lookback_from_rest(run_news, wait_until):
+    server = NewsReplayServer()
+
+    async def test(server, stream, received, task):
+        await wait_until(lambda: len(received) == 2)
+        await server.publish(article(2))
+        await wait_until(lambda: len(received) == 3)
+        return received, stream
+
+    async def seed():
+        await server.publish(article(0))
+        await server.publish(article(1))
+
+    asyncio.run(seed())
+    received, stream = run_news(test, server=server)
+    assert [item["id"] for item in received] == [0, 1, 2] # Oldest first
+    assert stream.stats["gap_filled"] == 2
+
+def test_gap_larger_than_the_limit_is_filled_in_full(monkeypatch, run_news, wait_until):
+    monkeypatch.setattr(settings, "news_stream_gap_limit", 100)
+    server = NewsReplayServer()
+
+    async def test(server, stream, received, task):
+        await wait_until(lambda: len(received) == 150)
+        return received, stream
+
+    async def seed():
+        for i in range(150):
+            await server.publish(article(i))
+
+    asyncio.run(seed())
+    received, stream = run_news(test, server=server)
+    assert [item["id"] for item in received] == list(range(150))
+    assert stream.stats["gap_filled"] == 150
+
+def test_disconnect_reconnects_and_fills_the_gap(run_news, wait_until):
+    async def test(server, stream, received, task):
+        await server.wait_for_clients()
+        await server.publish(article(0))
+        await wait_until(lambda: len(received) == 1)
+
+        await server.disconnect()
+        # Published while the bot is offline: only REST has them
+        await server.publish(article(1))
+        await server.publish(article(2))
+
+        await wait_until(lambda: stream.stats["connects"] == 2)
+        await server.wait_for_clients()
+        await server.publish(article(3))
+        await wait_until(lambda: len(received) == 4)
+        return received, stream
+
+    received, stream = run_news(test)
+    assert [item["id"] for item in received] == [0, 1, 2, 3] # Each exactly once, in order
+    assert stream.stats["gap_filled"] == 2
+    assert stream.watermark == parse_time(received[-1]["created_at"])
+
+def test_auth_failure_is_fatal(run_news):
+    async def test(server, stream, received, task):
+        with pytest.raises(ValueError, match="auth failed"):
+            await asyncio.wait_for(task, 5)
+        return stream.stats["connects"]
+
+    assert run_news(test, server=NewsReplayServer(key="right"), lookback_minutes=0) == 0
+
+def test_recordings_load_one_article_per_line(tmp_path):
+    path = tmp_path / "news.jsonl"
+    path.write_text('{"id": 1, "headline": "a"}\n\n{"id": 2, "headline": "b"}\n')
+    assert [a["id"] for a in load_recording(str(path))] == [1, 2]
@@ -0,0 +1,92 @@
+import threading
+import time
+from unittest.mock import MagicMock
+import pytest
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.order_router import ENTRY, EXIT, OrderRouter
+
+# ----------------------------------------------------------------
+# 🧪 FIXTURES
+# ----------------------------------------------------------------
+
+@pytest.fixture
+def router():
+    client = MagicMock()
+    client.get_order_by_client_id.side_effect = Exception("order not found")
+    router = OrderRouter(client, workers=4)
+    yield router
+    router.close()
+
+def placed(client_order_id, broker_id=None):
+    order = MagicMock()
+    order.client_order_id = broker_id or client_order_id
+    return order
+
+# ----------------------------------------------------------------
+# 🚦 ROUTING
+# ----------------------------------------------------------------
+
+def test_orders_for_different_symbols_go_out_concurrently(router):
+    def slow(client_order_id):
+        time.sleep(0.2)
+        return placed(client_order_id)
+
+    started = time.monotonic()
+    futures = [router.submit(symbol, EXIT, slow) for symbol in ("AAA", "BBB", "CCC", "DDD")]
+    router.wait()
+
+    assert all(f.result() is not None for f in futures)
+    assert time.monotonic() - started < 0.5
+    assert router.stats["submitted"] == 4
+
+def test_same_symbol_and_intent_is_suppressed_until_terminal_event(router):
+    ids = []
+    send = lambda cid: ids.append(cid) or placed(cid)
+
+    assert router.submit("AAA", ENTRY, send) is not None
+    assert router.submit("AAA", ENTRY, send) is None
+    assert router.submit("AAA", EXIT, send) is not None # Different intent
+    router.wait()
+
+    assert router.complete(ids[0], "partial_fill") is None
+    assert router.in_flight("AAA", ENTRY) is not None
+    assert router.complete(ids[0], "fill").intent == ENTRY
+    assert router.submit("AAA", ENTRY, send) is not None
+    assert router.stats["suppressed"] == 1
+
+def test_slot_expires_without_events(router, monkeypatch):
+    monkeypatch.setattr(settings, "order_inflight_timeout", 0.05)
+    router.submit("AAA", ENTRY, placed)
+    router.wait()
+    time.sleep(0.06)
+    assert router.in_flight("AAA") is None
+
+def test_slot_outlives_timeout_while_order_is_open_at_broker(router, monkeypatch):
+    monkeypatch.setattr(settings, "order_inflight_timeout", 0.05)
+    open_order = MagicMock(status="new")
+    router.client.get_order_by_client_id.side_effect = None
+    router.client.get_order_by_client_id.return_value = open_order
+    router.submit("AAA", ENTRY, placed)
+    router.wait()
+    time.sleep(0.06)
+
+    assert router.in_flight("AAA") is not None
+    assert router.submit("AAA", ENTRY, placed) is None
+
+    open_order.status = "canceled"
+    time.sleep(0.06)
+    assert router.in_flight("AAA") is None
+
+def test_broker_assigned_id_is_tracked_even_if_the_fill_came_first(router):
+    gate = threading.Event()
+
+    def close_position(client_order_id):
+        gate.wait(1) # The fill event arrives before the REST response
+        return placed(client_order_id, broker_id="broker-1")
+
+    router.submit("AAA", EXIT, close_position)
+    assert router.complete("broker-1", "fill") is None
+    gate.set()
+    router.wait()
+
+    assert router.in_flight("AAA") is None
@@ -0,0 +1,91 @@
+import asyncio
+import time
+from datetime import datetime
+from unittest.mock import MagicMock
+import pytest
+from alpaca_trader.core.position_manager import PositionManager, TradeState
+from alpaca_trader.core.price_stream import PriceStream
+from alpaca_trader.sim.market import PriceFeedServer
+
+# ----------------------------------------------------------------
+# 🧪 HELPERS
+# ----------------------------------------------------------------
+
+@pytest.fixture
+def pm():
+    trading_client = MagicMock()
+    trading_client.get_all_positions.return_value = []
+    manager = PositionManager(trading_client, MagicMock())
+    manager.trades["AAA"] = TradeState(symbol="AAA", entry_price=10.0, entry_time=datetime.now(),
+                                       qty=100, max_price=10.0)
+    return manager
+
+@pytest.fixture
+def run_prices(pm, run_stream):
+    """Run `test(server, stream, task)` against a stream for `pm`'s held symbols, once subscribed."""
+    def make_stream(server, stack):
+        stream = PriceStream(pm.on_price, symbols=pm.held(), url=server.ws_url)
+        pm.on_held_change = stream.update
+        return stream
+
+    return lambda test: run_stream(PriceFeedServer(), make_stream, test, connected=True)
+
+# ----------------------------------------------------------------
+# ⚡ TICK EXITS
+# ----------------------------------------------------------------
+
+def test_hard_stop_fires_on_the_tick(pm, run_prices, wait_until):
+    async def test(server, stream, task):
+        await server.trade("AAA", 9.6) # -4%: holds
+        started = time.monotonic()
+        await server.trade("AAA", 9.4) # -6%
+        await wait_until(lambda: pm.client.close_position.called)
+        return time.monotonic() - started
+
+    reaction = run_prices(test)
+
+    pm.client.close_position.assert_called_once_with("AAA")
+    assert reaction < 0.1
+    assert "AAA" not in pm.trades
+
+def test_quotes_raise_the_high_and_trigger_the_runner_stop(pm, run_prices, wait_until):
+    pm.trades["AAA"].tier1_sold = True
+
+    async def test(server, stream, task):
+        await server.quote("AAA", 11.9, 12.1) # mid 12.0
+        await wait_until(lambda: pm.trades["AAA"].max_price == 12.0)
+        await server.trade("AAA", 11.7) # -2.5% from the high: holds
+        await server.trade("AAA", 11.6) # -3.3%
+        await wait_until(lambda: pm.client.close_position.called)
+        return stream.stats
+
+    stats = run_prices(test)
+
+    assert stats["quotes"] == 1 and stats["trades"] == 2
+    pm.client.close_position.assert_called_once_with("AAA")
+
+# ----------------------------------------------------------------
+# 🔌 SUBSCRIPTIONS
+# ----------------------------------------------------------------
+
+def test_subscription_follows_held_positions(pm, run_prices, wait_until):
+    fill = {"event": "fill", "price": "5.0", "qty": "10", "position_qty": "10",
+            "order": {"id": "o-1", "symbol": "BBB", "side": "buy"}}
+    close = dict(fill, position_qty="0", order={"id": "s-1", "symbol": "AAA", "side": "sell"})
+
+    async def test(server, stream, task):
+        await asyncio.to_thread(pm.handle_trade_update, fill)
+        await wait_until(lambda: server.subscribed() == {"AAA", "BBB"})
+        await asyncio.to_thread(pm.handle_trade_update, close)
+        await wait_until(lambda: server.subscribed("quotes") == {"BBB"})
+
+    run_prices(test)
+
+def test_reconnect_resubscribes(pm, run_prices, wait_until):
+    async def test(server, stream, task):
+        await server.disconnect()
+        await wait_until(lambda: stream.stats["connects"] == 2 and server.subscribed() == {"AAA"})
+        await server.trade("AAA", 9.0)
+        await wait_until(lambda: pm.client.close_position.called)
+
+    run_prices(test)
@@ -0,0 +1,98 @@
+import pytest
+import numpy as np
+import pandas as pd
+from alpaca.data.timeframe import TimeFrame, TimeFrameUnit
+from alpaca_trader.core.resample import Resampler, resample, timeframe_seconds
+
+# ----------------------------------------------------------------
+# 🧪 FIXTURES
+# ----------------------------------------------------------------
+
+@pytest.fixture
+def minutes():
+    """Two sessions of random minute bars with gaps (overnight, missing prints)."""
+    rng = np.random.default_rng(7)
+    index = pd.date_range("2025-12-11 14:30", periods=390, freq="min").append(
+        pd.date_range("2025-12-12 14:30", periods=390, freq="min"))
+    index = index.delete(rng.choice(len(index), 40, replace=False))
+    n = len(index)
+    close = 10 + np.cumsum(rng.normal(0, 0.05, n))
+    spread = rng.uniform(0.01, 0.1, n)
+    return pd.DataFrame({
+        "open": close + rng.normal(0, 0.02, n),
+        "high": close + spread,
+        "low": close - spread,
+        "close": close,
+        "volume": rng.integers(1_000, 50_000, n).astype(float),
+    }, index=index)
+
+def as_bars(df):
+    bars = {field: df[field].to_numpy() for field in df.columns}
+    bars["timestamp"] = (df.index - pd.Timestamp("1970-01-01")).total_seconds().to_numpy()
+    return bars
+
+def pandas_resample(df, rule, offset=None):
+    out = df.resample(rule, offset=offset).agg(
+        {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"})
+    return out.dropna()
+
+# ----------------------------------------------------------------
+# 🕯️ VECTORIZED AGGREGATION
+# ----------------------------------------------------------------
+
+def test_timeframe_seconds():
+    assert timeframe_seconds(TimeFrame(5, TimeFrameUnit.Minute)) == 300
+    assert timeframe_seconds(TimeFrame.Hour) == 3600
+    assert timeframe_seconds(TimeFrame.Day) == 86400
+    assert timeframe_seconds(TimeFrame.Week) is None
+
+@pytest.mark.parametrize("seconds,rule", [(300, "5min"), (900, "15min"), (3600, "1h")])
+def test_resample_matches_pandas(minutes, seconds, rule):
+    ours = resample(as_bars(minutes), seconds)
+    expected = pandas_resample(minutes, rule)
+
+    np.testing.assert_allclose(ours["timestamp"], as_bars(expected)["timestamp"])
+    for field in ("open", "high", "low", "close", "volume"):
+        np.testing.assert_allclose(ours[field], expected[field].to_numpy())
+
+def test_daily_buckets_hold_one_session(minutes):
+    daily = resample(as_bars(minutes), 86400)
+    expected = pandas_resample(minutes, "1D", offset="5h")
+
+    assert len(daily["close"]) == 2
+    np.testing.assert_allclose(daily["volume"], expected["volume"].to_numpy())
+    np.testing.assert_allclose(daily["close"], expected["close"].to_numpy())
+
+# ----------------------------------------------------------------
+# 🔁 INCREMENTAL OPEN BUCKET
+# ----------------------------------------------------------------
+
+def test_incremental_updates_match_batch(minutes):
+    bars = as_bars(minutes)
+    frame = Resampler(900)
+    # Feed in uneven slices that split buckets, with overlapping (stale) bars
+    cuts = [0, 7, 8, 100, 351, 352, 500, len(minutes)]
+    for lo, hi in zip(cuts, cuts[1:]):
+        frame.update({k: v[max(0, lo - 3):hi] for k, v in bars.items()})
+
+    expected = resample(bars, 900)
+    for field, values in expected.items():
+        np.testing.assert_allclose(frame.window()[field], values)
+
+def test_open_bucket_updates_in_place():
+    frame = Resampler(300)
+    ts = np.array([0.0, 60.0])
+    frame.update({"timestamp": ts, "open": np.array([1.0, 2.0]), "high": np.array([2.0, 3.0]),
+                  "low": np.array([0.5, 1.5]), "close": np.array([1.5, 2.5]), "volume": np.array([10.0, 20.0])})
+    frame.update({"timestamp": np.array([120.0]), "open": np.array([2.5]), "high": np.array([4.0]),
+                  "low": np.array([0.1]), "close": np.array([3.5]), "volume": np.array([5.0])})
+
+    bar = frame.window(1)
+    assert len(frame) == 1
+    assert (bar["open"][0], bar["high"][0], bar["low"][0], bar["close"][0], bar["volume"][0]) == (1.0, 4.0, 0.1, 3.5, 35.0)
+
+def test_capacity_keeps_latest_buckets(minutes):
+    frame = Resampler(300, capacity=10)
+    frame.update(as_bars(minutes))
+    expected = resample(as_bars(minutes), 300)
+    np.testing.assert_allclose(frame.window()["close"], expected["close"][-10:])
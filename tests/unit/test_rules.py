@@ -0,0 +1,92 @@
+import pytest
+from unittest.mock import MagicMock
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.rules import compile_rule
+from alpaca_trader.core.screener import MarketScreener
+from alpaca_trader.core.snapshot_frame import SnapshotFrame
+
+# ----------------------------------------------------------------
+# 🧪 FIXTURES
+# ----------------------------------------------------------------
+
+def create_raw_snapshot(price, volume, prev_close=None):
+    raw = {"latestTrade": {"p": price}, "dailyBar": {"o": price, "h": price, "l": price, "c": price, "v": volume}}
+    if prev_close is not None:
+        raw["prevDailyBar"] = {"c": prev_close, "v": volume}
+    return raw
+
+@pytest.fixture
+def frame():
+    return SnapshotFrame.from_raw({
+        "CHEAP": create_raw_snapshot(1.0, 1_000_000),
+        "MID": create_raw_snapshot(10.0, 500_000, prev_close=8.0),
+        "THIN": create_raw_snapshot(10.0, 50_000, prev_close=10.0),
+        "BIG": create_raw_snapshot(50.0, 2_000_000),
+    })
+
+def selected(frame, spec):
+    return list(frame.symbols[compile_rule(spec)(frame)])
+
+# ----------------------------------------------------------------
+# 📐 RULE LANGUAGE
+# ----------------------------------------------------------------
+
+def test_range_and_threshold(frame):
+    assert selected(frame, {"field": "price", "between": [2, 20]}) == ["MID", "THIN"]
+    assert selected(frame, {"field": "volume", "gt": 100_000, "lte": 1_000_000}) == ["CHEAP", "MID"]
+
+def test_boolean_combinators(frame):
+    spec = {"any": [
+        {"all": [{"field": "price", "between": [2, 20]}, {"field": "volume", "gt": 100_000}]},
+        {"field": "price", "gte": 50},
+    ]}
+    assert selected(frame, spec) == ["MID", "BIG"]
+    assert selected(frame, {"not": {"field": "price", "lt": 20}}) == ["BIG"]
+
+def test_derived_fields(frame):
+    """Derived columns are vectorized and missing inputs never pass."""
+    assert selected(frame, {"field": "dollar_volume", "gt": 10_000_000}) == ["BIG"]
+    assert selected(frame, {"field": "change_pct", "gt": 0.2}) == ["MID"]
+    assert "dollar_volume" in frame.columns
+
+@pytest.mark.parametrize("spec", [
+    {"field": "pe_ratio", "gt": 1},
+    {"field": "price"},
+    {"all": []},
+    {"price": 5},
+    {"all": [{"field": "price", "gt": 2}], "any": [{"field": "price", "lt": 20}]},
+    {"field": "price", "gt": 2, "le": 20},
+    {"not": {"field": "price", "gt": 2}, "field": "volume"},
+    {"any": {"field": "price", "gt": 2}},
+    {"field": "price", "between": 5},
+])
+def test_invalid_rules_fail_at_compile_time(spec):
+    with pytest.raises(ValueError):
+        compile_rule(spec)
+
+# ----------------------------------------------------------------
+# 🔍 SCREEN PROFILES
+# ----------------------------------------------------------------
+
+def test_profiles_share_one_snapshot_download(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "data_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "screen_profiles", {
+        "default": {"all": [{"field": "price", "between": [2, 20]}, {"field": "volume", "gt": 100_000}]},
+        "liquid": {"field": "dollar_volume", "gt": 10_000_000},
+    })
+    market = MagicMock()
+    screener = MarketScreener(market)
+    screener.tradable_symbols = ["MID", "BIG"]
+    market.get_snapshots_raw.return_value = {
+        "MID": create_raw_snapshot(10.0, 500_000),
+        "BIG": create_raw_snapshot(50.0, 2_000_000),
+    }
+
+    results = screener.run_profiles()
+
+    assert market.get_snapshots_raw.call_count == 1
+    assert [a.symbol for a in results["default"]] == ["MID"]
+    assert [a.symbol for a in results["liquid"]] == ["BIG"]
+
+    with pytest.raises(ValueError):
+        screener.run_profiles(["missing"])
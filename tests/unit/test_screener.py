@@ -0,0 +1,154 @@
+import pytest
+import numpy as np
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.screener import MarketScreener
+from alpaca_trader.core.snapshot_frame import SnapshotFrame
+
+# ----------------------------------------------------------------
+# 🧪 FIXTURES
+# ----------------------------------------------------------------
+
+def create_mock_asset(symbol, tradable=True, marginable=True):
+    asset = MagicMock()
+    asset.symbol = symbol
+    asset.tradable = tradable
+    asset.marginable = marginable
+    return asset
+
+def create_raw_snapshot(price, volume):
+    """Snapshot as returned by the API with raw_data=True."""
+    raw = {}
+    if price is not None:
+        raw["latestTrade"] = {"p": price, "s": 100}
+    if volume is not None:
+        raw["dailyBar"] = {"o": price, "h": price, "l": price, "c": price, "v": volume, "vw": price}
+    return raw
+
+def create_mock_snapshot(price, volume):
+    # Plain namespaces: absent fields must read as missing, not as auto-created mocks
+    return SimpleNamespace(
+        latest_trade=SimpleNamespace(price=price) if price is not None else None,
+        daily_bar=SimpleNamespace(volume=volume, open=price, high=price, low=price, vwap=price) if volume is not None else None,
+        previous_daily_bar=None
+    )
+
+@pytest.fixture
+def market():
+    return MagicMock()
+
+@pytest.fixture
+def screener(market, monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "data_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "screen_chunk_size", 2)
+    monkeypatch.setattr(settings, "screen_max_workers", 4)
+    monkeypatch.setattr(settings, "screen_retry_backoff", 0.0)
+    return MarketScreener(market)
+
+# ----------------------------------------------------------------
+# ⚡ SNAPSHOT FETCHING
+# ----------------------------------------------------------------
+
+def test_fetch_snapshots_merges_in_chunk_order(screener, market):
+    """Chunks may finish in any order, but results keep the universe order."""
+    symbols = [f"S{i}" for i in range(7)]
+    market.get_snapshots_raw.side_effect = lambda chunk: {s: create_raw_snapshot(5.0, 200_000) for s in chunk}
+
+    snapshots = screener._fetch_snapshots(symbols)
+
+    assert list(snapshots) == symbols
+    assert market.get_snapshots_raw.call_count == 4
+
+def test_failed_chunk_is_retried(screener, market):
+    """A transient chunk error is retried without dropping the chunk."""
+    calls = {"S0": 0}
+
+    def flaky(chunk):
+        if "S0" in chunk:
+            calls["S0"] += 1
+            if calls["S0"] == 1:
+                raise Exception("429 Too Many Requests")
+        return {s: create_raw_snapshot(5.0, 200_000) for s in chunk}
+
+    market.get_snapshots_raw.side_effect = flaky
+
+    snapshots = screener._fetch_snapshots(["S0", "S1", "S2", "S3"])
+
+    assert list(snapshots) == ["S0", "S1", "S2", "S3"]
+    assert calls["S0"] == 2
+
+def test_dead_chunk_does_not_block_others(screener, market, monkeypatch):
+    """A chunk failing every retry is skipped, the rest of the screen survives."""
+    monkeypatch.setattr(settings, "screen_chunk_retries", 1)
+
+    def broken(chunk):
+        if "S0" in chunk:
+            raise Exception("API Error")
+        return {s: create_raw_snapshot(5.0, 200_000) for s in chunk}
+
+    market.get_snapshots_raw.side_effect = broken
+
+    snapshots = screener._fetch_snapshots(["S0", "S1", "S2", "S3"])
+
+    assert list(snapshots) == ["S2", "S3"]
+
+def test_run_screen_price_volume_filter(screener, market):
+    """Only $2-$20 names with volume above the floor survive."""
+    market.get_all_assets.return_value = [
+        create_mock_asset("GOOD"),
+        create_mock_asset("PRICEY"),
+        create_mock_asset("THIN"),
+        create_mock_asset("NOMARGIN", marginable=False),
+    ]
+    data = {
+        "GOOD": create_raw_snapshot(10.0, 500_000),
+        "PRICEY": create_raw_snapshot(150.0, 500_000),
+        "THIN": create_raw_snapshot(10.0, 5_000),
+        "NOMARGIN": create_raw_snapshot(10.0, 500_000),
+    }
+    market.get_snapshots_raw.side_effect = lambda chunk: {s: data[s] for s in chunk}
+
+    assets = screener.run_screen()
+
+    assert [a.symbol for a in assets] == ["GOOD"]
+    assert assets[0].volume == 500_000
+
+# ----------------------------------------------------------------
+# 📊 COLUMNAR FRAME
+# ----------------------------------------------------------------
+
+def test_snapshot_frame_marks_missing_data_as_nan():
+    """Symbols without a trade or a daily bar become NaN rows and never pass a filter."""
+    frame = SnapshotFrame.from_snapshots({
+        "OK": create_mock_snapshot(5.0, 200_000),
+        "NOTRADE": create_mock_snapshot(None, 200_000),
+        "NOBAR": create_mock_snapshot(5.0, None),
+    })
+
+    assert list(frame.symbols) == ["OK", "NOTRADE", "NOBAR"]
+    assert np.isnan(frame["price"][1])
+    assert np.isnan(frame["volume"][2])
+    assert np.isnan(frame["prev_close"]).all()
+
+    mask = (frame["price"] >= 2.0) & (frame["volume"] > 100_000)
+    assets = frame.to_assets(mask)
+    assert [a.symbol for a in assets] == ["OK"]
+    assert str(assets[0].price) == "5.0"
+
+def test_price_only_screen_keeps_symbols_without_a_daily_bar():
+    """A mask that ignores volume still builds assets for rows whose volume is NaN."""
+    frame = SnapshotFrame.from_raw({"OK": create_raw_snapshot(5.0, 200_000), "NOBAR": create_raw_snapshot(5.0, None)})
+
+    assets = frame.to_assets(frame["price"] >= 2.0)
+
+    assert [a.symbol for a in assets] == ["OK", "NOBAR"]
+    assert assets[1].volume == 0
+
+def test_snapshot_frame_raw_and_model_inputs_agree():
+    """Raw JSON payloads and parsed models produce the same columns."""
+    raw = SnapshotFrame.from_raw({"A": create_raw_snapshot(5.0, 200_000), "B": create_raw_snapshot(None, 10)})
+    models = SnapshotFrame.from_snapshots({"A": create_mock_snapshot(5.0, 200_000), "B": create_mock_snapshot(None, 10)})
+
+    for name in ("price", "volume", "vwap", "prev_close"):
+        np.testing.assert_array_equal(raw[name], models[name])
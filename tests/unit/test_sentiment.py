@@ -0,0 +1,71 @@
+import pytest
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.news import NewsEngine
+from alpaca_trader.core.sentiment import (
+    LexiconSentiment, SentimentBackend, TextBlobSentiment, get_backend, tokenize
+)
+
+# ----------------------------------------------------------------
+# 🧪 FIXTURES
+# ----------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def lexicon():
+    return LexiconSentiment()
+
+@pytest.fixture(scope="module")
+def reference():
+    return TextBlobSentiment()
+
+TEXTS = [
+    "amazing earnings beat expectations profits up 100%",
+    "disastrous crash, bankruptcy filed everything is lost",
+    "Not a good quarter.",
+    "Very good results!",
+    "Really not good",
+    "It isn't a bad result, but it's hardly a great one...",
+    "U.S. regulators approve new drug (!)",
+    "Weak outlook overshadows an otherwise solid report",
+    "",
+]
+
+# ----------------------------------------------------------------
+# ⚖️ PARITY WITH TEXTBLOB
+# ----------------------------------------------------------------
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_lexicon_matches_textblob(lexicon, reference, text):
+    assert lexicon.score(text) == reference.score(text)
+
+def test_tokenize_splits_punctuation_and_keeps_abbreviations():
+    assert tokenize("Great (!) U.S. deal... isn't") == ["great", "(!)", "u.s.", "deal", "...", "is", "n", "'", "t"]
+
+# ----------------------------------------------------------------
+# ⚡ MEMOIZATION / BATCH
+# ----------------------------------------------------------------
+
+def test_identical_text_is_scored_once():
+    backend = LexiconSentiment()
+    backend.score("record revenue")
+    backend.score("record revenue")
+    info = backend.score.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+def test_score_batch_keeps_order_and_duplicates(lexicon):
+    texts = ["great news", "terrible news", "great news"]
+    assert lexicon.score_batch(texts) == [lexicon.score(t) for t in texts]
+
+def test_backend_selected_by_setting(monkeypatch):
+    monkeypatch.setattr(settings, "sentiment_backend", "textblob")
+    assert isinstance(NewsEngine().sentiment, TextBlobSentiment)
+    assert isinstance(get_backend("lexicon"), LexiconSentiment)
+    with pytest.raises(ValueError) as unknown:
+        get_backend("vader")
+    assert isinstance(unknown.value.__cause__, KeyError)
+
+def test_backends_must_implement_score():
+    class Incomplete(SentimentBackend):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,116 @@
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+import pytest
+from alpaca_trader.config.settings import settings
+from alpaca_trader.core.position_manager import PositionManager
+from alpaca_trader.core.trade_stream import TradeUpdatesStream, default_url
+from alpaca_trader.sim.trading import TradeUpdatesServer
+
+# ----------------------------------------------------------------
+# 🧪 HELPERS
+# ----------------------------------------------------------------
+
+FILLED_AT = datetime(2025, 12, 12, 14, 30, 5, 250000, tzinfo=timezone.utc)
+
+@pytest.fixture
+def pm():
+    trading_client = MagicMock()
+    trading_client.get_all_positions.return_value = []
+    trading_client.get_order_by_client_id.side_effect = Exception("order not found")
+    return PositionManager(trading_client, MagicMock())
+
+def order(symbol="AAA", side="buy", order_id="o-1", client_order_id=None):
+    return {"id": order_id, "client_order_id": client_order_id, "symbol": symbol, "side": side}
+
+def submit_entry(pm, symbol="AAA") -> str:
+    pm.open_position(symbol).result()
+    return pm.orders.in_flight(symbol).client_order_id
+
+def feeding(pm):
+    """Stream factory: trade updates into `pm`, reconciling on every connect."""
+    return lambda server, stack: TradeUpdatesStream(pm.handle_trade_update, on_connect=pm.reconcile,
+                                                    url=server.ws_url)
+
+# ----------------------------------------------------------------
+# 📡 FILL TRACKING
+# ----------------------------------------------------------------
+
+def test_fill_opens_trade_at_execution_price_and_time(pm, run_stream, wait_until):
+    entry = submit_entry(pm)
+
+    async def test(server, stream, task):
+        await server.wait_for_clients()
+        await server.emit("fill", order(client_order_id=entry), price=10.25, qty=100, position_qty=100, timestamp=FILLED_AT)
+        await wait_until(lambda: "AAA" in pm.trades)
+
+    run_stream(TradeUpdatesServer(), feeding(pm), test)
+
+    state = pm.trades["AAA"]
+    assert state.entry_price == 10.25
+    assert state.qty == 100
+    assert state.entry_time == FILLED_AT.astimezone().replace(tzinfo=None)
+    assert pm.orders.in_flight("AAA") is None
+
+def test_partial_fills_average_the_entry(pm, run_stream, wait_until):
+    entry = submit_entry(pm)
+
+    async def test(server, stream, task):
+        await server.wait_for_clients()
+        await server.emit("partial_fill", order(client_order_id=entry), price=10.0, qty=60, position_qty=60,
+                          timestamp=FILLED_AT)
+        assert pm.orders.in_flight("AAA") is not None
+        await server.emit("fill", order(client_order_id=entry), price=11.0, qty=40, position_qty=100)
+        await wait_until(lambda: stream.stats["updates"] == 2 and pm.trades["AAA"].qty == 100)
+
+    run_stream(TradeUpdatesServer(), feeding(pm), test)
+
+    state = pm.trades["AAA"]
+    assert state.entry_price == pytest.approx(10.4)
+    assert state.max_price == 11.0
+    # The clock starts at the first fill
+    assert state.entry_time == FILLED_AT.astimezone().replace(tzinfo=None)
+    assert pm.orders.in_flight("AAA") is None
+
+def test_sell_fill_closes_trade_and_cancel_clears_pending(pm, run_stream, wait_until):
+    entry = submit_entry(pm, "BBB")
+
+    async def test(server, stream, task):
+        await server.wait_for_clients()
+        await server.emit("fill", order(), price=10.0, qty=100, position_qty=100)
+        await server.emit("fill", order(side="sell", order_id="s-1"), price=10.5, qty=100, position_qty=0)
+        await server.emit("canceled", order("BBB", order_id="o-2", client_order_id=entry))
+        await wait_until(lambda: stream.stats["updates"] == 3)
+        await wait_until(lambda: pm.can_enter("BBB"))
+
+    run_stream(TradeUpdatesServer(), feeding(pm), test)
+
+    assert pm.trades == {}
+
+# ----------------------------------------------------------------
+# 🔌 CONNECTION
+# ----------------------------------------------------------------
+
+def test_reconnect_reconciles_positions(pm, run_stream, wait_until):
+    async def test(server, stream, task):
+        await server.wait_for_clients()
+        await server.disconnect()
+        await wait_until(lambda: stream.stats["connects"] == 2)
+        await wait_until(lambda: pm.client.get_all_positions.call_count == 2)
+
+    run_stream(TradeUpdatesServer(), feeding(pm), test)
+
+def test_rejected_keys_raise(pm, monkeypatch, run_stream):
+    monkeypatch.setattr(settings, "alpaca_api_key", "wrong")
+
+    async def test(server, stream, task):
+        with pytest.raises(ValueError):
+            await asyncio.wait_for(task, 5)
+        return stream.stats["connects"]
+
+    assert run_stream(TradeUpdatesServer(key="right", secret="s"), feeding(pm), test) == 0
+
+def test_default_url_follows_trading_endpoint(monkeypatch):
+    monkeypatch.setattr(settings, "trade_stream_url", None)
+    monkeypatch.setattr(settings, "alpaca_base_url", "https://paper-api.alpaca.markets")
+    assert default_url() == "wss://paper-api.alpaca.markets/stream"
@@ -0,0 +1,132 @@
+import threading
+import time
+import pytest
+import requests
+from unittest.mock import MagicMock
+from alpaca.common.exceptions import APIError
+from urllib3.exceptions import NewConnectionError
+from alpaca_trader.core.transport import AlpacaTransport, Priority, TokenBucket, request_priority
+
+# ----------------------------------------------------------------
+# 🧪 FIXTURES
+# ----------------------------------------------------------------
+
+def api_error(status):
+    response = MagicMock()
+    response.status_code = status
+    http_error = requests.HTTPError(response=response)
+    return APIError('{"code": 1, "message": "error"}', http_error)
+
+@pytest.fixture
+def transport():
+    return AlpacaTransport(rate_per_min=6000, burst=10, max_retries=3, backoff=0.001)
+
+# ----------------------------------------------------------------
+# 🪣 TOKEN BUCKET
+# ----------------------------------------------------------------
+
+def test_bucket_allows_burst_then_throttles():
+    bucket = TokenBucket(rate_per_min=600, burst=3) # 10 tokens/sec
+
+    waits = [bucket.acquire() for _ in range(4)]
+
+    assert max(waits[:3]) < 0.01
+    assert waits[3] == pytest.approx(0.1, abs=0.05)
+
+def test_bucket_serves_higher_priority_first():
+    """With the budget exhausted, queued orders jump ahead of queued screening."""
+    bucket = TokenBucket(rate_per_min=1200, burst=1) # 20 tokens/sec
+    bucket.acquire() # Drain
+    served = []
+
+    def worker(priority):
+        bucket.acquire(priority)
+        served.append(priority)
+
+    threads = [threading.Thread(target=worker, args=(Priority.SCREEN,)) for _ in range(3)]
+    for t in threads:
+        t.start()
+    time.sleep(0.01) # Screen requests are queued first
+    order = threading.Thread(target=worker, args=(Priority.ORDER,))
+    order.start()
+    for t in threads + [order]:
+        t.join()
+
+    assert served[0] == Priority.ORDER
+
+# ----------------------------------------------------------------
+# 🔁 RETRIES & METRICS
+# ----------------------------------------------------------------
+
+def test_retries_throttled_requests_with_backoff(transport):
+    send = MagicMock(side_effect=[api_error(429), api_error(503), {"ok": True}])
+
+    with request_priority(Priority.EXIT):
+        assert transport.execute(send) == {"ok": True}
+
+    metrics = transport.metrics.snapshot()
+    assert send.call_count == 3
+    assert metrics["throttled"] == 1
+    assert metrics["retries"] == 2
+    assert metrics["requests"]["EXIT"] == 3
+
+def test_client_errors_are_not_retried(transport):
+    send = MagicMock(side_effect=api_error(403))
+
+    with pytest.raises(APIError):
+        transport.execute(send)
+
+    assert send.call_count == 1
+    assert transport.metrics.snapshot()["failures"] == 1
+
+def test_gives_up_after_max_retries(transport):
+    send = MagicMock(side_effect=requests.ConnectionError("reset"))
+
+    with pytest.raises(requests.ConnectionError):
+        transport.execute(send)
+
+    assert send.call_count == 4
+
+def test_plain_posts_only_retry_before_sending(transport):
+    """A POST without a client_order_id may already have placed the order: no blind resend."""
+    reset = MagicMock(side_effect=[requests.ConnectionError("reset"), {"ok": True}])
+    with pytest.raises(requests.ConnectionError):
+        transport.execute(reset, idempotent=False)
+    assert reset.call_count == 1
+
+    server_error = MagicMock(side_effect=[api_error(503), {"ok": True}])
+    with pytest.raises(APIError):
+        transport.execute(server_error, idempotent=False)
+
+    refused = requests.ConnectionError(MagicMock(reason=NewConnectionError(None, "refused")))
+    unsent = MagicMock(side_effect=[api_error(429), refused, {"ok": True}])
+    assert transport.execute(unsent, idempotent=False) == {"ok": True}
+
+def test_posts_with_client_order_id_are_idempotent():
+    assert AlpacaTransport.idempotent("GET", None)
+    assert AlpacaTransport.idempotent("DELETE", None)
+    assert AlpacaTransport.idempotent("POST", {"symbol": "AAA", "client_order_id": "entry-AAA-1"})
+    assert not AlpacaTransport.idempotent("POST", {"symbol": "AAA"})
+
+def test_attached_post_without_client_order_id_is_not_resent(transport):
+    client = MagicMock()
+    client._one_request.side_effect = requests.ConnectionError("reset")
+    transport.attach(client)
+
+    with pytest.raises(requests.ConnectionError):
+        client._one_request("POST", "https://x/v2/orders", {"json": {"symbol": "AAA"}}, 3)
+    assert transport.metrics.snapshot()["retries"] == 0
+
+def test_attach_shares_session_and_routes_requests(transport):
+    """Attached clients reuse one session and go through the limiter."""
+    clients = [MagicMock(), MagicMock()]
+    originals = [c._one_request for c in clients]
+    for client in clients:
+        transport.attach(client)
+
+    clients[0]._one_request("GET", "https://x/v2/clock", {}, 3)
+
+    assert all(c._session is transport.session for c in clients)
+    assert all(c._retry == 0 for c in clients)
+    originals[0].assert_called_once_with("GET", "https://x/v2/clock", {}, 0)
+    assert transport.metrics.snapshot()["requests"]["NORMAL"] == 1
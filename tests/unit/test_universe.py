@@ -0,0 +1,104 @@
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock
+from alpaca_trader.core.screener import MarketScreener
+from alpaca_trader.core.universe import UniverseCache, UniverseDiff
+
+# ----------------------------------------------------------------
+# 🧪 FIXTURES
+# ----------------------------------------------------------------
+
+def create_mock_asset(symbol, tradable=True, marginable=True):
+    asset = MagicMock()
+    asset.symbol = symbol
+    asset.tradable = tradable
+    asset.marginable = marginable
+    asset.shortable = False
+    asset.easy_to_borrow = False
+    asset.fractionable = True
+    return asset
+
+@pytest.fixture
+def market():
+    market = MagicMock()
+    market.get_all_assets.return_value = [
+        create_mock_asset("AAA"),
+        create_mock_asset("BBB"),
+        create_mock_asset("NOMARGIN", marginable=False),
+    ]
+    return market
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "universe.json"
+
+# ----------------------------------------------------------------
+# 💾 CACHE
+# ----------------------------------------------------------------
+
+def test_cold_start_fetches_and_persists(market, cache_path):
+    """First call fetches the universe and writes the local file."""
+    cache = UniverseCache(market, path=cache_path)
+
+    assert cache.get_symbols() == ["AAA", "BBB"]
+    assert market.get_all_assets.call_count == 1
+    assert cache_path.exists()
+
+def test_cache_survives_restart(market, cache_path):
+    """A new process within the TTL rebuilds the list from disk, no API call."""
+    UniverseCache(market, path=cache_path).get_symbols()
+    market.get_all_assets.reset_mock()
+
+    restarted = UniverseCache(market, path=cache_path)
+    assert restarted.get_symbols() == ["AAA", "BBB"]
+    assert not market.get_all_assets.called
+
+def test_stale_cache_serves_old_list_and_refreshes_in_background(market, cache_path):
+    """Expired cache returns immediately and refreshes on a background thread."""
+    release = threading.Event()
+    assets = market.get_all_assets.return_value
+    market.get_all_assets.side_effect = lambda: release.wait(2) and assets
+
+    cache = UniverseCache(market, path=cache_path, ttl_hours=0)
+    cache.flags = {"OLD": 3}
+    cache.fetched_at = time.time() - 60
+
+    assert cache.get_symbols() == ["OLD"]
+    release.set()
+
+    deadline = time.time() + 2
+    while cache.screenable_symbols() != ["AAA", "BBB"] and time.time() < deadline:
+        time.sleep(0.01)
+    assert cache.screenable_symbols() == ["AAA", "BBB"]
+
+def test_diff_reports_delistings_and_status_changes():
+    """Only screenability changes are reported."""
+    old = {"AAA": 3, "BBB": 3, "CCC": 3}
+    new = {"AAA": 3, "BBB": 1, "CCC": 7, "DDD": 3}
+
+    diff = UniverseCache.diff(old, new)
+
+    assert diff.added == ["DDD"]
+    assert diff.removed == ["BBB"]
+    assert diff.changed == ["CCC"]
+
+# ----------------------------------------------------------------
+# 🔄 SCREENER INTEGRATION
+# ----------------------------------------------------------------
+
+def test_refresh_applies_diff_to_running_screener(market, cache_path):
+    """Listeners receive the diff, the screener patches its symbol list in place."""
+    cache = UniverseCache(market, path=cache_path)
+    screener = MarketScreener(market, universe=cache)
+    screener.tradable_symbols = cache.get_symbols()
+
+    market.get_all_assets.return_value = [
+        create_mock_asset("AAA"),
+        create_mock_asset("BBB", tradable=False), # Halted
+        create_mock_asset("NEW"),
+    ]
+    diff = cache.refresh()
+
+    assert diff == UniverseDiff(added=["NEW"], removed=["BBB"])
+    assert screener.tradable_symbols == ["AAA", "NEW"]